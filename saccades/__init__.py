@@ -2,8 +2,13 @@
 """A package for working with saccades.
 """
 
+from .batch import TrialBatch  # noqa: F401
+from .gazearray import GazeArray  # noqa: F401
+from .gazearray import SaccadeArray  # noqa: F401
 from .gazedata import GazeData  # noqa: F401
 from .gazedata import Saccade  # noqa: F401
+from .viewinggeometry import ViewingGeometry  # noqa: F401
+from .views import SaccadeView  # noqa: F401
 
 
 __version__ = '0.1'
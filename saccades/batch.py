@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+"""Batches of many trials of gaze data, processed together.
+"""
+
+import numpy
+import pandas
+
+from .conversions import _px_to_dva
+from .derived import DerivedColumn
+from .derived import DerivedColumns
+from .gazearray import GazeArray
+from .gazearray import SaccadeArray
+from .gazedata import ATTRIBUTES
+from .gazedata import INIT_COLUMNS
+from .gazedata import RAW_DATA_COLUMNS
+from .geometry import acceleration
+from .geometry import column_velocity
+from .viewinggeometry import SCREEN_ATTRIBUTES
+from .viewinggeometry import ViewingGeometry
+from .views import SaccadeView
+from .workspace import Workspace
+
+
+# %% Main class
+
+class TrialBatch(DerivedColumns):
+    """Batch of trials of gaze data.
+
+    The samples of all trials are stored one after another \
+    in a single contiguous array for each column, \
+    and trial *i* occupies rows `offsets[i]` to `offsets[i + 1]`. \
+    The attributes of each trial, such as viewing parameters and messages, \
+    are kept in :attr:`trials`, with one row for each trial.
+
+    Methods process all trials at once, \
+    in a single pass over each column, \
+    but respect the boundaries between trials. \
+    So for example the first velocity of each trial is `numpy.nan`, \
+    just as if the trial had been processed on its own.
+
+    Columns are indexed by name, \
+    and the length of a batch is its total number of samples, \
+    so detection functions such as :func:`.detection.criterion` \
+    can be applied to a batch as to a single table of gaze data.
+
+    As for :class:`.GazeArray`, \
+    *velocity* and *acceleration* are derived columns \
+    (see :class:`.DerivedColumns`). \
+    After changing viewing parameters in :attr:`trials`, \
+    call :meth:`invalidate` with the names of the parameters. \
+    They are calculated using the scratch buffers in :attr:`workspace`, \
+    which are kept for the next calculation.
+    """
+
+    def __init__(self, trials=()):
+        """Gather trials into a batch.
+
+        The batch includes the columns that all trials have in common.
+
+        :param trials: Trials of gaze data, \
+        for example from :meth:`.BaseReader.get_blocks`.
+        :type trials: sequence of :class:`.GazeData` or :class:`.GazeArray`
+        :raises ValueError: If any trial is missing \
+        one of the columns *time*, *x*, or *y*.
+        """
+
+        trials = list(trials)
+
+        columns = list(trials[0].columns) if trials else list(INIT_COLUMNS)
+        for trial in trials[1:]:
+            columns = [col for col in columns if col in trial]
+
+        if not all((col in columns) for col in INIT_COLUMNS):
+            msg = 'Columns {} are required in every trial.'
+            raise ValueError(msg.format(', '.join(INIT_COLUMNS)))
+
+        lengths = [len(trial) for trial in trials]
+
+        self.offsets = numpy.zeros(len(trials) + 1, dtype=numpy.int64)
+        numpy.cumsum(lengths, out=self.offsets[1:])
+
+        self._derived = set()
+        self._columns = {col: _concatenate([numpy.asarray(trial[col]) for trial in trials])
+                         for col in columns}
+
+        self.trials = pandas.DataFrame([{attr: getattr(trial, attr, None)
+                                         for attr in ATTRIBUTES}
+                                        for trial in trials],
+                                       columns=ATTRIBUTES)
+
+        self.workspace = Workspace()
+
+    def __len__(self):
+
+        return int(self.offsets[-1])
+
+    def __contains__(self, col):
+
+        return col in self._columns
+
+    def __getitem__(self, key):
+
+        if isinstance(key, list):
+            return numpy.column_stack([self._get_column(col) for col in key])
+
+        return self._get_column(key)
+
+    def __setitem__(self, key, value):
+
+        if isinstance(key, str):
+            self._set_column(key, numpy.array(numpy.broadcast_to(value, (len(self),))))
+            return
+
+        value = numpy.broadcast_to(value, (len(self), len(key)))
+        for col, values in zip(key, value.T):
+            self._set_column(col, numpy.array(values))
+
+    def __repr__(self):
+
+        msg = '{}({} trials, {} samples; columns: {})'
+
+        return msg.format(type(self).__name__, self.n_trials, len(self),
+                          ', '.join(self._columns))
+
+    @property
+    def n_trials(self):
+        """Number of trials.
+        """
+
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        """Number of samples in each trial.
+        """
+
+        return numpy.diff(self.offsets)
+
+    @property
+    def columns(self):
+        """List of column names.
+        """
+
+        return list(self._columns)
+
+    @property
+    def trial_numbers(self):
+        """Number of the trial that each sample belongs to.
+        """
+
+        return numpy.repeat(numpy.arange(self.n_trials), self.lengths)
+
+    def trial(self, i):
+        """Get a single trial.
+
+        :param i: Number of the trial.
+        :type i: int
+        :return: View of the trial's samples, \
+        which shares memory with the batch.
+        :rtype: :class:`.GazeArray`
+        """
+
+        return self._trial(i, self.trials.iloc[i].to_dict())
+
+    def _trial(self, i, attributes):
+
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        columns = {col: values[start:stop] for col, values in self._columns.items()}
+
+        trial = GazeArray._new(columns, attributes)
+        trial._derived.update(self._derived)
+
+        return trial
+
+    def iter_trials(self):
+        """Iterate over the trials.
+
+        :return: View of each trial (see :meth:`trial`).
+        :rtype: :class:`generator`
+        """
+
+        for i, attributes in enumerate(self.trials.to_dict(orient='records')):
+            yield self._trial(i, attributes)
+
+    def per_sample(self, values, ndim=0):
+        """Repeat values for each trial, once for each sample of the trial.
+
+        :param values: One value for each trial, \
+        or a single value for all trials.
+        :type values: scalar or sequence
+        :param ndim: Number of dimensions of a single value, \
+        for example 1 for an *(x, y)* position.
+        :type ndim: int
+        :return: Array with one row for each sample.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        values = numpy.asarray(values, dtype=float)
+
+        if values.ndim == ndim:
+            values = numpy.broadcast_to(values, (self.n_trials,) + values.shape)
+
+        return numpy.repeat(values, self.lengths, axis=0)
+
+    def _trial_starts(self):
+
+        # First sample of each trial, leaving out empty trials.
+        starts = self.offsets[:-1]
+
+        return starts[self.lengths > 0]
+
+    def _save_raw_coords(self):
+
+        if all((col not in self) for col in RAW_DATA_COLUMNS):
+            self[RAW_DATA_COLUMNS] = self[['x', 'y']]
+
+    def _check_screen_info(self, trials):
+
+        missing = [attr for attr in SCREEN_ATTRIBUTES
+                   if pandas.isna(self.trials[attr].to_numpy()[trials]).any()]
+
+        if missing:
+            msg = 'The following necessary attributes have not been set for all trials:'
+            raise AttributeError(msg + ''.join(' {} '.format(attr) for attr in missing))
+
+    def viewing_geometries(self, trials=None):
+        """Get the viewing geometry of each trial.
+
+        Trials with the same viewing parameters \
+        share the same :class:`.ViewingGeometry`.
+
+        :param trials: Boolean mask of the trials to include. \
+        Defaults to all trials.
+        :type trials: :class:`numpy.ndarray`
+        :rtype: list of :class:`.ViewingGeometry`
+        :raises AttributeError: If any included trial \
+        is missing a viewing parameter.
+        """
+
+        if trials is None:
+            trials = numpy.full(self.n_trials, True)
+
+        self._check_screen_info(trials)
+
+        parameters = zip(*[self.trials[attr].to_numpy()[trials] for attr in SCREEN_ATTRIBUTES])
+
+        return [ViewingGeometry.shared(*values) for values in parameters]
+
+    def reset_time(self):
+        """Reset the *time* column of each trial.
+
+        The first *time* value of each trial is subtracted from the others \
+        so that *time* indicates time since the first sample of the trial.
+        """
+
+        first = numpy.zeros(self.n_trials)
+        first[self.lengths > 0] = self['time'][self._trial_starts()]
+
+        self['time'] = self['time'] - self.per_sample(first)
+
+    def px_to_dva(self, px):
+        """Convert pixels to degrees of visual angle, for all samples.
+
+        Each sample is converted using the viewing parameters of its trial. \
+        Trials with `space_units` of `'dva'` are left unchanged.
+
+        See :func:`.conversions.px_to_dva`.
+
+        :param px: Pixel values, with one for each sample.
+        :type px: :class:`numpy.ndarray`
+        :rtype: :class:`numpy.ndarray`
+        :raises AttributeError: If any trial that needs converting \
+        is missing a viewing parameter.
+        """
+
+        convert = (self.trials['space_units'] != 'dva').to_numpy()
+
+        if not convert.any():
+            return px
+
+        viewing_dist_px = numpy.full(self.n_trials, numpy.nan)
+        viewing_dist_px[convert] = [geometry.viewing_dist_px
+                                    for geometry in self.viewing_geometries(convert)]
+
+        dva = _px_to_dva(px, self.per_sample(viewing_dist_px))
+
+        return numpy.where(numpy.repeat(convert, self.lengths), dva, px)
+
+    def center(self, origin):
+        """Center gaze coordinates.
+
+        See :func:`.geometry.center`.
+
+        :param origin: *(x, y)* coordinates of new origin, \
+        for all trials or for each trial.
+        :type origin: sequence
+        """
+
+        self._save_raw_coords()
+
+        origin = self.per_sample(origin, ndim=1)
+
+        self['x'] = self['x'] - origin[:, 0]
+        self['y'] = self['y'] - origin[:, 1]
+
+    def rotate(self, theta, origin=(0., 0.)):
+        """Rotate gaze coordinates.
+
+        See :func:`.geometry.rotate`.
+
+        :param theta: Angle of counterclockwise rotation, in radians, \
+        for all trials or for each trial.
+        :type theta: float or sequence
+        :param origin: *(x, y)* coordinates of origin about which to rotate, \
+        for all trials or for each trial.
+        :type origin: sequence
+        """
+
+        self._save_raw_coords()
+
+        theta = self.per_sample(theta)
+        origin = self.per_sample(origin, ndim=1)
+
+        c = numpy.cos(theta)
+        s = numpy.sin(theta)
+        x = self['x'] - origin[:, 0]
+        y = self['y'] - origin[:, 1]
+
+        self['x'] = (x * c) - (y * s) + origin[:, 0]
+        self['y'] = (x * s) + (y * c) + origin[:, 1]
+
+    def get_velocities(self):
+        """Calculate velocity of gaze coordinates, for all trials.
+
+        See :meth:`.GazeArray.get_velocities`.
+        """
+
+        if 'velocity' not in self._derived:
+            self._derive('velocity')
+
+    def get_accelerations(self):
+        """Calculate acceleration of gaze coordinates, for all trials.
+
+        See :meth:`.GazeArray.get_accelerations`.
+        """
+
+        if 'acceleration' not in self._derived:
+            self._derive('acceleration')
+
+    def detect_saccades(self, func=None, n=None, views=False, **kwargs):
+        """Get saccades from gaze data, for all trials.
+
+        See :meth:`.GazeData.detect_saccades`. \
+        `func` is applied to the whole batch at once.
+
+        :param n: Maximum number of saccades to extract from each trial. \
+        Defaults to extracting all.
+        :type n: int
+        :return: For each trial, a list of the saccades in the trial.
+        :rtype: list of lists of :class:`.SaccadeArray`, \
+        or of :class:`.SaccadeView` if `views` is true
+        :raises KeyError: If no function is supplied, \
+        and no 'saccade' column is yet present.
+        """
+
+        if func:
+            self['saccade'] = func(self, **kwargs)
+        elif 'saccade' not in self:
+            raise KeyError('Saccade detection function required but not supplied.')
+
+        starts, stops = self.find_runs(self['saccade'])
+        trial_numbers = numpy.searchsorted(self.offsets, starts, side='right') - 1
+
+        saccades = [[] for i in range(self.n_trials)]
+        attributes = self.trials.to_dict(orient='records')
+        trials = {}
+
+        for i, start, stop in zip(trial_numbers, starts, stops):
+
+            if (n is not None) and (len(saccades[i]) >= n):
+                continue
+
+            if i not in trials:
+                trials[i] = self._trial(i, attributes[i])
+
+            start, stop = start - self.offsets[i], stop - self.offsets[i]
+
+            if views:
+                saccades[i].append(SaccadeView(trials[i], start, stop, SaccadeArray))
+            else:
+                saccades[i].append(SaccadeArray(trials[i][start:stop]))
+
+        return saccades
+
+    def find_runs(self, mask):
+        """Find runs of true values, within trials.
+
+        :param mask: Boolean value for each sample.
+        :type mask: :class:`numpy.ndarray`
+        :return: Arrays of the first row of each run, \
+        and the row after the last row of each run. \
+        Rows count from the start of the batch.
+        :rtype: tuple
+        """
+
+        mask = numpy.asarray(mask, dtype=bool)
+        trial_starts = self._trial_starts()
+
+        previous = numpy.zeros(len(mask), dtype=bool)
+        previous[1:] = mask[:-1]
+        previous[trial_starts] = False
+
+        following = numpy.zeros(len(mask), dtype=bool)
+        following[:-1] = mask[1:]
+        following[self.offsets[1:][self.lengths > 0] - 1] = False
+
+        starts = numpy.flatnonzero(mask & ~previous)
+        stops = numpy.flatnonzero(mask & ~following) + 1
+
+        return starts, stops
+
+
+# %% Derived columns
+
+def _velocity(batch):
+
+    velocities = column_velocity(batch['time'], batch['x'], batch['y'],
+                                 workspace=batch.workspace)
+
+    # Don't carry over the last sample of the previous trial.
+    velocities[batch._trial_starts()] = numpy.nan
+
+    return batch.px_to_dva(velocities)
+
+
+def _acceleration(batch):
+
+    accelerations = acceleration(batch['time'], batch['velocity'], workspace=batch.workspace)
+    accelerations[batch._trial_starts()] = numpy.nan
+
+    return accelerations
+
+
+TrialBatch.derived_columns = {
+    'velocity': DerivedColumn(_velocity,
+                              columns=INIT_COLUMNS,
+                              attributes=['space_units'] + SCREEN_ATTRIBUTES),
+    'acceleration': DerivedColumn(_acceleration,
+                                  columns=['time', 'velocity'])
+}
+
+
+# %% Helper functions
+
+def _concatenate(arrays):
+
+    if not arrays:
+        return numpy.empty(0)
+
+    return numpy.concatenate(arrays)
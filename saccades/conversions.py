@@ -13,6 +13,16 @@ def _viewing_dist_to_px(viewing_dist, screen_res, screen_diag):
     return viewing_dist * px_per_dist_unit
 
 
+def _px_to_dva(px, viewing_dist_px):
+
+    return numpy.degrees(numpy.arctan(px / viewing_dist_px))
+
+
+def _dva_to_px(dva, viewing_dist_px):
+
+    return numpy.tan(numpy.radians(dva)) * viewing_dist_px
+
+
 def px_to_dva(px, screen_res, screen_diag, viewing_dist):
     """Convert screen pixels to degrees of visual angle.
 
@@ -34,9 +44,7 @@ def px_to_dva(px, screen_res, screen_diag, viewing_dist):
                                           screen_res=screen_res,
                                           screen_diag=screen_diag)
 
-    rva = numpy.arctan(px / viewing_dist_px)
-
-    return numpy.degrees(rva)
+    return _px_to_dva(px, viewing_dist_px)
 
 
 def dva_to_px(dva, screen_res, screen_diag, viewing_dist):
@@ -60,6 +68,4 @@ def dva_to_px(dva, screen_res, screen_diag, viewing_dist):
                                           screen_res=screen_res,
                                           screen_diag=screen_diag)
 
-    rva = numpy.radians(dva)
-
-    return numpy.tan(rva) * viewing_dist_px
+    return _dva_to_px(dva, viewing_dist_px)
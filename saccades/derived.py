@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Columns of gaze data that are calculated from other columns.
+"""
+
+
+# %% Main classes
+
+class DerivedColumn:
+    """Declaration of a column calculated from other columns.
+
+    See :attr:`DerivedColumns.derived_columns`.
+    """
+
+    __slots__ = ['func', 'columns', 'attributes']
+
+    def __init__(self, func, columns=(), attributes=()):
+        """Declare a derived column.
+
+        :param func: Function of a table of gaze data, \
+        returning the values of the column.
+        :type func: callable
+        :param columns: Columns that the values depend on. \
+        These can themselves be derived columns.
+        :type columns: sequence
+        :param attributes: Attributes of the table that the values depend on, \
+        such as viewing parameters.
+        :type attributes: sequence
+        """
+
+        self.func = func
+        self.columns = tuple(columns)
+        self.attributes = tuple(attributes)
+
+    def __repr__(self):
+
+        msg = 'DerivedColumn({}, columns={!r}, attributes={!r})'
+
+        return msg.format(getattr(self.func, '__name__', self.func),
+                          self.columns, self.attributes)
+
+    def depends_on(self, names):
+        """Check whether the column depends on any of some columns or attributes.
+
+        :param names: Names of columns or attributes.
+        :type names: set
+        :rtype: bool
+        """
+
+        return not names.isdisjoint(self.columns + self.attributes)
+
+
+class DerivedColumns:
+    """Mixin for tables of gaze data with derived columns.
+
+    A derived column is calculated the first time it is asked for, \
+    and kept until any column or attribute it depends on is set again, \
+    so it is never calculated twice from the same data, \
+    and is never out of date.
+
+    Tables keep their columns in a dictionary `_columns`, \
+    and the names of the derived columns currently held in a set `_derived`.
+
+    Changes made to the values of a column in place, \
+    rather than by setting the column, \
+    cannot be detected. \
+    After making them, call :meth:`invalidate`.
+    """
+
+    __slots__ = []
+
+    derived_columns = {}
+    """Dictionary of *{column: declaration}* of the derived columns \
+    (see :class:`DerivedColumn`). \
+    To add derived columns in a subclass, \
+    extend a copy of the dictionary of the parent class.
+    """
+
+    def _get_column(self, col):
+
+        if (col not in self._columns) and (col in self.derived_columns):
+            self._derive(col)
+
+        return self._columns[col]
+
+    def _set_column(self, col, values):
+
+        self._columns[col] = values
+        self._derived.discard(col)
+        self.invalidate(col)
+
+    def _derive(self, col):
+
+        self._set_column(col, self.derived_columns[col].func(self))
+        self._derived.add(col)
+
+    def invalidate(self, *names):
+        """Discard derived columns that depend on some columns or attributes.
+
+        Derived columns that depend on the discarded ones are discarded too. \
+        They are calculated again the next time they are asked for.
+
+        :param names: Names of columns or attributes that have changed. \
+        Defaults to discarding all derived columns.
+        """
+
+        stale = set(names)
+
+        while True:
+
+            discard = [col for col in self._derived
+                       if (not names) or self.derived_columns[col].depends_on(stale)]
+
+            if not discard:
+                return
+
+            for col in discard:
+                self._derived.discard(col)
+                del self._columns[col]
+
+            stale.update(discard)
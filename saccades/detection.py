@@ -24,7 +24,7 @@ def criterion(gd, **criteria):
     are calculated automatically and added to `gd`.
 
     :param gd: A table of gaze data.
-    :type gd: :class:`..GazeData`
+    :type gd: :class:`..GazeData` or :class:`..GazeArray`
     :return: Boolean column indicating whether each sample \
     is or is not part of a saccade.
     :rtype: numpy.ndarray
@@ -47,6 +47,9 @@ def criterion(gd, **criteria):
             raise(TypeError(msg.format(metric)))
 
         result[numpy.isnan(gd[metric])] = False
-        result[gd[metric] <= value] = False
+
+        # NaN values have been dealt with already.
+        with numpy.errstate(invalid='ignore'):
+            result[gd[metric] <= value] = False
 
     return result
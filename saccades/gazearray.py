@@ -0,0 +1,839 @@
+# -*- coding: utf-8 -*-
+"""Lightweight arrays of gaze data, without :mod:`pandas` overhead.
+"""
+
+import functools
+
+import numpy
+import pandas
+
+from .derived import DerivedColumn
+from .derived import DerivedColumns
+from .gazedata import ATTRIBUTES
+from .gazedata import INIT_COLUMNS
+from .gazedata import RAW_DATA_COLUMNS
+from .gazedata import GazeData
+from .geometry import acceleration
+from .geometry import column_velocity
+from . import metrics
+from .tools import check_shape
+from .timebase import TIME_UNITS_PER_SECOND
+from .timebase import Timebase
+from .tools import find_contiguous_subsets
+from .transforms import Transform
+from .viewinggeometry import SCREEN_ATTRIBUTES
+from .viewinggeometry import ViewingGeometry
+from .views import SaccadeView
+
+
+# %% Constants
+
+COMPACT_DTYPES = {'time': numpy.int64,
+                  'float': numpy.float32}
+"""Data types of columns in compact storage: \
+*time* is held as whole numbers, \
+and any other floating point column in single precision.
+"""
+
+
+# %% Main class
+
+class GazeArray(DerivedColumns):
+    """Array of gaze data.
+
+    Stores the same data and attributes as :class:`.GazeData`, \
+    and has the same methods for processing them, \
+    but holds each column as a contiguous :class:`numpy.ndarray`, \
+    with none of the overhead of a :class:`pandas.DataFrame`. \
+    This makes it much faster to create, subset, and process \
+    many small tables of gaze data, such as one per trial.
+
+    Columns are indexed by name, and rows by position:
+
+    * `ga['x']` gives a column, as a :class:`numpy.ndarray`.
+    * `ga[['x', 'y']]` gives several columns, \
+    as a :class:`numpy.ndarray` with one column for each.
+    * `ga[10:20]`, or a boolean mask or array of row numbers, \
+    gives a new :class:`GazeArray` with a subset of the rows. \
+    A slice shares memory with the original, as for :mod:`numpy` arrays.
+
+    For anything else, \
+    :meth:`to_pandas` gives a :class:`.GazeData` view of the same data.
+
+    The *velocity* and *acceleration* columns are derived columns \
+    (see :class:`.DerivedColumns`). \
+    They are calculated when first asked for, \
+    and discarded when *time*, *x*, *y*, or the viewing parameters change.
+
+    Transformations of the gaze coordinates, \
+    such as :meth:`center`, :meth:`rotate`, and :meth:`to_dva`, \
+    are not applied straight away, \
+    but gathered into a :class:`.Transform` \
+    and applied together the next time the coordinates are read. \
+    The raw coordinates are not kept, \
+    but the *x_raw* and *y_raw* columns can still be asked for. \
+    They are derived from the coordinates by undoing :attr:`transform`. \
+    Setting *x* or *y* after a transformation \
+    first keeps the raw coordinates as ordinary columns, \
+    and starts :attr:`transform` again.
+
+    For very large amounts of data, \
+    :meth:`to_compact` gives a copy in compact storage, \
+    which needs about half the memory (see :attr:`is_compact`). \
+    For regularly sampled data, \
+    :meth:`use_timebase` replaces the *time* column with a :class:`.Timebase`.
+    """
+
+    __slots__ = ['_columns', '_derived', '_transform', '_pending', '_compact',
+                 '_timebase', '_geometry'] + ATTRIBUTES
+
+    def __init__(self, data=None, copy=True, **kwargs):
+        """Initialize a new array of gaze data.
+
+        Attributes are set as for :meth:`.GazeData.__init__`.
+
+        :param data: Gaze data, as one of:
+
+            * An array with shape *(n, 3)*, \
+            where *n* is the number of gaze samples, \
+            and columns are *time*, *x gaze position*, *y gaze position*. \
+            This is always copied.
+            * A dictionary of *{column: values}*, \
+            or a :class:`pandas.DataFrame`, \
+            including at least columns *time*, *x*, and *y*.
+            * Another :class:`GazeArray`.
+
+        :type data: :class:`numpy.ndarray` \
+        or convertible to :class:`numpy.ndarray`, \
+        dict, :class:`pandas.DataFrame`, or :class:`GazeArray`
+        :param copy: Copy the columns of `data`, \
+        rather than sharing their memory.
+        :type copy: bool
+        :raises ValueError: If `data` is not of the expected shape, \
+        or its columns are not all of the same length.
+        """
+
+        self._derived = set()
+        self._transform = Transform()
+        self._pending = None
+        self._compact = False
+        self._timebase = None
+        self._geometry = None
+
+        changed = [attr for attr in ATTRIBUTES if attr in kwargs]
+        for attr in ATTRIBUTES:
+            setattr(self, attr, kwargs.pop(attr, getattr(data, attr, None)))
+
+        if kwargs:
+            msg = 'Unexpected keyword arguments: {}.'
+            raise TypeError(msg.format(', '.join(kwargs)))
+
+        if data is None:
+            columns = {col: numpy.empty(0) for col in INIT_COLUMNS}
+        elif isinstance(data, GazeArray):
+            data._apply_transforms()
+            columns = data._columns
+            self._transform = data._transform
+            self._compact = data._compact
+            self._timebase = data._timebase
+        elif isinstance(data, pandas.DataFrame) and all((col in data) for col in INIT_COLUMNS):
+            columns = {col: data[col].to_numpy() for col in data.columns}
+        elif isinstance(data, dict):
+            columns = data
+        else:
+            # The checked array is already a copy.
+            array = numpy.ascontiguousarray(check_shape(data, (None, 3)).T)
+            columns = dict(zip(INIT_COLUMNS, array))
+            copy = False
+
+        required = INIT_COLUMNS if self._timebase is None else ['x', 'y']
+        self._columns = _check_columns(columns, copy, required)
+
+        if isinstance(data, GazeArray) and data._derived:
+            self._derived = set(data._derived)
+            if changed:
+                self.invalidate(*changed)
+
+    @classmethod
+    def _new(cls, columns, attributes):
+
+        # Make a new instance from checked columns, skipping __init__().
+        ga = cls.__new__(cls)
+        ga._columns = columns
+        ga._derived = set()
+        ga._transform = Transform()
+        ga._pending = None
+        ga._compact = False
+        ga._timebase = None
+        ga._geometry = None
+        for attr in ATTRIBUTES:
+            setattr(ga, attr, attributes[attr])
+
+        return ga
+
+    def __len__(self):
+
+        for values in self._columns.values():
+            return len(values)
+
+        return 0
+
+    def __contains__(self, col):
+
+        return (col in self._columns) or ((col == 'time') and (self._timebase is not None))
+
+    def __getitem__(self, key):
+
+        if isinstance(key, str):
+            return self._get_column(key)
+
+        if isinstance(key, list) and key and all(isinstance(col, str) for col in key):
+            return numpy.column_stack([self._get_column(col) for col in key])
+
+        if isinstance(key, (int, numpy.integer)):
+            msg = 'Select rows with a slice, a boolean mask, or an array of row numbers.'
+            raise TypeError(msg)
+
+        if isinstance(key, pandas.Series):
+            key = key.to_numpy()
+
+        # Consecutive rows keep the timebase, others need the times.
+        consecutive = isinstance(key, slice) and (key.step in [None, 1])
+        if (self._timebase is not None) and not consecutive:
+            self._get_column('time')
+
+        self._apply_transforms()
+        columns = {col: values[key] for col, values in self._columns.items()}
+
+        subset = self._new(columns, self.viewing_parameters)
+        subset._derived.update(self._derived)
+        subset._transform = self._transform
+        subset._geometry = self._geometry
+        subset._compact = self._compact
+
+        if (self._timebase is not None) and consecutive:
+            subset._timebase = self._timebase.subset(*key.indices(len(self))[:2])
+        else:
+            subset._derived.discard('time')
+
+        return subset
+
+    def __setitem__(self, key, value):
+
+        if isinstance(key, str):
+            self._set_column(key, numpy.array(numpy.broadcast_to(value, (len(self),))))
+            return
+
+        value = numpy.asarray(value)
+        if value.ndim < 2:
+            value = numpy.broadcast_to(value, (len(self), len(key)))
+        check_shape(value, (len(self), len(key)), copy=False)
+
+        for col, values in zip(key, value.T):
+            self._set_column(col, numpy.array(values))
+
+    def __setattr__(self, name, value):
+
+        super().__setattr__(name, value)
+
+        if name in SCREEN_ATTRIBUTES:
+            super().__setattr__('_geometry', None)
+
+        if name in ATTRIBUTES:
+            self.invalidate(name)
+
+    def __array__(self, dtype=None):
+
+        self._get_column('time')
+        self._apply_transforms()
+        array = numpy.column_stack(list(self._columns.values()))
+
+        return array if dtype is None else array.astype(dtype)
+
+    def __repr__(self):
+
+        msg = '{}({} rows; columns: {})'
+
+        return msg.format(type(self).__name__, len(self), ', '.join(self._columns))
+
+    @property
+    def columns(self):
+        """List of column names.
+        """
+
+        if ('time' in self._columns) or (self._timebase is None):
+            return list(self._columns)
+
+        return ['time'] + list(self._columns)
+
+    @property
+    def is_compact(self):
+        """Whether the data are held in compact storage.
+
+        In compact storage, \
+        the *time* column holds whole numbers, \
+        as given by the clock of the eye tracker, \
+        and other floating point columns are held in single precision \
+        (see :data:`COMPACT_DTYPES`). \
+        Values set later are converted to the same types.
+        """
+
+        return self._compact
+
+    @property
+    def valid(self):
+        """Boolean vector of samples with gaze coordinates, \
+        false where the eye was not tracked.
+
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        return numpy.isfinite(self._get_column('x')) & numpy.isfinite(self._get_column('y'))
+
+    @property
+    def timebase(self):
+        """Timebase giving the *time* column, \
+        or `None` if the column is held explicitly.
+
+        See :meth:`use_timebase`.
+
+        :rtype: :class:`.Timebase`
+        """
+
+        return self._timebase
+
+    @property
+    def viewing_geometry(self):
+        """Viewing geometry given by the attributes \
+        `screen_res`, `screen_diag`, and `viewing_dist`.
+
+        It is shared with all other gaze data with the same attributes \
+        (see :meth:`.ViewingGeometry.shared`). \
+        Setting it sets the attributes.
+
+        :rtype: :class:`.ViewingGeometry`
+        :raises AttributeError: If any of the attributes is not set.
+        """
+
+        if self._geometry is None:
+            self._check_screen_info()
+            self._geometry = ViewingGeometry.shared(self.screen_res,
+                                                    self.screen_diag,
+                                                    self.viewing_dist)
+
+        return self._geometry
+
+    @viewing_geometry.setter
+    def viewing_geometry(self, geometry):
+
+        for attr in SCREEN_ATTRIBUTES:
+            setattr(self, attr, getattr(geometry, attr))
+
+        self._geometry = geometry
+
+    @property
+    def transform(self):
+        """Transformation of the gaze coordinates since they were raw.
+
+        :rtype: :class:`.Transform`
+        """
+
+        return self._transform
+
+    @property
+    def viewing_parameters(self):
+        """Dictionary of viewing parameters.
+        """
+
+        return {attr: getattr(self, attr) for attr in ATTRIBUTES}
+
+    def copy(self):
+        """Copy the array of gaze data.
+
+        :rtype: :class:`GazeArray`
+        """
+
+        return type(self)(self)
+
+    def to_compact(self):
+        """Get a copy of the gaze data in compact storage.
+
+        See :attr:`is_compact`.
+
+        :rtype: :class:`GazeArray`
+        :raises ValueError: If any times are missing or not whole numbers.
+        """
+
+        self._apply_transforms()
+        columns = {col: _compact(col, values) for col, values in self._columns.items()}
+
+        ga = self._new(columns, self.viewing_parameters)
+        ga._derived.update(self._derived)
+        ga._transform = self._transform
+        ga._timebase = self._timebase
+        ga._geometry = self._geometry
+        ga._compact = True
+
+        return ga
+
+    def to_pandas(self):
+        """Get a table of the same gaze data.
+
+        The table is a view, not a copy: \
+        its columns share memory with those of the array, \
+        so changing values in one changes them in the other, \
+        until columns of either are replaced. \
+        To make this possible, \
+        columns with the same data type \
+        are gathered into a single block of memory the first time they are viewed, \
+        and appear next to each other in the table.
+
+        :rtype: :class:`.GazeData`
+        """
+
+        self._get_column('time')
+        self._apply_transforms()
+        columns = {}
+        frames = []
+
+        for group in _dtype_groups(self._columns):
+
+            names = [col for col, values in group]
+            block = _as_block([values for col, values in group])
+
+            if block is None:
+                block = numpy.stack([values for col, values in group])
+
+            columns.update(zip(names, block))
+            frames.append(pandas.DataFrame(block.T, columns=names, copy=False))
+
+        self._columns = columns
+
+        if len(frames) > 1:
+            df = pandas.concat(frames, axis=1, copy=False)
+        else:
+            df, = frames
+
+        return GazeData(df, copy=False, **self.viewing_parameters)
+
+    def _get_column(self, col):
+
+        if col in ['x', 'y']:
+            self._apply_transforms()
+
+        if (col == 'time') and (col not in self._columns) and (self._timebase is not None):
+            # Materialize the times, keeping them as the first column.
+            time = self._timebase.times(len(self))
+            if self.is_compact:
+                time = _compact(col, time)
+            self._columns = dict([(col, time)] + list(self._columns.items()))
+            self._derived.add(col)
+
+        return super()._get_column(col)
+
+    def _set_column(self, col, values):
+
+        # Setting one coordinate must not lose a transformation of the other.
+        if col in ['x', 'y']:
+            self._apply_transforms()
+            if self._transform.steps:
+                self._keep_raw_coords()
+
+        # Explicit times replace the timebase.
+        if col == 'time':
+            self._set_timebase(None)
+
+        if self.is_compact:
+            values = _compact(col, values)
+
+        super()._set_column(col, values)
+
+    def _keep_raw_coords(self):
+
+        # The transform no longer relates new coordinates to the raw ones,
+        # so the raw coordinates become ordinary columns.
+        self.get_raw_coords()
+        self._derived.difference_update(RAW_DATA_COLUMNS)
+        self._transform = Transform()
+
+    def _add_transform(self, transform):
+
+        if self._pending is None:
+            self._pending = transform
+        else:
+            self._pending = self._pending.then(transform)
+
+        self._transform = self._transform.then(transform)
+        self.invalidate('x', 'y', 'transform')
+
+    def _apply_transforms(self):
+
+        if self._pending is not None:
+            x, y = self._pending.apply(self._columns['x'], self._columns['y'])
+            self._columns['x'] = x
+            self._columns['y'] = y
+            self._pending = None
+
+    def _set_timebase(self, timebase):
+
+        self._timebase = timebase
+        self.invalidate('timebase')
+
+    def use_timebase(self, timebase=None):
+        """Replace the *time* column with a timebase.
+
+        Times are then held as the time of the first sample, \
+        the interval between samples, and any gaps \
+        (see :class:`.Timebase`), \
+        and methods calculating velocity and acceleration \
+        use the single interval rather than the time of every sample. \
+        The *time* column is still available, \
+        and is made again from the timebase when first asked for.
+
+        :param timebase: Timebase of the gaze data. \
+        Defaults to finding it from the *time* column, \
+        expecting the sampling rate in `messages`, \
+        as given by :class:`.EyelinkReader`, \
+        if it is there.
+        :type timebase: :class:`.Timebase`
+        :raises ValueError: If no timebase is given, \
+        and times are not regular (see :meth:`.Timebase.from_times`).
+        """
+
+        if timebase is None:
+
+            interval = None
+            rate = self.messages.get('rate') if isinstance(self.messages, dict) else None
+            if rate and (self.time_units in TIME_UNITS_PER_SECOND):
+                interval = TIME_UNITS_PER_SECOND[self.time_units] / rate
+
+            timebase = Timebase.from_times(self._get_column('time'), interval)
+
+            if timebase is None:
+                raise ValueError('Times are not regular enough for a timebase.')
+
+        # The times themselves have not changed,
+        # so columns derived from them are still up to date.
+        self._columns.pop('time', None)
+        self._derived.discard('time')
+        self._timebase = timebase
+
+    def _check_screen_info(self):
+
+        ok = True
+        msg = 'The following necessary attributes have not yet been set:'
+
+        for attr in SCREEN_ATTRIBUTES:
+            if getattr(self, attr) is None:
+                msg = msg + ' {} '.format(attr)
+                ok = False
+
+        if not ok:
+            raise AttributeError(msg)
+
+    def reset_time(self):
+        """Reset the *time* column.
+
+        See :meth:`.GazeData.reset_time`.
+        """
+
+        if self._timebase is None:
+            self['time'] = self['time'] - self['time'][0]
+        else:
+            self._set_timebase(self._timebase.starting_at(0))
+
+    def px_to_dva(self, px):
+        """Convert pixels to degrees of visual angle.
+
+        See :func:`.conversions.px_to_dva`.
+        """
+
+        return self.viewing_geometry.px_to_dva(px)
+
+    def dva_to_px(self, dva):
+        """Convert degrees of visual angle to pixels.
+
+        See :func:`.conversions.dva_to_px`.
+        """
+
+        return self.viewing_geometry.dva_to_px(dva)
+
+    def center(self, origin):
+        """Center gaze coordinates.
+
+        See :func:`.geometry.center`.
+        """
+
+        origin = check_shape(origin, (2,))
+
+        self._add_transform(Transform.translation(-origin))
+
+    def rotate(self, theta, origin=(0., 0.)):
+        """Rotate gaze coordinates.
+
+        See :func:`.geometry.rotate`.
+        """
+
+        self._add_transform(Transform.rotation(theta, origin))
+
+    def to_dva(self, exact=False):
+        """Convert gaze coordinates to degrees of visual angle.
+
+        Coordinates are taken to be relative to the point on the screen \
+        nearest the eye, usually its center \
+        (see :meth:`center`). \
+        Afterwards, the attribute `space_units` is `'dva'`. \
+        If it already was, nothing is done.
+
+        See :meth:`.ViewingGeometry.coords_to_dva`.
+
+        :param exact: Keep the eccentricity of each point exact.
+        :type exact: bool
+        """
+
+        if self.space_units == 'dva':
+            return
+
+        viewing_dist_px = self.viewing_geometry.viewing_dist_px
+
+        self._add_transform(Transform.px_to_dva(viewing_dist_px, exact=exact))
+        self.space_units = 'dva'
+
+    def get_velocities(self):
+        """Calculate velocity of gaze coordinates.
+
+        See :meth:`.GazeData.get_velocities`. \
+        Velocities that are already up to date are not calculated again.
+        """
+
+        if 'velocity' not in self._derived:
+            self._derive('velocity')
+
+    def get_accelerations(self):
+        """Calculate acceleration of gaze coordinates.
+
+        See :meth:`.GazeData.get_accelerations`. \
+        Accelerations that are already up to date are not calculated again.
+        """
+
+        if 'acceleration' not in self._derived:
+            self._derive('acceleration')
+
+    def detect_saccades(self, func=None, n=None, views=False, **kwargs):
+        """Get saccades from gaze data.
+
+        See :meth:`.GazeData.detect_saccades`.
+
+        :return: Subsets of gaze data, each containing one saccade.
+        :rtype: list of :class:`SaccadeArray`, \
+        or of :class:`.SaccadeView` if `views` is true
+        :raises KeyError: If no function is supplied, \
+        and no 'saccade' column is yet present.
+        """
+
+        if func:
+            self['saccade'] = func(self, **kwargs)
+        elif 'saccade' not in self:
+            raise KeyError('Saccade detection function required but not supplied.')
+
+        slices = find_contiguous_subsets(self['saccade'])
+
+        if n is not None:
+            slices = slices[:n]
+
+        if views:
+            return [SaccadeView(self, i.start, i.stop, SaccadeArray) for i in slices]
+
+        return [SaccadeArray(self[i]) for i in slices]
+
+    def plot(self, **kwargs):
+        """Plot gaze coordinates.
+
+        See :meth:`.GazeData.plot`, which takes the same arguments.
+
+        :rtype: :class:`plotnine.ggplot`
+        """
+
+        if kwargs.get('show_raw'):
+            self.get_raw_coords()
+
+        return self.to_pandas().plot(**kwargs)
+
+    def get_raw_coords(self):
+        """Add the raw coordinates, before any transformations, \
+        as columns *x_raw* and *y_raw*.
+
+        The columns are derived columns, \
+        calculated by undoing :attr:`transform`.
+        """
+
+        self._get_column('x_raw')
+
+
+def _time(ga):
+
+    return ga.timebase.times(len(ga))
+
+
+def _velocity(ga):
+
+    if ga.timebase is None:
+        velocities = column_velocity(ga['time'], ga['x'], ga['y'])
+    else:
+        velocities = column_velocity(ga.timebase.interval, ga['x'], ga['y'])
+        ga.timebase.correct_at_gaps(velocities)
+
+    if ga.space_units != 'dva':
+        velocities = ga.px_to_dva(velocities)
+
+    return velocities
+
+
+def _acceleration(ga):
+
+    if ga.timebase is None:
+        return acceleration(ga['time'], ga['velocity'])
+
+    accelerations = acceleration(ga.timebase.interval, ga['velocity'])
+    ga.timebase.correct_at_gaps(accelerations)
+
+    return accelerations
+
+
+def _raw_coords(ga, col):
+
+    # Both raw coordinates are calculated at once, and both are kept.
+    raw = dict(zip(RAW_DATA_COLUMNS, ga.transform.inverse().apply(ga['x'], ga['y'])))
+
+    for other, values in raw.items():
+        if other not in ga._columns:
+            ga._columns[other] = values
+            ga._derived.add(other)
+
+    return raw[col]
+
+
+GazeArray.derived_columns = {
+    'time': DerivedColumn(_time,
+                          attributes=['timebase']),
+    'x_raw': DerivedColumn(functools.partial(_raw_coords, col='x_raw'),
+                           columns=['x', 'y'],
+                           attributes=['transform']),
+    'y_raw': DerivedColumn(functools.partial(_raw_coords, col='y_raw'),
+                           columns=['x', 'y'],
+                           attributes=['transform']),
+    'velocity': DerivedColumn(_velocity,
+                              columns=INIT_COLUMNS,
+                              attributes=['timebase', 'space_units', 'screen_res',
+                                          'screen_diag', 'viewing_dist']),
+    'acceleration': DerivedColumn(_acceleration,
+                                  columns=['time', 'velocity'])
+}
+
+
+# %% Saccade subclass
+
+class SaccadeArray(GazeArray):
+    """Array of gaze data containing a saccade.
+
+    The counterpart of :class:`.Saccade` for :class:`GazeArray`, \
+    with the same methods for calculating saccade metrics.
+    """
+
+    __slots__ = []
+
+    # This makes all suitable functions from metrics
+    # into methods of the SaccadeArray class.
+    def __getattr__(self, name):
+
+        if name in metrics.SACCADE_METRICS:
+            return functools.partial(getattr(metrics, name), self)
+
+        msg = '{!r} object has no attribute {!r}'
+        raise AttributeError(msg.format(type(self).__name__, name))
+
+
+# %% Helper functions
+
+def _check_columns(columns, copy, required=INIT_COLUMNS):
+
+    if not all((col in columns) for col in required):
+        msg = 'Columns {} are required.'
+        raise ValueError(msg.format(', '.join(required)))
+
+    checked = {}
+
+    for col, values in columns.items():
+
+        # numpy.array(copy=False) fails under numpy 2 when a copy is needed.
+        if copy:
+            values = numpy.array(values, order='C')
+        else:
+            values = numpy.ascontiguousarray(values)
+
+        if values.ndim != 1:
+            msg = 'Column {} has {} dimensions but 1 required.'
+            raise ValueError(msg.format(col, values.ndim))
+
+        checked[col] = values
+
+    if len(set(len(values) for values in checked.values())) > 1:
+        raise ValueError('Columns are not all of the same length.')
+
+    return checked
+
+
+def _compact(col, values):
+
+    if col == 'time':
+        time = numpy.asarray(values)
+        if numpy.issubdtype(time.dtype, numpy.integer):
+            return time.astype(COMPACT_DTYPES['time'], copy=False)
+        with numpy.errstate(invalid='ignore'):
+            compact = time.astype(COMPACT_DTYPES['time'])
+        if not numpy.array_equal(compact, time):
+            raise ValueError('Compact storage requires whole numbers for all times.')
+        return compact
+
+    values = numpy.asarray(values)
+
+    if numpy.issubdtype(values.dtype, numpy.floating):
+        return values.astype(COMPACT_DTYPES['float'], copy=False)
+
+    return values
+
+
+def _dtype_groups(columns):
+
+    # Group columns with the same data type,
+    # since pandas keeps each data type in a single block.
+    groups = {}
+
+    for col, values in columns.items():
+        groups.setdefault(values.dtype, []).append((col, values))
+
+    return list(groups.values())
+
+
+def _as_block(arrays):
+
+    # The 2-D array whose consecutive rows are the given arrays, if there is one.
+    base = arrays[0].base
+
+    if not (isinstance(base, numpy.ndarray) and (base.ndim == 2) and
+            base.flags.c_contiguous and all((a.base is base) for a in arrays)):
+        return None
+
+    row_stride, item_size = base.strides
+    if any(a.strides != (item_size,) for a in arrays):
+        return None
+
+    start = base.__array_interface__['data'][0]
+    offsets = [a.__array_interface__['data'][0] - start for a in arrays]
+    rows = [offset // row_stride for offset in offsets]
+    cols = [(offset % row_stride) // item_size for offset in offsets]
+
+    if (rows != list(range(rows[0], rows[0] + len(arrays)))) or (len(set(cols)) > 1):
+        return None
+
+    return base[rows[0]:rows[-1] + 1, cols[0]:cols[0] + len(arrays[0])]
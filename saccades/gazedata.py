@@ -7,8 +7,6 @@ import functools
 import pandas
 import plotnine
 
-from .conversions import dva_to_px
-from .conversions import px_to_dva
 from .geometry import acceleration
 from .geometry import center
 from .geometry import rotate
@@ -17,6 +15,9 @@ from . import metrics
 from .tools import check_shape
 from .tools import find_contiguous_subsets
 from .tools import _blockmanager_to_dataframe
+from .viewinggeometry import SCREEN_ATTRIBUTES
+from .viewinggeometry import ViewingGeometry
+from .views import SaccadeView
 
 
 # %% Constants
@@ -27,12 +28,20 @@ ATTRIBUTES = ['time_units',
               'screen_diag',
               'viewing_dist',
               'target',
-              'messages']
+              'messages',
+              'annotations']
 
 INIT_COLUMNS = ['time', 'x', 'y']
 
 RAW_DATA_COLUMNS = ['x_raw', 'y_raw']
 
+DERIVED_COLUMNS = {'velocity': ['time', 'x', 'y'],
+                   'acceleration': ['time', 'velocity']}
+"""Columns calculated by :meth:`GazeData.get_velocities` \
+and :meth:`GazeData.get_accelerations`, \
+and the columns they are calculated from.
+"""
+
 
 # %% Main class
 
@@ -106,6 +115,10 @@ class GazeData(pandas.DataFrame):
         :type target: tuple
         :param messages: Any additional messages accompanying the data, \
         in any format.
+        :param annotations: Any non-data lines occurring within the data, \
+        as *(row, line)* pairs \
+        (see :meth:`.BaseReader.process_annotations`).
+        :type annotations: list
         """
 
         # Set attributes according to the following priorities:
@@ -155,17 +168,50 @@ class GazeData(pandas.DataFrame):
 
         return {attr: getattr(self, attr) for attr in ATTRIBUTES}
 
+    @property
+    def viewing_geometry(self):
+        """Viewing geometry given by the attributes \
+        `screen_res`, `screen_diag`, and `viewing_dist`.
+
+        See :attr:`.GazeArray.viewing_geometry`.
+
+        :rtype: :class:`.ViewingGeometry`
+        :raises AttributeError: If any of the attributes is not set.
+        """
+
+        self._check_screen_info()
+
+        return ViewingGeometry.shared(self.screen_res, self.screen_diag, self.viewing_dist)
+
+    @viewing_geometry.setter
+    def viewing_geometry(self, geometry):
+
+        for attr in SCREEN_ATTRIBUTES:
+            setattr(self, attr, getattr(geometry, attr))
+
     def _save_raw_coords(self):
 
         if all((col not in self) for col in RAW_DATA_COLUMNS):
             self[RAW_DATA_COLUMNS] = self[['x', 'y']]
 
+    def _drop_derived(self, *changed):
+
+        # Calculated columns no longer match the columns they came from,
+        # nor do any columns calculated from them in turn.
+        stale = set(changed)
+
+        for col, sources in DERIVED_COLUMNS.items():
+            if not stale.isdisjoint(sources):
+                stale.add(col)
+                if col in self:
+                    del self[col]
+
     def _check_screen_info(self):
 
         ok = True
         msg = 'The following necessary attributes have not yet been set:'
 
-        for attr in ['screen_res', 'screen_diag', 'viewing_dist']:
+        for attr in SCREEN_ATTRIBUTES:
             if getattr(self, attr) is None:
                 msg = msg + ' {} '.format(attr)
                 ok = False
@@ -177,10 +223,13 @@ class GazeData(pandas.DataFrame):
         """Reset the *time* column.
 
         The first *time* value is subtracted from all the others \
-        so that *time* indicates time since first sample.
+        so that *time* indicates time since first sample. \
+        Any *velocity* and *acceleration* columns are dropped \
+        (see :data:`DERIVED_COLUMNS`).
         """
 
         self['time'] = self['time'] - self['time'].iloc[0]
+        self._drop_derived('time')
 
     def px_to_dva(self, px):
         """Convert pixels to degrees of visual angle.
@@ -188,12 +237,7 @@ class GazeData(pandas.DataFrame):
         See :func:`.conversions.px_to_dva`.
         """
 
-        self._check_screen_info()
-
-        return px_to_dva(px,
-                         screen_res=self.screen_res,
-                         screen_diag=self.screen_diag,
-                         viewing_dist=self.viewing_dist)
+        return self.viewing_geometry.px_to_dva(px)
 
     def dva_to_px(self, dva):
         """Convert degrees of visual angle to pixels.
@@ -201,32 +245,35 @@ class GazeData(pandas.DataFrame):
         See :func:`.conversions.dva_to_px`.
         """
 
-        self._check_screen_info()
-
-        return dva_to_px(dva,
-                         screen_res=self.screen_res,
-                         screen_diag=self.screen_diag,
-                         viewing_dist=self.viewing_dist)
+        return self.viewing_geometry.dva_to_px(dva)
 
     def center(self, origin):
         """Center gaze coordinates.
 
+        Any *velocity* and *acceleration* columns are dropped \
+        (see :data:`DERIVED_COLUMNS`).
+
         See :func:`.geometry.center`.
         """
 
         self._save_raw_coords()
 
         self[['x', 'y']] = center(self[['x', 'y']], origin)
+        self._drop_derived('x', 'y')
 
     def rotate(self, theta, origin=(0., 0.)):
         """Rotate gaze coordinates.
 
+        Any *velocity* and *acceleration* columns are dropped \
+        (see :data:`DERIVED_COLUMNS`).
+
         See :func:`.geometry.rotate`.
         """
 
         self._save_raw_coords()
 
         self[['x', 'y']] = rotate(self[['x', 'y']], theta, origin)
+        self._drop_derived('x', 'y')
 
     def get_velocities(self):
         """Calculate velocity of gaze coordinates.
@@ -262,7 +309,7 @@ class GazeData(pandas.DataFrame):
 
         self['acceleration'] = acceleration(self['time'], self['velocity'])
 
-    def detect_saccades(self, func=None, n=None, **kwargs):
+    def detect_saccades(self, func=None, n=None, views=False, **kwargs):
         """Get saccades from gaze data.
 
         Function `func` is used to detect saccades. \
@@ -286,6 +333,10 @@ class GazeData(pandas.DataFrame):
         :param n: Maximum number of saccades to extract. \
         Defaults to extracting all.
         :type n: int
+        :param views: Return a :class:`.SaccadeView` of each saccade, \
+        rather than a copy. \
+        Much faster for recordings with many saccades.
+        :type views: bool
         :return: Subsets of gaze data, each containing one saccade.
         :rtype: list
         :raises KeyError: If no function is supplied, \
@@ -302,6 +353,9 @@ class GazeData(pandas.DataFrame):
         if n is not None:
             slices = slices[:n]
 
+        if views:
+            return [SaccadeView(self, i.start, i.stop, Saccade) for i in slices]
+
         return [Saccade(self[i]) for i in slices]
 
     def plot(self, reverse_y=False, show_raw=False, saccades=False,
@@ -7,7 +7,7 @@ import numpy
 from .tools import check_shape
 
 
-def center(coords, origin):
+def center(coords, origin, out=None):
     """Translate coordinates to center them on a new origin.
 
     :param coords: *(x, y)* coordinates with shape *(n, 2)*, \
@@ -17,17 +17,21 @@ def center(coords, origin):
     :param origin: *(x, y)* coordinates of new origin.
     :type origin: :class:`numpy.ndarray` \
     or sequence convertible to :class:`numpy.ndarray`
+    :param out: Array with shape *(n, 2)* in which to put the result, \
+    rather than allocating a new one. \
+    It can be `coords` itself.
+    :type out: :class:`numpy.ndarray`
     :return: Recentered `coords`.
     :rtype: :class:`numpy.ndarray`
     """
 
-    coords = check_shape(coords, (None, 2))
-    origin = check_shape(origin, (2,))
+    coords = check_shape(coords, (None, 2), copy=False)
+    origin = check_shape(origin, (2,), copy=False)
 
-    return coords - origin
+    return numpy.subtract(coords, origin, out=_output(out, coords.shape))
 
 
-def rotate(coords, theta, origin=(0, 0)):
+def rotate(coords, theta, origin=(0, 0), out=None, workspace=None):
     """Rotate coordinates about a point.
 
     :param coords: *(x, y)* coordinates with shape *(n, 2)*, \
@@ -40,22 +44,31 @@ def rotate(coords, theta, origin=(0, 0)):
     about which to rotate.
     :type origin: :class:`numpy.ndarray` \
     or sequence convertible to :class:`numpy.ndarray`
+    :param out: Array with shape *(n, 2)* in which to put the result, \
+    rather than allocating a new one.
+    :type out: :class:`numpy.ndarray`
+    :param workspace: Workspace for temporary arrays.
+    :type workspace: :class:`.Workspace`
     :return: Rotated `coords`.
     :rtype: :class:`numpy.ndarray`
     """
 
-    coords = center(coords, origin)
+    coords = check_shape(coords, (None, 2), copy=False)
+    origin = check_shape(origin, (2,), copy=False)
+
+    centered = center(coords, origin, out=_scratch(workspace, 'centered', coords.shape))
 
     c = numpy.cos(theta)
     s = numpy.sin(theta)
     rotation_matrix = numpy.array([[c, s], [-s, c]])
 
-    coords = numpy.matmul(coords, rotation_matrix)
+    rotated = numpy.matmul(centered, rotation_matrix, out=_output(out, coords.shape))
+    rotated += origin
 
-    return coords + origin
+    return rotated
 
 
-def velocity(coords):
+def velocity(coords, out=None, workspace=None):
     """Calculate velocity of coordinates.
 
     The velocity of a coordinate pair is based on the euclidean distance \
@@ -66,39 +79,126 @@ def velocity(coords):
     where *n* is the number of gaze samples.
     :type coords: :class:`numpy.ndarray` \
     or sequence convertible to :class:`numpy.ndarray`
+    :param out: Vector of length *n* in which to put the result, \
+    rather than allocating a new one.
+    :type out: :class:`numpy.ndarray`
+    :param workspace: Workspace for temporary arrays.
+    :type workspace: :class:`.Workspace`
     :return: Vector of velocities of `coords`.
     :rtype: :class:`numpy.ndarray`
     """
 
-    coords = check_shape(coords, (None, 3))
+    coords = check_shape(coords, (None, 3), copy=False)
+
+    return column_velocity(*coords.T, out=out, workspace=workspace)
+
+
+def column_velocity(t, x, y, out=None, workspace=None):
+    """Calculate velocity of coordinates held in separate columns.
+
+    The same as :func:`velocity`, \
+    but the columns need not be stacked into one array first, \
+    nor share a data type. \
+    For example, times can be integers and coordinates single precision.
+
+    :param t: Vector of times, \
+    or for regularly sampled data, \
+    the interval between samples.
+    :type t: :class:`numpy.ndarray` or float
+    :param x: Vector of *x* coordinates.
+    :type x: :class:`numpy.ndarray`
+    :param y: Vector of *y* coordinates.
+    :type y: :class:`numpy.ndarray`
+    :param out: Vector in which to put the result, \
+    rather than allocating a new one.
+    :type out: :class:`numpy.ndarray`
+    :param workspace: Workspace for temporary arrays.
+    :type workspace: :class:`.Workspace`
+    :return: Vector of velocities.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    x = check_shape(x, (None,), copy=False)
+    y = check_shape(y, (len(x),), copy=False)
+
+    velocities = _output(out, len(x))
+    velocities[:1] = numpy.nan
+
+    if len(x) > 1:
 
-    diffs = numpy.diff(coords, axis=0, prepend=numpy.nan)
-    distances = numpy.linalg.norm(diffs[:, 1:3], axis=1)
+        distances = _scratch(workspace, 'distances', len(x) - 1)
+        y_diffs = _scratch(workspace, 'y_diffs', len(x) - 1)
 
-    return distances / diffs[:, 0]
+        numpy.subtract(x[1:], x[:-1], out=distances)
+        numpy.subtract(y[1:], y[:-1], out=y_diffs)
+        numpy.hypot(distances, y_diffs, out=distances)
 
+        numpy.divide(distances, _time_diffs(t, len(x), workspace), out=velocities[1:])
 
-def acceleration(t, v):
+    return velocities
+
+
+def acceleration(t, v, out=None, workspace=None):
     """Calculate acceleration.
 
     The acceleration of a point is based on the \
     difference in velocity since the previous point \
     and the difference in time since the previous point.
 
-    :param t: Vector of times.
+    :param t: Vector of times, \
+    or for regularly sampled data, \
+    the interval between samples.
     :type t: :class:`numpy.ndarray` \
-    or sequence convertible to :class:`numpy.ndarray`
+    or sequence convertible to :class:`numpy.ndarray`, or float
     :param v: Vector of velocities.
     :type v: :class:`numpy.ndarray` \
     or sequence convertible to :class:`numpy.ndarray`
+    :param out: Vector in which to put the result, \
+    rather than allocating a new one.
+    :type out: :class:`numpy.ndarray`
+    :param workspace: Workspace for temporary arrays.
+    :type workspace: :class:`.Workspace`
     :return: Vector of accelerations.
     :rtype: :class:`numpy.ndarray`
     """
 
-    t = check_shape(t, (None, ))
-    v = check_shape(v, (None, ))
+    v = check_shape(v, (None, ), copy=False)
+
+    accelerations = _output(out, len(v))
+    accelerations[:1] = numpy.nan
+
+    if len(v) > 1:
+        numpy.subtract(v[1:], v[:-1], out=accelerations[1:])
+        accelerations[1:] /= _time_diffs(t, len(v), workspace)
+
+    return accelerations
+
+
+# %% Helper functions
+
+def _output(out, shape):
+
+    if out is None:
+        return numpy.empty(shape)
+
+    return check_shape(out, tuple(numpy.atleast_1d(shape)), copy=False)
+
+
+def _scratch(workspace, name, shape):
+
+    if workspace is None:
+        return numpy.empty(shape)
+
+    return workspace.get(name, shape)
+
+
+def _time_diffs(t, n, workspace):
+
+    # A single interval for regularly sampled data,
+    # otherwise the time since the previous sample for each sample but the first.
+    if not numpy.ndim(t):
+        return t
 
-    t_diffs = numpy.diff(t, prepend=numpy.nan)
-    v_diffs = numpy.diff(v, prepend=numpy.nan)
+    t = check_shape(t, (n,), copy=False)
 
-    return v_diffs / t_diffs
+    return numpy.subtract(t[1:], t[:-1], out=_scratch(workspace, 't_diffs', n - 1))
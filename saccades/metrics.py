@@ -15,12 +15,13 @@ def latency(gd):
 
     :param gd: Table of gaze data containing a saccade.
     :type gd: :class:`.gazedata.GazeData` \
-    (or :class:`.gazedata.Saccade`)
+    (or :class:`.gazedata.Saccade`), \
+    or :class:`.gazearray.GazeArray`
     :return: Latency (in the units of the *time* column).
     :rtype: float
     """
 
-    return gd['time'].iloc[0]
+    return numpy.asarray(gd['time'])[0]
 
 
 def duration(gd):
@@ -28,12 +29,15 @@ def duration(gd):
 
     :param gd: Table of gaze data containing a saccade.
     :type gd: :class:`.gazedata.GazeData` \
-    (or :class:`.gazedata.Saccade`)
+    (or :class:`.gazedata.Saccade`), \
+    or :class:`.gazearray.GazeArray`
     :return: Duration (in the units of the *time* column).
     :rtype: float
     """
 
-    return gd['time'].iloc[-1] - gd['time'].iloc[0]
+    time = numpy.asarray(gd['time'])
+
+    return time[-1] - time[0]
 
 
 def amplitude(gd):
@@ -46,12 +50,13 @@ def amplitude(gd):
 
     :param gd: Table of gaze data containing a saccade.
     :type gd: :class:`.gazedata.GazeData` \
-    (or :class:`.gazedata.Saccade`)
+    (or :class:`.gazedata.Saccade`), \
+    or :class:`.gazearray.GazeArray`
     :return: Amplitude.
     :rtype: float
     """
 
-    start_and_end = gd[['x', 'y']].iloc[[0, -1]]
+    start_and_end = numpy.asarray(gd[['x', 'y']])[[0, -1]]
 
     diffs = numpy.diff(start_and_end, axis=0)
     dist = numpy.linalg.norm(diffs)
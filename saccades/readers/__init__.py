@@ -3,3 +3,6 @@
 """
 
 from .basereader import BaseReader  # noqa: F401
+from .dataset import Dataset  # noqa: F401
+from .delimited import DelimitedReader  # noqa: F401
+from .eyelink import EyelinkReader  # noqa: F401
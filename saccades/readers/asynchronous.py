@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Loading data files from :mod:`asyncio` code.
+"""
+
+import asyncio
+
+from .basereader import BaseReader
+from .basereader import get_running_loop
+
+
+# %% Main functions
+
+async def load_many(paths, concurrency=4, reader_class=BaseReader, cols=None,
+                    executor=None, **kwargs):
+    """Load many data files, without blocking the event loop.
+
+    Each file is read and parsed in an executor. \
+    At most `concurrency` files are in progress at once, \
+    so that finished files do not pile up in memory \
+    faster than they can be used.
+
+    Additional keyword arguments are passed on to `reader_class`.
+
+    Use with `async for`, for example:
+
+    .. code-block:: python
+
+        async for path, blocks in load_many(paths, concurrency=8):
+            ...
+
+    :param paths: Paths to data files.
+    :type paths: iterable
+    :param concurrency: Maximum number of files to load at once.
+    :type concurrency: int
+    :param reader_class: Reader to use for each file.
+    :type reader_class: subclass of :class:`.BaseReader`
+    :param cols: Columns to include, as in :meth:`.BaseReader.get_blocks`.
+    :type cols: sequence
+    :param executor: Executor in which to load the files. \
+    Parsing is limited by the Python interpreter lock, \
+    so a :class:`concurrent.futures.ProcessPoolExecutor` \
+    makes better use of several cores, \
+    provided `reader_class` and its arguments are picklable. \
+    Defaults to the default executor of the event loop.
+    :type executor: :class:`concurrent.futures.Executor`
+    :return: *(path, blocks)* for each file as soon as it is loaded, \
+    where *blocks* is a list of :class:`.GazeData`. \
+    Files are not necessarily returned in the order of `paths`.
+    :rtype: async generator
+    """
+
+    loop = get_running_loop()
+    paths = iter(paths)
+    pending = {}
+
+    def start_next():
+        for path in paths:
+            future = loop.run_in_executor(executor, _load, reader_class, path, cols, kwargs)
+            pending[future] = path
+            return
+
+    for i in range(concurrency):
+        start_next()
+
+    try:
+
+        while pending:
+
+            done, not_done = await asyncio.wait(list(pending),
+                                                return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                path = pending.pop(future)
+                start_next()
+                yield path, future.result()
+
+    # Do not leave files loading if we stop early.
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# %% Helper functions
+
+# Loads one file in an executor.
+def _load(reader_class, path, cols, kwargs):
+
+    return list(reader_class(path, **kwargs).get_blocks(cols))
@@ -2,16 +2,61 @@
 """The base class for file readers.
 """
 
+import asyncio
+import codecs
+from concurrent import futures
+import functools
+import io
+import mmap
+import os
+import string
+import time
+
 import numpy
 import pandas
 import regex
 
 from .. import GazeData
 from ..gazedata import INIT_COLUMNS
+from .boundaries import BlockBoundary
+from .buffers import ColumnBuffer
+from .buffers import RowBuffer
+from .compression import is_compressed
+from .compression import open_text
+from .index import BlockIndex
+from .index import INDEX_SUFFIX
+from .index import file_fingerprint
 from .regexes import FILLER
 from .regexes import FLAGS
 from .regexes import FLOAT
 from .regexes import POS_INTEGER
+from .schema import Column
+
+
+# %% Constants
+
+BACKENDS = ['text', 'mmap']
+
+# Kinds of line, and the end of a block, as found by BaseReader._split().
+MESSAGE = 'message'
+DATA = 'data'
+ANNOTATION = 'annotation'
+BLOCK_END = 'block_end'
+
+# A line ending of any kind, as recognized in text mode.
+LINE_ENDINGS = regex.compile(rb'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+')
+
+# Integer columns cannot hold numpy.nan.
+MISSING_INTEGER = 'Missing value in integer column {} with no na_value'
+
+# asyncio.get_running_loop() is new in Python 3.7.
+# Inside a coroutine, get_event_loop() also returns the running loop.
+get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+RANGES_PER_WORKER = 4
+"""Number of byte ranges per worker process \
+when reading in parallel (see :meth:`BaseReader.get_blocks`).
+"""
 
 
 # %% Main class
@@ -26,48 +71,456 @@ class BaseReader:
 
     * :meth:`build_row_pattern` \
     to construct a custom regular expression for a row of data.
+    * :meth:`build_row_start` \
+    to skip lines that cannot begin a row of data \
+    without matching them against a custom row pattern.
     * :meth:`process_header` \
     to turn the raw text file header into something else.
     * :meth:`process_messages` \
     to turn raw text message lines into something else.
     * :meth:`process_data` \
     to modify gaze data according to any preceding messages.
+    * :meth:`process_annotations` \
+    to handle non-data lines within a block \
+    (if the reader has a :class:`.boundaries.BlockBoundary` that allows them).
     """
 
-    def __init__(self, file, sep=r'\s+', na_values=['.'], encoding='utf-8', **kwargs):
+    def __init__(self, file, sep=r'\s+', na_values=['.'], encoding='utf-8',
+                 typed=False, lazy_header=False, save_index=True, backend='text',
+                 cache=None, boundary=None, member=None, schema=None, **kwargs):
         """File is always opened in read-only mode.
 
         Additional keyword arguments are passed on to :func:`open`.
 
-        :param file: Path to a file containing gaze data.
+        :param file: Path to a file containing gaze data. \
+        Files ending in *.gz*, *.bz2*, *.xz*, or *.zip* \
+        are decompressed while reading \
+        (see :func:`.compression.open_text`).
         :type file: str
         :param sep: Column separator for rows of gaze data.
         :type sep: str
         :param na_values: Values to replace with `numpy.nan` \
         if present in a data row.
         :type na_values: sequence
+        :param typed: Convert data values to numbers while reading, \
+        rather than passing them on as strings \
+        (see :meth:`get_blocks`). \
+        This is faster and uses less memory for large files.
+        :type typed: bool
+        :param lazy_header: Do not read the header when initializing. \
+        Instead read it the first time the `header` attribute is needed, \
+        or capture it during the first call to :meth:`get_blocks`, \
+        so that the file is only read once.
+        :type lazy_header: bool
+        :param save_index: Save the block index (see :attr:`index`) \
+        in a file next to the data file, \
+        and reuse it if the data file has not changed.
+        :type save_index: bool
+        :param backend: How to read the file. \
+        `'text'` reads and decodes the file line by line. \
+        `'mmap'` maps the file into memory \
+        and matches rows of data in their raw bytes form, \
+        decoding only message lines. \
+        This is faster for large files, \
+        and lets several processes share the same cached file. \
+        The `'mmap'` backend requires an ASCII-compatible `encoding`. \
+        With the `'text'` backend, \
+        files in other encodings, such as UTF-16, \
+        can only be read from the beginning: \
+        they cannot be indexed, followed, or read in parallel.
+        :type backend: str
+        :param cache: Cache for the parsed contents of the file. \
+        If given, :meth:`get_blocks` reads the file through the cache. \
+        Data are then always converted to numbers, as if `typed` were set.
+        :type cache: :class:`.cache.ReaderCache`
+        :param boundary: Policy for where blocks begin and end. \
+        A string is used as the `start` pattern \
+        of a :class:`.boundaries.BlockBoundary`. \
+        Defaults to beginning a new block at every non-data line \
+        that follows a row of data.
+        :type boundary: :class:`.boundaries.BlockBoundary` or str
+        :param member: Name of the file to read within a *.zip* archive. \
+        Can be omitted if the archive contains only one file.
+        :type member: str
+        :param schema: Declarations of the columns of data, \
+        giving their source, data type, and whether to keep them by default. \
+        Columns not declared are read from the group of the same name \
+        in the row pattern, as `float64`. \
+        Values are converted directly to the declared types \
+        if the reader is `typed`, \
+        or else in :meth:`process_data`.
+        :type schema: sequence of :class:`.schema.Column`
+        :raises ValueError: If `backend` is not recognized, \
+        or is `'mmap'` for a compressed file \
+        or an encoding that is not ASCII-compatible.
         """
 
         self.filename = file
         self.sep = sep
         self.na_values = na_values
         self.encoding = encoding
+        self.typed = typed
+        self.save_index = save_index
+        self.cache = cache
         self.open_kwargs = kwargs
-
-        self.row_pattern = regex.compile(self.build_row_pattern(), flags=FLAGS)
-        self.header = self.process_header(self.get_header())
+        self.member = member
+        self.compressed = is_compressed(file)
+        self.schema = None if schema is None else list(schema)
+
+        if boundary is None:
+            boundary = BlockBoundary()
+        elif isinstance(boundary, str):
+            boundary = BlockBoundary(start=boundary)
+        self.boundary = boundary
+
+        if backend not in BACKENDS:
+            msg = 'Unrecognized backend {}. Use one of: {}.'
+            raise ValueError(msg.format(backend, ', '.join(BACKENDS)))
+        if (backend == 'mmap') and self.compressed:
+            raise ValueError('The mmap backend cannot read compressed files.')
+
+        # Lines can only be found in the raw bytes of the file,
+        # along with their byte offsets,
+        # if every line ends in a newline byte.
+        self._byte_offsets = _newline_is_byte(encoding)
+        if (backend == 'mmap') and not self._byte_offsets:
+            msg = 'The mmap backend requires an ASCII-compatible encoding, not {}.'
+            raise ValueError(msg.format(encoding))
+        self.backend = backend
+
+        self.row_pattern = _compile(self.build_row_pattern())
+
+        # Lines that cannot begin a row of data are rejected
+        # without running the row pattern.
+        row_start = self.build_row_start()
+        self._row_start = None if row_start is None else frozenset(row_start)
+
+        # The mmap backend matches raw bytes,
+        # so it needs a bytes version of the pattern and missing values.
+        if self.backend == 'mmap':
+            self.row_pattern_bytes = _compile(self.row_pattern.pattern.encode(encoding))
+            self._sep_pattern = _compile(sep.encode(encoding))
+            if row_start is not None:
+                self._row_start = self._row_start.union(c.encode(encoding) for c in row_start)
+            self._na_tokens = set(na_values)
+            self._na_tokens.update(v.encode(encoding) for v in na_values)
+        else:
+            self._na_tokens = na_values
+            self._sep_pattern = _compile(sep)
+
+        # Raw header lines, and the byte offset at which they end.
+        # These stay None until the header has been found.
+        self._header_lines = None
+        self._header_end = None
+
+        self._header = None
+        self._header_processed = False
+
+        self._index = None
+
+        # Stream to read instead of the file, while following it.
+        self._following = None
+
+        if not lazy_header:
+            self.header = self.process_header(self.get_header())
 
     def __enter__(self):
 
-        self.file = open(self.filename, mode='r',
-                         encoding=self.encoding, **self.open_kwargs)
+        if self._following is not None:
+            self.file = io.TextIOWrapper(io.BufferedReader(self._following),
+                                         encoding=self.encoding, **self.open_kwargs)
+            return self
+
+        self.file = open_text(self.filename, self.encoding,
+                              member=self.member, **self.open_kwargs)
+
+        if self.backend == 'mmap':
+            self._buffer = _map_file(self.file)
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
 
+        if isinstance(getattr(self, '_buffer', None), mmap.mmap):
+            self._buffer.close()
+
         self.file.close()
 
+    def __len__(self):
+
+        return len(self.index)
+
+    # Open files cannot be pickled,
+    # but a reader needs to be sent to other processes
+    # in order to read in parallel.
+    def __getstate__(self):
+
+        state = self.__dict__.copy()
+        state.pop('file', None)
+        state.pop('_buffer', None)
+
+        return state
+
+    @property
+    def header(self):
+        """The file header, after processing with :meth:`process_header`.
+        """
+
+        if not self._header_processed:
+            self.header = self.process_header(self.get_header())
+
+        return self._header
+
+    @header.setter
+    def header(self, value):
+
+        self._header = value
+        self._header_processed = True
+
+    @property
+    def index(self):
+        """Index of the positions of blocks in the file.
+
+        See :class:`.index.BlockIndex`. \
+        The index is built the first time it is needed. \
+        If `save_index` was set in :meth:`__init__`, \
+        the index is also saved next to the data file, \
+        and reused for as long as the data file does not change.
+        """
+
+        if self._index is None:
+
+            fingerprint = self._index_fingerprint()
+            index_file = self._index_filename()
+
+            if self.save_index and os.path.isfile(index_file):
+                try:
+                    index = BlockIndex.load(index_file)
+                    if index.fingerprint == fingerprint:
+                        self._index = index
+                except (OSError, ValueError, KeyError):
+                    pass
+
+            if self._index is None:
+
+                self._index = self.build_index()
+
+                # Failing to save the index is not a reason to stop reading.
+                if self.save_index:
+                    try:
+                        self._index.save(index_file)
+                    except OSError:
+                        pass
+
+        return self._index
+
+    @index.setter
+    def index(self, value):
+
+        self._index = value
+
+    def _index_fingerprint(self):
+
+        return file_fingerprint(self.filename,
+                                reader=type(self).__name__,
+                                pattern=self.row_pattern.pattern,
+                                encoding=self.encoding,
+                                boundary=self._boundary_patterns(),
+                                member=self.member)
+
+    def _index_filename(self):
+
+        if self.member is None:
+            return self.filename + INDEX_SUFFIX
+
+        # Keep the indexes of different members of an archive apart.
+        member = self.member.replace('/', '_').replace('\\', '_')
+
+        return '{}.{}{}'.format(self.filename, member, INDEX_SUFFIX)
+
+    def _boundary_patterns(self):
+
+        return [None if p is None else p.pattern
+                for p in [self.boundary.start, self.boundary.end]]
+
+    def _scan(self, start=0, stop=None):
+
+        # Yields the byte offset of each line
+        # (or None for encodings that are not ASCII-compatible),
+        # its decoded text (or None for data rows in the mmap backend),
+        # and its match to the row pattern (or None for messages).
+        # The end offset of the latest message line is kept in self._scan_end,
+        # and the end offset of the scan is left there at the end.
+        # A followed stream cannot be mapped, so is always read as text.
+        if (self.backend == 'mmap') and (self._following is None):
+            return self._scan_mmap(start, stop)
+
+        if not self._byte_offsets:
+            return self._scan_lines(start, stop)
+
+        return self._scan_text(start, stop)
+
+    def _scan_text(self, start, stop):
+
+        # Lines are read as bytes from the underlying binary buffer,
+        # so that we can keep track of their byte offsets in the file.
+        # They are then decoded with the same settings as the text file,
+        # and line endings are split and translated as in text mode.
+        raw = self.file.buffer
+        raw.seek(start)
+
+        encoding = self.file.encoding
+        errors = self.file.errors
+        pattern = self.row_pattern
+        row_start = self._row_start
+        offset = start
+
+        for raw_line in raw:
+
+            if (stop is not None) and (offset >= stop):
+                break
+
+            # Only lone carriage returns need the line to be split further.
+            if b'\r' in raw_line[:-2]:
+                lines = LINE_ENDINGS.findall(raw_line)
+            else:
+                lines = [raw_line]
+
+            for line in lines:
+
+                line_offset = offset
+                offset = offset + len(line)
+
+                line = line.decode(encoding, errors)
+                if line.endswith('\r\n'):
+                    line = line[:-2] + '\n'
+                elif line.endswith('\r'):
+                    line = line[:-1] + '\n'
+
+                if (row_start is None) or (line[:1] in row_start):
+                    match = pattern.fullmatch(line.rstrip('\n'))
+                else:
+                    match = None
+
+                if not match:
+                    self._scan_end = offset
+
+                yield line_offset, line, match
+
+        self._scan_end = offset
+
+    def _scan_lines(self, start, stop):
+
+        # Lines of other encodings are read in text mode,
+        # from the beginning of the file,
+        # and have no byte offsets.
+        if start or (stop is not None):
+            msg = 'Files encoded in {} can only be read from the beginning.'
+            raise ValueError(msg.format(self.encoding))
+
+        pattern = self.row_pattern
+        row_start = self._row_start
+        self._scan_end = None
+
+        self.file.seek(0)
+
+        for line in self.file:
+
+            if (row_start is None) or (line[:1] in row_start):
+                match = pattern.fullmatch(line.rstrip('\n'))
+            else:
+                match = None
+
+            yield None, line, match
+
+    def _scan_mmap(self, start, stop):
+
+        # Rows are matched in place in the mapped file,
+        # without first copying each line into a new object.
+        buffer = self._buffer
+        pattern = self.row_pattern_bytes
+        row_start = self._row_start
+        encoding = self.file.encoding
+        errors = self.file.errors
+
+        size = len(buffer)
+        if (stop is None) or (stop > size):
+            stop = size
+
+        offset = start
+
+        while offset < stop:
+
+            newline = buffer.find(b'\n', offset, size)
+            line_end = size if newline < 0 else newline + 1
+
+            # Exclude the line ending, as in text mode.
+            content_end = line_end
+            while (content_end > offset) and (buffer[content_end - 1] in b'\r\n'):
+                content_end = content_end - 1
+
+            if (row_start is None) or (buffer[offset:offset + 1] in row_start):
+                match = pattern.fullmatch(buffer, offset, content_end)
+            else:
+                match = None
+
+            if match:
+                yield offset, None, match
+            else:
+                line = buffer[offset:line_end].decode(encoding, errors)
+                if line.endswith('\r\n'):
+                    line = line[:-2] + '\n'
+                self._scan_end = line_end
+                yield offset, line, None
+
+            offset = line_end
+
+        self._scan_end = offset
+
+    def _split(self, start=0, stop=None):
+
+        # Yields the kind of each line (MESSAGE, DATA, or ANNOTATION),
+        # plus its offset, text, and match as in _scan().
+        # Also yields BLOCK_END with the byte offset at which a block ends,
+        # as soon as the line that ends it has been read.
+        boundary = self.boundary
+        has_content = False
+        getting_data = False
+
+        for offset, line, match in self._scan(start, stop):
+
+            has_content = True
+
+            if match:
+                getting_data = True
+                yield DATA, offset, line, match
+
+            elif not getting_data:
+                yield MESSAGE, offset, line, None
+
+            elif boundary.is_end(line):
+                yield ANNOTATION, offset, line, None
+                yield BLOCK_END, self._scan_end, None, None
+                has_content = False
+                getting_data = False
+
+            elif boundary.is_start(line):
+                yield BLOCK_END, offset, None, None
+                getting_data = False
+                yield MESSAGE, offset, line, None
+
+            else:
+                yield ANNOTATION, offset, line, None
+
+        if has_content:
+            yield BLOCK_END, self._scan_end, None, None
+
+    def _set_header_lines(self, lines, end):
+
+        if self._header_lines is None:
+            self._header_lines = list(lines)
+            self._header_end = end
+
     def build_row_pattern(self):
         """Build a regular expression for a row of data.
 
@@ -98,6 +551,32 @@ class BaseReader:
 
         return row
 
+    def build_row_start(self):
+        """Get the characters that a row of data can begin with.
+
+        Lines beginning with any other character \
+        are taken to be messages \
+        without being matched against the row pattern \
+        (see :meth:`build_row_pattern`). \
+        This is much faster for files with many long message lines.
+
+        Override this method in subclasses \
+        that override :meth:`build_row_pattern`, \
+        if their rows of data can only begin with certain characters.
+
+        :return: Possible first characters of a row of data, \
+        or `None` to match every line against the row pattern. \
+        Digits, since a row of data begins with the *time* column, \
+        unless a subclass overrides :meth:`build_row_pattern`.
+        :rtype: str
+        """
+
+        # A custom row pattern might begin with anything.
+        if type(self).build_row_pattern is not BaseReader.build_row_pattern:
+            return None
+
+        return string.digits
+
     def get_header(self):
         """Get the header section of the file.
 
@@ -108,16 +587,92 @@ class BaseReader:
         :rtype: str
         """
 
-        header_lines = []
+        if self._header_lines is None:
+
+            header_lines = []
+
+            with self:
+
+                for offset, line, match in self._scan():
+                    if match:
+                        break
+                    header_lines.append(line)
+                else:
+                    offset = self._scan_end
+
+            self._set_header_lines(header_lines, offset)
+
+        return ''.join(self._header_lines).rstrip('\n')
+
+    async def get_header_async(self, executor=None):
+        """Get the header section of the file, without blocking the event loop.
+
+        See :meth:`get_header`.
+
+        :param executor: Thread pool in which to read the file. \
+        Defaults to the default executor of the event loop.
+        :type executor: :class:`concurrent.futures.ThreadPoolExecutor`
+        :return: Header content.
+        :rtype: str
+        """
+
+        loop = get_running_loop()
+
+        return await loop.run_in_executor(executor, self.get_header)
+
+    def build_index(self, messages=None):
+        """Scan the file for the positions of blocks.
+
+        Blocks are found as described in :meth:`get_blocks`, \
+        but no data values are extracted.
+
+        :param messages: List to which the messages preceding each block are appended, \
+        processed as in :meth:`get_messages`, \
+        so that they do not need to be read again.
+        :type messages: list
+        :return: Index of blocks.
+        :rtype: :class:`.index.BlockIndex`
+        :raises ValueError: If the `encoding` is not ASCII-compatible \
+        (see :meth:`__init__`).
+        """
+
+        self._check_byte_offsets('indexed')
+
+        index = BlockIndex(fingerprint=self._index_fingerprint())
+
+        message_start = 0
+        data_start = None
+        n_messages = 0
+        n_rows = 0
+        lines = []
 
         with self:
 
-            for line in self.file:
-                if self.row_pattern.fullmatch(line.rstrip('\n')):
-                    break
-                header_lines.append(line)
+            for kind, offset, line, match in self._split():
+
+                if kind == DATA:
+                    if data_start is None:
+                        data_start = offset
+                    n_rows = n_rows + 1
+
+                elif kind == MESSAGE:
+                    n_messages = n_messages + 1
+                    if messages is not None:
+                        lines.append(line)
 
-        return ''.join(header_lines).rstrip('\n')
+                elif kind == BLOCK_END:
+                    if data_start is None:
+                        data_start = offset
+                    index.append(message_start, data_start, offset, n_messages, n_rows)
+                    if messages is not None:
+                        messages.append(self.process_messages(''.join(lines).rstrip('\n')))
+                        lines = []
+                    message_start = offset
+                    data_start = None
+                    n_messages = 0
+                    n_rows = 0
+
+        return index
 
     def process_header(self, header):
         """Process a raw text header.
@@ -141,11 +696,58 @@ class BaseReader:
 
         return messages
 
+    def process_annotations(self, data, annotations):
+        """Process non-data lines that occur within a block.
+
+        Annotations only occur if the reader's `boundary` allows them \
+        (see :meth:`__init__`). \
+        This method is then called after :meth:`process_data`.
+
+        Adds the annotations to the *annotations* attribute \
+        of the gaze data table.
+
+        Override this method in subclasses, \
+        finishing with a call to \
+        :meth:`process_annotations()`.
+
+        :param data: Block of gaze data, as returned by :meth:`process_data`.
+        :type data: :class:`GazeData`
+        :param annotations: Pairs of *(row, line)*, \
+        where *row* is the number of rows of data preceding the line \
+        within the block, \
+        and *line* is the raw text of the line.
+        :type annotations: list
+        :return: Modified data.
+        :rtype: :class:`GazeData`
+        """
+
+        data.annotations = annotations
+
+        return data
+
+    def convert_row(self, values):
+        """Convert the values of a row of data to numbers.
+
+        Missing values defined in :meth:`__init__` \
+        are converted to `numpy.nan`.
+
+        :param values: Data values as strings \
+        (or as bytes, for the `'mmap'` backend).
+        :type values: sequence
+        :return: Data values as floats.
+        :rtype: list
+        """
+
+        na_values = self._na_tokens
+
+        return [numpy.nan if v in na_values else float(v) for v in values]
+
     def process_data(self, data, messages):
         """Process data together with accompanying messages.
 
         * Inserts `numpy.nan` for any missing values \
-        defined in :meth:`__init__`.
+        defined in :meth:`__init__`, \
+        or the `na_value` of their column in the `schema`.
         * Ensures the essential columns are numeric.
         * Converts to :class:`GazeData`.
         * Adds the messages to the *messages* attribute \
@@ -156,85 +758,629 @@ class BaseReader:
         :meth:`process_data()` \
         to begin with or end with these steps.
 
+        If the data have already been converted to numbers \
+        (see the `typed` argument to :meth:`__init__`), \
+        the first two steps are skipped, \
+        and the values are used in :class:`GazeData` without copying.
+
         :param data: Block of gaze data.
-        :type data: dict of lists
+        :type data: dict of lists, or :class:`pandas.DataFrame`
         :messages: Messages preceding the block of data.
         :type messages: any
         :return: Modified data.
         :rtype: :class:`GazeData`
+        :raises ValueError: If an integer column in the `schema` \
+        has missing values but no `na_value`.
         """
 
-        df = pandas.DataFrame(data)
-        df = df.replace(self.na_values, numpy.nan)
-        df = df.astype({col: float for col in INIT_COLUMNS})
-
-        gd = GazeData(df)
+        if isinstance(data, pandas.DataFrame):
+            df = data
+        else:
+            df = pandas.DataFrame(data)
+            df = df.replace(self.na_values, numpy.nan)
+            dtypes = {col: float for col in INIT_COLUMNS}
+            declared = [] if self.schema is None else self.schema
+            for c in declared:
+                if c.name in df:
+                    df[c.name] = _fill_missing(df[c.name], c)
+                    dtypes[c.name] = c.dtype
+            df = df.astype(dtypes)
+
+        # The table was made just for this block, so it need not be copied.
+        gd = GazeData(df, copy=False)
         gd.messages = messages
 
         return gd
 
-    def get_blocks(self, cols=INIT_COLUMNS):
+    def get_blocks(self, cols=None, workers=None, where=None):
         """Get blocks of gaze data from the file.
 
         A block is a group of consecutive rows of data \
         without intervening non-data lines. \
         The occurrence of a non-data line \
-        marks the start of a new block.
+        marks the start of a new block. \
+        This can be changed with the `boundary` argument \
+        to :meth:`__init__`.
 
         Blocks are dictionaries of *{column: values}* \
         as can be used to initialize a :class:`pandas.DataFrame`. \
         Data values are left as unprocessed strings, \
         and passed on to :meth:`process_data` for processing. \
+        Alternatively, if the reader is `typed` (see :meth:`__init__`), \
+        data values are converted with :meth:`convert_row` \
+        as they are read, \
+        and blocks are passed on as a :class:`pandas.DataFrame`. \
         Any text messages preceding the block \
         are also passed on to :meth:`process_data`, \
         after processing with :meth:`process_messages`.
 
-        :param cols: Columns to include.
+        If the header has already been read, \
+        reading starts from the end of the header. \
+        Otherwise the header is captured along the way.
+
+        If `where` is given, it is called with the processed messages \
+        preceding each block, \
+        as soon as they are complete. \
+        Blocks for which it returns `False` are skipped. \
+        Their rows are only recognized as data, \
+        in order to find where the next block begins, \
+        and are never converted or passed on to :meth:`process_data`.
+
+        If `workers` is given, the file is split into byte ranges \
+        at block boundaries, \
+        and the ranges are read in parallel in separate processes. \
+        Blocks are still returned in the order they occur in the file, \
+        and processed in the same way. \
+        Subclasses must be importable in order to be read in parallel.
+
+        If the reader has a `cache` (see :meth:`__init__`), \
+        blocks are taken from the cache where possible, \
+        and `workers` is ignored. \
+        `workers` is also ignored for compressed files, \
+        since these can only be decompressed from the beginning, \
+        and for files whose `encoding` is not ASCII-compatible.
+
+        :param cols: Columns to include. \
+        Defaults to the columns kept in the `schema` (see :meth:`__init__`), \
+        or else *time*, *x*, and *y*.
         :type cols: sequence
+        :param workers: Number of worker processes. \
+        Defaults to reading in the current process.
+        :type workers: int
+        :param where: Function of the processed messages preceding a block, \
+        returning whether to include the block. \
+        Must be picklable in order to read in parallel.
+        :type where: callable
         :return: Successive blocks of data.
         :rtype: :class:`generator`
         """
 
-        message_buffer = []
-        data_buffer = {col: [] for col in cols}
-        getting_data = False
+        cols = self._default_cols(cols)
+
+        if self.cache is not None:
+            return self.cache.get_blocks(self, cols, where=where)
+
+        if (workers is not None) and self._byte_offsets and not self.compressed:
+            return self._read_blocks_parallel(cols, workers, where)
+
+        # If we already know where the header ends, we can skip it.
+        if self._header_end is None:
+            return self._read_blocks(cols, where=where)
+
+        return self._read_blocks(cols, start=self._header_end,
+                                 messages=self._header_lines, where=where)
+
+    def get_block(self, i, cols=None):
+        """Get a single block of gaze data from the file.
+
+        The block is read directly from its position in the file, \
+        as recorded in the :attr:`index`, \
+        without reading the blocks that precede it.
+
+        The number of blocks in the file is given by `len(reader)`.
+
+        :param i: Number of the block.
+        :type i: int
+        :param cols: Columns to include, as in :meth:`get_blocks`.
+        :type cols: sequence
+        :return: Block of data, as in :meth:`get_blocks`.
+        :rtype: :class:`GazeData`
+        :raises IndexError: If there is no such block.
+        """
+
+        message_start, data_start, data_end, n_messages, n_rows = self.index[i]
+        cols = self._default_cols(cols)
+
+        return next(self._read_blocks(cols, start=message_start, stop=data_end))
+
+    def get_messages(self, i):
+        """Get the messages preceding a single block, without reading its data.
+
+        :param i: Number of the block.
+        :type i: int
+        :return: Messages, after processing with :meth:`process_messages`.
+        :raises IndexError: If there is no such block.
+        """
+
+        message_start, data_start, data_end, n_messages, n_rows = self.index[i]
 
         with self:
+            lines = [line for offset, line, match in self._scan(message_start, data_start)]
 
-            for line in self.file:
+        return self.process_messages(''.join(lines).rstrip('\n'))
 
-                match = self.row_pattern.fullmatch(line.rstrip('\n'))
+    async def get_blocks_async(self, cols=None, where=None, executor=None):
+        """Get blocks of gaze data from the file, without blocking the event loop.
 
-                # We have a row of data.
-                if match:
-                    for col in cols:
-                        data_buffer[col].append(match.group(col))
+        An asynchronous iterator over the blocks of :meth:`get_blocks`, \
+        for use with `async for`. \
+        Each block is read in an executor.
 
-                    getting_data = True
+        To load many files at once, see :func:`.asynchronous.load_many`.
 
-                # We have a message.
-                else:
+        :param cols: Columns to include, as in :meth:`get_blocks`.
+        :type cols: sequence
+        :param where: Function selecting blocks, as in :meth:`get_blocks`.
+        :type where: callable
+        :param executor: Thread pool in which to read the file. \
+        Defaults to the default executor of the event loop.
+        :type executor: :class:`concurrent.futures.ThreadPoolExecutor`
+        :return: Successive blocks of data.
+        :rtype: async generator
+        """
 
-                    # But we were getting data,
-                    # so that means we are at the end of a block.
-                    if getting_data:
+        loop = get_running_loop()
+        blocks = self.get_blocks(cols, where=where)
+
+        # Close the file if we stop early, or are cancelled.
+        try:
+            while True:
+                block = await loop.run_in_executor(executor, next, blocks, None)
+                if block is None:
+                    return
+                yield block
+        finally:
+            blocks.close()
+
+    def follow(self, cols=None, source=None, poll_interval=1., timeout=None, where=None):
+        """Get blocks of gaze data from a file that is still being written.
+
+        Blocks are returned as soon as they are complete, \
+        that is, as soon as the line that begins the next block \
+        (or ends this one, see the `boundary` argument to :meth:`__init__`) \
+        has been written. \
+        Each block is returned exactly once. \
+        Each line is read just once, as it arrives, \
+        and only the unfinished block is kept in memory.
+
+        When no new data arrive for `timeout` seconds, \
+        or a `source` stream is closed, \
+        the last block is taken to be complete, and returned too.
+
+        Since the header is not complete until the first row of data, \
+        initialize the reader with `lazy_header` \
+        for files that may not yet contain any data.
+
+        Blocks are processed as in :meth:`get_blocks`.
+
+        :param cols: Columns to include, as in :meth:`get_blocks`.
+        :type cols: sequence
+        :param source: Open stream to read instead of the file, \
+        for example a pipe or :data:`sys.stdin`. \
+        The `file` argument to :meth:`__init__` then serves only as a label, \
+        and `lazy_header` must be set.
+        :type source: file object
+        :param poll_interval: Seconds to wait before checking the file \
+        for new data.
+        :type poll_interval: float
+        :param timeout: Seconds without new data after which to stop. \
+        Defaults to following the file forever. \
+        Not used for a `source` stream, which is read until it closes.
+        :type timeout: float
+        :param where: Function selecting blocks, as in :meth:`get_blocks`.
+        :type where: callable
+        :return: Successive blocks of data.
+        :rtype: :class:`generator`
+        :raises ValueError: If the `encoding` is not ASCII-compatible \
+        (see :meth:`__init__`).
+        """
 
-                        messages = ''.join(message_buffer).rstrip('\n')
-                        messages = self.process_messages(messages)
+        self._check_byte_offsets('followed')
+        cols = self._default_cols(cols)
+
+        # Blocks are read in a single pass over the stream,
+        # which waits for more data rather than ending.
+        # Text streams such as sys.stdin are read as the underlying bytes.
+        # A closed stream ends at once.
+        if source is None:
+            stream = open(self.filename, mode='rb')
+            start = 0 if self._header_lines is None else self._header_end
+            stream.seek(start)
+        else:
+            stream = getattr(source, 'buffer', source)
+            start = 0
+            timeout = 0
+
+        messages = [] if self._header_lines is None else self._header_lines
+        self._following = _FollowedStream(stream, start, poll_interval, timeout)
+
+        try:
+            yield from self._read_blocks(cols, start=start, messages=messages, where=where)
+
+        finally:
+            self._following = None
+            if source is None:
+                stream.close()
+
+    def _check_byte_offsets(self, action):
+
+        if not self._byte_offsets:
+            msg = 'Files encoded in {} cannot be {}, since lines are not found by byte offset.'
+            raise ValueError(msg.format(self.encoding, action))
+
+    def _read_blocks_parallel(self, cols, workers, where=None):
+
+        # Make sure the header is processed here, just once,
+        # so that the workers all have it.
+        self.header
+
+        ranges = self._split_ranges(workers * RANGES_PER_WORKER)
+
+        with futures.ProcessPoolExecutor(workers) as pool:
+
+            # Keep only a limited number of ranges in progress,
+            # so that finished blocks do not pile up in memory.
+            pending = []
+
+            for start, stop in ranges:
+
+                pending.append(pool.submit(_read_range, self, cols, start, stop, where))
+
+                if len(pending) > workers:
+                    yield from pending.pop(0).result()
+
+            for future in pending:
+                yield from future.result()
+
+    def _split_ranges(self, n):
+
+        size = os.path.getsize(self.filename)
+        starts = [0]
+
+        for i in range(1, n):
+            block_start = self._find_block_start(size * i // n)
+            if block_start > starts[-1]:
+                starts.append(block_start)
+
+        ends = starts[1:] + [size]
+
+        return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+    def _find_block_start(self, offset):
+
+        # Find the first block that begins at or after the byte offset.
+        with self:
+
+            # Skip the remains of any line we landed in the middle of.
+            if offset > 0:
+                self.file.buffer.seek(offset - 1)
+                offset = offset - 1 + len(self.file.buffer.readline())
+
+            for kind, block_end, line, match in self._split(offset):
+                if kind == BLOCK_END:
+                    return block_end
+
+            return self._scan_end
+
+    def _read_blocks(self, cols, start=0, stop=None, messages=(), where=None):
+
+        raw_blocks = self._read_raw_blocks(cols, self.typed, start, stop, messages, where)
+
+        for data_buffer, messages, annotations in raw_blocks:
+
+            if self.typed:
+                data_buffer = data_buffer.to_frame()
+
+            yield self._process_block(data_buffer, messages, annotations)
+
+    def _process_block(self, data, messages, annotations):
+
+        gd = self.process_data(data, self.process_messages(messages))
+
+        if self.boundary.annotates:
+            gd = self.process_annotations(gd, annotations)
+
+        return gd
+
+    def _read_raw_blocks(self, cols, typed, start=0, stop=None, messages=(), where=None):
+
+        # Yields unprocessed blocks,
+        # as a data buffer plus the raw text of the preceding messages,
+        # plus a list of annotations.
+        # Blocks rejected by where() are left out.
+        message_buffer = list(messages)
+        data_buffer = self._new_data_buffer(cols, typed)
+        annotations = []
+        n_rows = 0
+
+        # Whether the current block has been checked with where(),
+        # and whether to skip it.
+        checked = where is None
+        skip = False
+
+        extract = self._extractor(cols)
+        convert = self._converter(cols)
+        decode = (self.backend == 'mmap') and (self._following is None) and not typed
+
+        # Only a read from the start of the file can find the header.
+        find_header = (start == 0) and (self._header_lines is None)
+
+        with self:
+
+            for kind, offset, line, match in self._split(start, stop):
+
+                if kind == DATA:
+
+                    # The first row of data marks the end of the header.
+                    if find_header:
+                        self._set_header_lines(message_buffer, offset)
+                        find_header = False
+
+                    # The first row of data also completes the messages.
+                    if not checked:
+                        skip = not self._where(where, message_buffer)
+                        checked = True
+
+                    if skip:
+                        continue
+
+                    values = extract(match)
 
-                        yield self.process_data(data_buffer, messages)
+                    if typed:
+                        try:
+                            data_buffer.append(convert(values))
+                        except ValueError as error:
+                            msg = '{}, in row {} of a block.'
+                            raise ValueError(msg.format(error, n_rows)) from None
+                    else:
+                        if decode:
+                            values = [v.decode(self.encoding) for v in values]
+                        for col, value in zip(cols, values):
+                            data_buffer[col].append(value)
 
-                        message_buffer = []
-                        data_buffer = {col: [] for col in cols}
-                        getting_data = False
+                    n_rows = n_rows + 1
 
+                elif kind == MESSAGE:
                     message_buffer.append(line)
 
-        # We still have some data in the buffer at the end,
-        # so we put together the final block.
-        if message_buffer or data_buffer[cols[0]]:
+                elif kind == ANNOTATION:
+                    if not skip:
+                        annotations.append((n_rows, line.rstrip('\n')))
+
+                else:
+                    # A block of messages only.
+                    if not checked:
+                        skip = not self._where(where, message_buffer)
+
+                    if not skip:
+                        messages = ''.join(message_buffer).rstrip('\n')
+                        yield data_buffer, messages, annotations
+
+                    message_buffer = []
+                    data_buffer = self._new_data_buffer(cols, typed)
+                    annotations = []
+                    n_rows = 0
+                    checked = where is None
+                    skip = False
+
+            # No data at all, so the whole file is header.
+            if find_header:
+                self._set_header_lines(message_buffer, self._scan_end)
+
+        # Messages handed in but no lines left to read.
+        if message_buffer and (checked or self._where(where, message_buffer)):
+            yield data_buffer, ''.join(message_buffer).rstrip('\n'), annotations
+
+    def _where(self, where, message_lines):
+
+        return where(self.process_messages(''.join(message_lines).rstrip('\n')))
+
+    def _new_data_buffer(self, cols, typed):
+
+        if not typed:
+            return {col: [] for col in cols}
+
+        # Without a schema, everything is float.
+        if self.schema is None:
+            return RowBuffer(cols)
+
+        return ColumnBuffer(cols, [c.typecode for c in self._columns(cols)])
+
+    def _default_cols(self, cols):
+
+        if cols is not None:
+            return cols
+
+        if self.schema is None:
+            return INIT_COLUMNS
+
+        return [c.name for c in self.schema if c.keep]
+
+    def _columns(self, cols):
+
+        # Declarations for the requested columns.
+        declared = {} if self.schema is None else {c.name: c for c in self.schema}
+
+        return [declared.get(col, Column(col)) for col in cols]
+
+    def _extractor(self, cols):
+
+        # Gets the raw values of the requested columns from a row match.
+        # Only the requested columns are ever taken out of the row.
+        sources = [c.source for c in self._columns(cols)]
+
+        if all(isinstance(source, str) for source in sources):
+            if len(sources) == 1:
+                return lambda match: [match.group(sources[0])]
+            return lambda match: match.group(*sources)
+
+        # Values found by position need the row split into fields,
+        # but only once, however many of them there are.
+        sep = self._sep_pattern
+
+        def extract(match):
+            fields = sep.split(match.group(0))
+            return [fields[source] if isinstance(source, int) else match.group(source)
+                    for source in sources]
+
+        return extract
+
+    def _converter(self, cols):
+
+        # Converts raw values to numbers, filling in missing values as declared.
+        # Integer columns are parsed directly as int,
+        # since going through float would lose the precision of large values.
+        columns = self._columns(cols)
+        integers = [(i, c) for i, c in enumerate(columns) if c.is_integer]
+        filled = [(i, c.na_value) for i, c in enumerate(columns)
+                  if (c.na_value is not None) and not c.is_integer]
+
+        if not (integers or filled):
+            return self.convert_row
+
+        na_values = self._na_tokens
+
+        def convert(values):
+            row = self.convert_row(values)
+            for i, c in integers:
+                value = values[i]
+                if value not in na_values:
+                    row[i] = int(value)
+                elif c.na_value is None:
+                    raise ValueError(MISSING_INTEGER.format(c.name))
+                else:
+                    row[i] = c.na_value
+            for i, na_value in filled:
+                if row[i] != row[i]:
+                    row[i] = na_value
+            return row
+
+        return convert
+
+
+# %% Helper functions
+
+# Row patterns depend only on the reader class and its settings,
+# so are compiled just once for all readers that share them.
+@functools.lru_cache(maxsize=None)
+def _compile(pattern):
+
+    return regex.compile(pattern, flags=FLAGS)
+
+
+# Reads blocks from a byte range of a file in a worker process.
+def _read_range(reader, cols, start, stop, where=None):
+
+    return list(reader._read_blocks(cols, start=start, stop=stop, where=where))
+
+
+def _fill_missing(values, column):
+
+    # Fills missing values in a column of strings with its na_value.
+    missing = values.isna().to_numpy()
+
+    if not missing.any():
+        return values
+
+    if column.na_value is not None:
+        return values.fillna(column.na_value)
+
+    if column.is_integer:
+        msg = MISSING_INTEGER + ', in row {} of a block.'
+        raise ValueError(msg.format(column.name, missing.argmax()))
+
+    return values
+
+
+class _FollowedStream(io.RawIOBase):
+
+    # Bytes of a stream that is still being written,
+    # waiting for more to arrive when there are none to read,
+    # until none have arrived for `timeout` seconds.
+    # Positions count from the byte offset `start` in the stream,
+    # and can only be sought at the current position,
+    # since the stream is only read onward.
+    def __init__(self, stream, start, poll_interval, timeout):
+
+        super().__init__()
+
+        self._read = getattr(stream, 'read1', stream.read)
+        self._chunk = b''
+        self._position = start
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._last_data = time.monotonic()
+
+    def readable(self):
+
+        return True
+
+    def seekable(self):
+
+        return True
+
+    def tell(self):
+
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+
+        if whence == io.SEEK_CUR:
+            offset = self._position + offset
+
+        if (whence == io.SEEK_END) or (offset != self._position):
+            raise io.UnsupportedOperation('A followed stream can only be read onward.')
+
+        return offset
+
+    def readinto(self, b):
+
+        while not self._chunk:
+
+            self._chunk = self._read(len(b))
+
+            if self._chunk:
+                self._last_data = time.monotonic()
+            elif (self._timeout is not None) and (time.monotonic() - self._last_data >=
+                                                  self._timeout):
+                return 0
+            else:
+                time.sleep(self._poll_interval)
+
+        # Keep any more than was asked for, for the next read.
+        n = min(len(b), len(self._chunk))
+        b[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+        self._position = self._position + n
+
+        return n
+
+
+def _newline_is_byte(encoding):
+
+    # Encode a first character separately,
+    # since some encodings begin with a byte order mark.
+    encoder = codecs.getincrementalencoder(encoding)()
+    encoder.encode('0')
+
+    return encoder.encode('\n') == b'\n'
+
 
-            messages = ''.join(message_buffer).rstrip('\n')
-            messages = self.process_messages(messages)
+def _map_file(file):
 
-            yield self.process_data(data_buffer, messages)
+    # Empty files cannot be mapped,
+    # but an empty bytes object will do just as well.
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return b''
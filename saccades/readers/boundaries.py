@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Policies for dividing a data file into blocks.
+"""
+
+import regex
+
+from .regexes import FLAGS
+
+
+# %% Main class
+
+class BlockBoundary:
+    """Policy for where one block of data ends and the next begins.
+
+    By default, any non-data line following a row of data \
+    begins a new block.
+
+    If a `start` or `end` pattern is given, \
+    only lines matching these patterns separate blocks. \
+    Other non-data lines within a block no longer break it up, \
+    but are kept as annotations to the block (see :meth:`.BaseReader.process_annotations`).
+
+    Non-data lines before the first row of data of a block \
+    always count as messages preceding the block.
+    """
+
+    def __init__(self, start=None, end=None):
+        """Initialize a policy.
+
+        :param start: Regular expression for lines that begin a new block, \
+        for example `'TRIALID'`. \
+        The matching line is the first message preceding the new block.
+        :type start: str
+        :param end: Regular expression for lines that end a block, \
+        for example `'^END'`. \
+        The matching line is the last annotation to the block it ends.
+        :type end: str
+        """
+
+        self.start = None if start is None else regex.compile(start, flags=FLAGS)
+        self.end = None if end is None else regex.compile(end, flags=FLAGS)
+
+    @property
+    def annotates(self):
+        """Whether non-data lines can occur within a block.
+        """
+
+        return (self.start is not None) or (self.end is not None)
+
+    def is_start(self, line):
+        """Check whether a non-data line after a row of data begins a new block.
+
+        :param line: Non-data line.
+        :type line: str
+        :rtype: bool
+        """
+
+        if not self.annotates:
+            return True
+
+        return (self.start is not None) and (self.start.search(line) is not None)
+
+    def is_end(self, line):
+        """Check whether a non-data line after a row of data ends the block.
+
+        :param line: Non-data line.
+        :type line: str
+        :rtype: bool
+        """
+
+        return (self.end is not None) and (self.end.search(line) is not None)
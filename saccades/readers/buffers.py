@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Growable numeric buffers for collecting gaze data while reading.
+"""
+
+import array
+
+import numpy
+import pandas
+
+
+# %% Main class
+
+class RowBuffer:
+    """Growable table of numeric values, filled one row at a time.
+
+    Rows are stored consecutively in a single typed :class:`array.array`, \
+    which over-allocates as it grows. \
+    Each appended row is copied into the array as raw numbers, \
+    so the row itself (such as the list built by :meth:`.BaseReader.convert_row`) \
+    can be discarded straight away, \
+    rather than kept as a Python object until the whole table has been read. \
+    The filled table can be viewed as a :class:`pandas.DataFrame` \
+    without copying the values.
+    """
+
+    def __init__(self, columns, typecode='d'):
+        """Initialize an empty buffer.
+
+        :param columns: Column names.
+        :type columns: sequence
+        :param typecode: :mod:`array` type code for the values. \
+        Defaults to double precision float.
+        :type typecode: str
+        """
+
+        self.columns = list(columns)
+        self.values = array.array(typecode)
+
+    def __len__(self):
+
+        return len(self.values) // len(self.columns)
+
+    def append(self, row):
+        """Append a row of values.
+
+        :param row: One value for each column.
+        :type row: sequence
+        """
+
+        self.values.extend(row)
+
+    def extend(self, rows):
+        """Append several rows of values.
+
+        :param rows: Rows with one value for each column.
+        :type rows: :class:`RowBuffer`, \
+        or :class:`numpy.ndarray` of shape *(n, k)*, \
+        where *k* is the number of columns
+        """
+
+        if isinstance(rows, RowBuffer):
+            self.values.extend(rows.values)
+        else:
+            rows = numpy.ascontiguousarray(rows, dtype=self.values.typecode)
+            self.values.frombytes(rows.tobytes())
+
+    def to_array(self):
+        """View the buffer as an array.
+
+        No further rows can be appended once the buffer has been viewed.
+
+        :return: Array of shape *(n, k)*, \
+        where *n* is the number of rows and *k* the number of columns.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        arr = numpy.frombuffer(self.values, dtype=self.values.typecode)
+
+        return arr.reshape((len(self), len(self.columns)))
+
+    def to_columns(self):
+        """View the buffer as separate columns.
+
+        No further rows can be appended once the buffer has been viewed.
+
+        :return: Vector of values for each column.
+        :rtype: list of :class:`numpy.ndarray`
+        """
+
+        return list(self.to_array().T)
+
+    def to_frame(self):
+        """View the buffer as a table.
+
+        No further rows can be appended once the buffer has been viewed.
+
+        :return: Table with one column for each column of the buffer.
+        :rtype: :class:`pandas.DataFrame`
+        """
+
+        return pandas.DataFrame(self.to_array(), columns=self.columns, copy=False)
+
+
+class ColumnBuffer:
+    """Growable table of values of mixed types, filled one row at a time.
+
+    Each column is stored in its own typed :class:`array.array`. \
+    Used instead of :class:`RowBuffer` \
+    when columns have different data types \
+    (see :class:`.schema.Column`).
+    """
+
+    def __init__(self, columns, typecodes):
+        """Initialize an empty buffer.
+
+        :param columns: Column names.
+        :type columns: sequence
+        :param typecodes: :mod:`array` type code for each column.
+        :type typecodes: sequence
+        """
+
+        self.columns = list(columns)
+        self.values = [array.array(typecode) for typecode in typecodes]
+
+    def __len__(self):
+
+        return len(self.values[0]) if self.values else 0
+
+    def append(self, row):
+        """Append a row of values.
+
+        :param row: One value for each column.
+        :type row: sequence
+        """
+
+        for values, value in zip(self.values, row):
+            values.append(value)
+
+    def extend(self, rows):
+        """Append several rows of values.
+
+        :param rows: Rows with one value for each column.
+        :type rows: :class:`ColumnBuffer`, \
+        or :class:`numpy.ndarray` of shape *(n, k)*, \
+        where *k* is the number of columns
+        """
+
+        if isinstance(rows, ColumnBuffer):
+            for values, new_values in zip(self.values, rows.values):
+                values.extend(new_values)
+        else:
+            for i, values in enumerate(self.values):
+                column = numpy.ascontiguousarray(rows[:, i], dtype=values.typecode)
+                values.frombytes(column.tobytes())
+
+    def to_array(self):
+        """Copy the buffer into an array.
+
+        :return: Structured array with one field for each column.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        dtype = [(col, values.typecode) for col, values in zip(self.columns, self.values)]
+        arr = numpy.empty(len(self), dtype=dtype)
+
+        for col, values in zip(self.columns, self.values):
+            arr[col] = numpy.frombuffer(values, dtype=values.typecode)
+
+        return arr
+
+    def to_columns(self):
+        """View the buffer as separate columns.
+
+        No further rows can be appended once the buffer has been viewed.
+
+        :return: Vector of values for each column.
+        :rtype: list of :class:`numpy.ndarray`
+        """
+
+        return [numpy.frombuffer(values, dtype=values.typecode) for values in self.values]
+
+    def to_frame(self):
+        """View the buffer as a table.
+
+        No further rows can be appended once the buffer has been viewed.
+
+        :return: Table with one column for each column of the buffer.
+        :rtype: :class:`pandas.DataFrame`
+        """
+
+        data = dict(zip(self.columns, self.to_columns()))
+
+        return pandas.DataFrame(data, columns=self.columns)
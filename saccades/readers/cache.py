@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache of data read from text files.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy
+import pandas
+
+from .index import file_fingerprint
+
+
+COLUMN_FILE = 'column{}.npy'
+"""Name of the file holding the values of one column of a cache entry, \
+numbered by the position of the column.
+"""
+
+META_FILE = 'meta.json'
+"""Name of the file holding the messages and block positions \
+of a cache entry.
+"""
+
+LAYOUT = 'columns'
+"""Layout of the files of a cache entry, \
+so that entries stored in an earlier layout are not read.
+"""
+
+
+# %% Main class
+
+class ReaderCache:
+    """Cache of data read from text files.
+
+    The first time a file is read through the cache, \
+    each column of its data values is stored as a binary array, \
+    together with the raw text of its header and messages. \
+    Later reads of the same file memory-map the stored columns \
+    instead of parsing the text again.
+
+    Each entry is keyed on the path, size, and modification time of the file, \
+    and on the class, row pattern, block boundary, and column schema of the reader \
+    (see :meth:`.BaseReader.build_row_pattern`), \
+    so changes to any of these lead to the file being read again.
+
+    Headers, messages, and data are still passed through \
+    :meth:`.BaseReader.process_header`, \
+    :meth:`.BaseReader.process_messages`, \
+    :meth:`.BaseReader.process_data`, \
+    and :meth:`.BaseReader.process_annotations` on each read, \
+    as for a `typed` reader.
+
+    See the `cache` argument to :meth:`.BaseReader.__init__`.
+    """
+
+    def __init__(self, directory, max_size=None):
+        """Initialize a cache.
+
+        :param directory: Directory in which to store cache entries. \
+        Created if it does not yet exist.
+        :type directory: str
+        :param max_size: Maximum total size of the cache, in bytes. \
+        When the cache grows larger than this, \
+        the least recently used entries are removed. \
+        Defaults to no limit.
+        :type max_size: int
+        """
+
+        self.directory = directory
+        self.max_size = max_size
+
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, reader, cols):
+        """Get the key of the cache entry for a reader.
+
+        :param reader: Reader for a data file.
+        :type reader: :class:`.BaseReader`
+        :param cols: Columns to include.
+        :type cols: sequence
+        :return: Key.
+        :rtype: str
+        """
+
+        reader_class = type(reader)
+
+        fingerprint = file_fingerprint(reader.filename,
+                                       path=os.path.abspath(reader.filename),
+                                       member=reader.member,
+                                       reader='{}.{}'.format(reader_class.__module__,
+                                                             reader_class.__qualname__),
+                                       pattern=reader.row_pattern.pattern,
+                                       na_values=[str(v) for v in reader.na_values],
+                                       encoding=reader.encoding,
+                                       boundary=reader._boundary_patterns(),
+                                       cols=list(cols),
+                                       schema=[repr(c) for c in reader._columns(cols)],
+                                       layout=LAYOUT)
+
+        fingerprint = json.dumps(fingerprint, sort_keys=True)
+
+        return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+
+    def get_blocks(self, reader, cols, where=None):
+        """Get blocks of gaze data from the cache.
+
+        If the file is not yet in the cache, it is read and stored first. \
+        All blocks are stored, \
+        whether or not they are selected by `where`.
+
+        :param reader: Reader for a data file.
+        :type reader: :class:`.BaseReader`
+        :param cols: Columns to include.
+        :type cols: sequence
+        :param where: Function of the processed messages preceding a block, \
+        returning whether to include the block.
+        :type where: callable
+        :return: Successive blocks of data, \
+        as in :meth:`.BaseReader.get_blocks`.
+        :rtype: :class:`generator`
+        """
+
+        entry = os.path.join(self.directory, self.key(reader, cols))
+
+        if not os.path.isdir(entry):
+            self._store(reader, cols, entry)
+            self._evict(keep=entry)
+
+        yield from self._load(reader, cols, entry, where)
+
+    def clear(self):
+        """Remove all entries from the cache.
+        """
+
+        for entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def size(self):
+        """Get the total size of the cache.
+
+        :return: Size in bytes.
+        :rtype: int
+        """
+
+        return sum(_dir_size(entry) for entry in self._entries())
+
+    def _store(self, reader, cols, entry):
+
+        buffer = reader._new_data_buffer(cols, True)
+        blocks = []
+
+        # Read from the end of the header if we already know where it is.
+        if reader._header_end is None:
+            raw_blocks = reader._read_raw_blocks(cols, True)
+        else:
+            raw_blocks = reader._read_raw_blocks(cols, True,
+                                                 start=reader._header_end,
+                                                 messages=reader._header_lines)
+
+        for data_buffer, messages, annotations in raw_blocks:
+            row_start = len(buffer)
+            buffer.extend(data_buffer)
+            blocks.append([row_start, len(buffer), messages, annotations])
+
+        files = [COLUMN_FILE.format(i) for i in range(len(cols))]
+
+        meta = {'cols': list(cols),
+                'files': files,
+                'n_rows': len(buffer),
+                'header_lines': reader._header_lines,
+                'header_end': reader._header_end,
+                'blocks': blocks}
+
+        # Write to a temporary directory first,
+        # so that no other reader ever sees a half-written entry.
+        tmp = tempfile.mkdtemp(prefix='.tmp', dir=self.directory)
+
+        for filename, values in zip(files, buffer.to_columns()):
+            numpy.save(os.path.join(tmp, filename), values)
+
+        with open(os.path.join(tmp, META_FILE), mode='w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+        try:
+            os.rename(tmp, entry)
+        except OSError:
+            # Another reader got there first.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _load(self, reader, cols, entry, where=None):
+
+        meta_file = os.path.join(entry, META_FILE)
+
+        with open(meta_file, encoding='utf-8') as f:
+            meta = json.load(f)
+
+        # Mark the entry as recently used.
+        os.utime(meta_file)
+
+        # Copy-on-write, so that the data can still be modified in memory.
+        # Empty arrays cannot be memory-mapped.
+        mmap_mode = 'c' if meta['n_rows'] else None
+        columns = [numpy.load(os.path.join(entry, filename), mmap_mode=mmap_mode)
+                   for filename in meta['files']]
+
+        reader._set_header_lines(meta['header_lines'], meta['header_end'])
+
+        for row_start, row_end, messages, annotations in meta['blocks']:
+
+            if (where is not None) and not where(reader.process_messages(messages)):
+                continue
+
+            data = {col: values[row_start:row_end] for col, values in zip(cols, columns)}
+            df = pandas.DataFrame(data, columns=cols, copy=False)
+            annotations = [tuple(a) for a in annotations]
+
+            yield reader._process_block(df, messages, annotations)
+
+    def _entries(self):
+
+        names = os.listdir(self.directory)
+
+        return [os.path.join(self.directory, name) for name in names
+                if not name.startswith('.tmp')]
+
+    def _evict(self, keep=None):
+
+        if self.max_size is None:
+            return
+
+        entries = [entry for entry in self._entries() if entry != keep]
+        entries.sort(key=_last_used)
+
+        total = self.size()
+
+        while entries and (total > self.max_size):
+            entry = entries.pop(0)
+            total = total - _dir_size(entry)
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+# %% Helper functions
+
+def _dir_size(directory):
+
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for name in os.listdir(directory))
+
+
+def _last_used(entry):
+
+    try:
+        return os.path.getmtime(os.path.join(entry, META_FILE))
+    except OSError:
+        return 0.
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Opening compressed and archived data files.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zipfile
+
+
+# %% Constants
+
+OPENERS = {'.gz': gzip.GzipFile,
+           '.bz2': bz2.BZ2File,
+           '.xz': lzma.LZMAFile}
+"""File name suffixes of compressed files, \
+and the classes that decompress them.
+"""
+
+ARCHIVE_SUFFIX = '.zip'
+
+CHUNK_SIZE = 1024 * 1024
+"""Number of bytes decompressed at a time.
+"""
+
+
+# %% Main functions
+
+def is_compressed(filename):
+    """Check whether a file is compressed or archived, judging by its name.
+
+    :param filename: Path to a file.
+    :type filename: str
+    :rtype: bool
+    """
+
+    suffix = os.path.splitext(filename)[1].lower()
+
+    return (suffix in OPENERS) or (suffix == ARCHIVE_SUFFIX)
+
+
+def open_text(filename, encoding, member=None, **kwargs):
+    """Open a file for reading as text.
+
+    Files ending in *.gz*, *.bz2*, or *.xz* are decompressed as they are read. \
+    For *.zip* archives, one member of the archive is read. \
+    Compressed files are decompressed in large chunks, \
+    and never extracted to disk.
+
+    Additional keyword arguments are passed on to :func:`open` \
+    or :class:`io.TextIOWrapper`.
+
+    :param filename: Path to a file.
+    :type filename: str
+    :param encoding: Text encoding.
+    :type encoding: str
+    :param member: Name of the file to read within a *.zip* archive. \
+    Can be omitted if the archive contains only one file.
+    :type member: str
+    :return: Text file. \
+    Its `buffer` attribute gives the decompressed bytes, \
+    and supports seeking.
+    :rtype: :class:`io.TextIOWrapper`
+    :raises ValueError: If `member` is not given \
+    for an archive with several files, \
+    or is given for a file that is not an archive.
+    """
+
+    suffix = os.path.splitext(filename)[1].lower()
+
+    if suffix == ARCHIVE_SUFFIX:
+        raw = _open_member(filename, member)
+    elif member is not None:
+        msg = '{} is not a zip archive, so has no member {}.'
+        raise ValueError(msg.format(filename, member))
+    elif suffix in OPENERS:
+        raw = OPENERS[suffix](filename, mode='rb')
+    else:
+        return open(filename, mode='r', encoding=encoding, **kwargs)
+
+    buffer = io.BufferedReader(raw, buffer_size=CHUNK_SIZE)
+
+    return io.TextIOWrapper(buffer, encoding=encoding, **kwargs)
+
+
+# %% Helper functions
+
+def _open_member(filename, member):
+
+    # The member stays readable after the archive itself is closed,
+    # and closes the underlying file when it is closed in turn.
+    with zipfile.ZipFile(filename) as archive:
+
+        if member is None:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+            if len(names) != 1:
+                msg = '{} contains {} files. Choose one with the member argument.'
+                raise ValueError(msg.format(filename, len(names)))
+            member = names[0]
+
+        return archive.open(member)
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""Catalogs of many data files.
+"""
+
+import glob
+import os
+
+import pandas
+import regex
+
+from .basereader import BaseReader
+from .compression import open_text
+from .delimited import DelimitedReader
+from .eyelink import EyelinkReader
+from .index import INDEX_SUFFIX
+from .regexes import FLAGS
+from .regexes import NUMBER
+
+
+# %% Constants
+
+SNIFF_SIZE = 4096
+"""Number of characters at the start of a file used to guess its format.
+"""
+
+EYELINK_MARKERS = ['** CONVERTED FROM', 'MSG\t', 'START\t']
+"""Beginnings of lines that identify an EyeLink ASC file.
+"""
+
+DELIMITERS = {',': ',',
+              '\t': '\t',
+              ';': ';',
+              ' ': r'\s+'}
+"""Delimiters tried when guessing the format of a file, \
+and the corresponding `sep` argument for the reader.
+"""
+
+VALUE_PATTERN = regex.compile(r'{}|\.|NaN|nan|'.format(NUMBER), flags=FLAGS)
+
+
+# %% Guessing file formats
+
+def sniff(filename, encoding='utf-8', member=None):
+    """Guess the format of a data file from its first few lines.
+
+    * EyeLink ASC files are recognized by their header \
+    and message lines (see `EYELINK_MARKERS`).
+    * Delimited files are recognized by rows of numbers \
+    with the same number of columns, \
+    optionally after one row of column names.
+    * Anything else is left to :class:`.BaseReader`.
+
+    :param filename: Path to a data file.
+    :type filename: str
+    :param encoding: Text encoding.
+    :type encoding: str
+    :param member: Member of a *.zip* archive to look at.
+    :type member: str
+    :return: Reader class, and keyword arguments for it.
+    :rtype: tuple
+    """
+
+    with open_text(filename, encoding, member=member) as f:
+        sample = f.read(SNIFF_SIZE)
+
+    lines = sample.splitlines()
+
+    # The last line may have been cut short.
+    if len(sample) == SNIFF_SIZE:
+        lines = lines[:-1]
+
+    lines = [line for line in lines if line.strip()]
+
+    if any(line.startswith(marker) for line in lines for marker in EYELINK_MARKERS):
+        return EyelinkReader, {}
+
+    for delimiter, sep in DELIMITERS.items():
+        header_rows = _delimited_header_rows(lines, delimiter)
+        if header_rows is not None:
+            return DelimitedReader, {'sep': sep, 'header_rows': header_rows}
+
+    return BaseReader, {}
+
+
+def _delimited_header_rows(lines, delimiter):
+
+    # Number of header rows if the lines are delimited data, otherwise None.
+    if not lines:
+        return None
+
+    rows = [line.split() if delimiter == ' ' else line.split(delimiter) for line in lines]
+    n_fields = len(rows[-1])
+
+    if (n_fields < 3) or any(len(row) != n_fields for row in rows):
+        return None
+
+    numeric = [all(VALUE_PATTERN.fullmatch(v.strip()) for v in row) for row in rows]
+
+    if all(numeric[1:]):
+        return 0 if numeric[0] else 1
+
+    return None
+
+
+# %% Main class
+
+class Dataset:
+    """Catalog of the blocks of data in many files.
+
+    The catalog lists each block of each file, \
+    together with fields describing it, \
+    taken from the path of the file and the messages preceding the block. \
+    It is built from the block index of each file \
+    (see :attr:`.BaseReader.index`), \
+    so samples are not read until blocks are loaded.
+
+    Select blocks with :meth:`select`, \
+    then load them by iterating over the dataset.
+    """
+
+    def __init__(self, files, reader_class=None, path_pattern=None, block_fields=None,
+                 **kwargs):
+        """Additional keyword arguments are passed on to the reader for each file. \
+        The readers do not save their block index next to the data files \
+        unless `save_index=True` is given.
+
+        :param files: A directory, which is searched recursively, \
+        a glob pattern, or a sequence of paths.
+        :type files: str or sequence
+        :param reader_class: Reader for the files. \
+        Defaults to guessing the reader for each file with :func:`sniff`.
+        :type reader_class: subclass of :class:`.BaseReader`
+        :param path_pattern: Regular expression with named groups, \
+        for example `r'(?P<participant>\\w+)/session(?P<session>\\d+)'`. \
+        The groups are searched for in the path of each file, \
+        and added to the catalog as fields.
+        :type path_pattern: str
+        :param block_fields: Function of the processed messages preceding a block \
+        (see :meth:`.BaseReader.process_messages`), \
+        returning a dictionary of fields to add to the catalog for the block.
+        :type block_fields: callable
+        """
+
+        self.reader_class = reader_class
+        self.path_pattern = path_pattern
+        self.block_fields = block_fields
+        self.reader_kwargs = kwargs
+
+        self.paths = _find_files(files)
+        self._readers = {}
+        self._catalog = None
+
+    def __len__(self):
+
+        return len(self.catalog)
+
+    def __iter__(self):
+
+        for entry, gd in self.iter_blocks():
+            yield gd
+
+    @property
+    def catalog(self):
+        """Table of blocks, with one row for each block, \
+        and columns *path*, *block* (the number of the block within the file), \
+        *n_rows*, and any fields from `path_pattern` and `block_fields`.
+
+        Built the first time it is needed.
+        """
+
+        if self._catalog is None:
+            self._catalog = self.build_catalog()
+
+        return self._catalog
+
+    def reader(self, path):
+        """Get the reader for a file.
+
+        :param path: Path to one of the files in the dataset.
+        :type path: str
+        :rtype: :class:`.BaseReader`
+        """
+
+        if path not in self._readers:
+
+            if self.reader_class is None:
+                encoding = self.reader_kwargs.get('encoding', 'utf-8')
+                member = self.reader_kwargs.get('member')
+                reader_class, kwargs = sniff(path, encoding=encoding, member=member)
+            else:
+                reader_class, kwargs = self.reader_class, {}
+
+            kwargs.update(self.reader_kwargs)
+            kwargs.setdefault('lazy_header', True)
+            kwargs.setdefault('save_index', False)
+
+            self._readers[path] = reader_class(path, **kwargs)
+
+        return self._readers[path]
+
+    def build_catalog(self):
+        """Build the catalog of blocks.
+
+        :return: Catalog (see :attr:`catalog`).
+        :rtype: :class:`pandas.DataFrame`
+        """
+
+        path_pattern = self.path_pattern
+        if path_pattern is not None:
+            path_pattern = regex.compile(path_pattern, flags=FLAGS)
+
+        entries = []
+
+        for path in self.paths:
+
+            reader = self.reader(path)
+
+            path_fields = {}
+            if path_pattern is not None:
+                match = path_pattern.search(path)
+                if match:
+                    path_fields = match.groupdict()
+
+            # Collect the messages while building the index,
+            # rather than reading the file again for each block.
+            messages = None
+            if self.block_fields is not None:
+                messages = []
+                reader.index = reader.build_index(messages=messages)
+
+            for i, block in enumerate(reader.index):
+
+                entry = {'path': path, 'block': i, 'n_rows': block[4]}
+                entry.update(path_fields)
+
+                if messages is not None:
+                    entry.update(self.block_fields(messages[i]))
+
+                entries.append(entry)
+
+        columns = ['path', 'block', 'n_rows']
+        for entry in entries:
+            columns.extend(field for field in entry if field not in columns)
+
+        return pandas.DataFrame(entries, columns=columns)
+
+    def select(self, where=None, **fields):
+        """Select blocks from the catalog.
+
+        :param where: Boolean mask of the rows of the catalog to keep, \
+        or a query string for :meth:`pandas.DataFrame.query`.
+        :type where: sequence or str
+        :param fields: Values of catalog fields to keep. \
+        Give a list to keep any of several values.
+        :return: New dataset with only the selected blocks in its catalog.
+        :rtype: :class:`Dataset`
+        """
+
+        catalog = self.catalog
+
+        if isinstance(where, str):
+            catalog = catalog.query(where)
+        elif where is not None:
+            catalog = catalog[list(where)]
+
+        for field, value in fields.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            catalog = catalog[catalog[field].isin(values)]
+
+        selection = Dataset.__new__(Dataset)
+        selection.__dict__.update(self.__dict__)
+        selection.paths = list(pandas.unique(catalog['path']))
+        selection._catalog = catalog.reset_index(drop=True)
+
+        return selection
+
+    def iter_blocks(self, cols=None):
+        """Load the blocks in the catalog, one at a time.
+
+        Only the blocks in the catalog are read from their files.
+
+        :param cols: Columns to include, as in :meth:`.BaseReader.get_blocks`.
+        :type cols: sequence
+        :return: *(entry, data)* for each block, \
+        where *entry* is the block's row of the catalog as a dictionary.
+        :rtype: :class:`generator`
+        """
+
+        for entry in self.catalog.to_dict(orient='records'):
+            yield entry, self.reader(entry['path']).get_block(entry['block'], cols=cols)
+
+
+# %% Helper functions
+
+def _find_files(files):
+
+    if not isinstance(files, str):
+        return sorted(files)
+
+    if os.path.isdir(files):
+        files = os.path.join(files, '**', '*')
+
+    paths = glob.glob(files, recursive=True)
+
+    # Leave out block index files written next to the data files.
+    return sorted(path for path in paths
+                  if os.path.isfile(path) and not path.endswith(INDEX_SUFFIX))
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Reader for plain delimited files, such as CSV and TSV exports.
+"""
+
+import csv
+import string
+
+import numpy
+import pandas
+import regex
+
+from ..gazedata import INIT_COLUMNS
+from .basereader import BaseReader
+from .compression import CHUNK_SIZE
+from .compression import open_text
+from .regexes import FILLER
+from .regexes import FLAGS
+from .regexes import NUMBER
+from .regexes import SPACE
+
+
+# %% Constants
+
+CHUNK_ROWS = 100000
+"""Number of rows parsed at a time by the fast path \
+(see :class:`DelimitedReader`).
+"""
+
+
+# %% Main class
+
+class DelimitedReader(BaseReader):
+    """Read eye gaze data from a plain delimited file.
+
+    Files that contain nothing but rows of data, \
+    apart from a fixed number of header rows, \
+    are parsed in large chunks by the C tokenizer of :func:`pandas.read_csv`, \
+    rather than matching each line against a regular expression. \
+    The file is then a single block.
+
+    Files that turn out to contain messages or malformed rows \
+    are read as by :class:`BaseReader` instead, \
+    so the result is the same either way. \
+    Values that the tokenizer would accept but the row pattern would not, \
+    such as quoted or infinite numbers, \
+    also send the file down this path. \
+    So are reads of single blocks, or of parts of the file \
+    (see :meth:`.BaseReader.get_block` and :meth:`.BaseReader.get_blocks`).
+
+    Data values are always converted to numbers while reading.
+    """
+
+    def __init__(self, file, columns=None, header_rows=0, **kwargs):
+        """Column positions are resolved when initializing.
+
+        Other arguments are as for :meth:`.BaseReader.__init__`. \
+        The fast path needs a `sep` of a single character, or `'\\s+'`.
+
+        :param file: Path to a file containing gaze data.
+        :type file: str
+        :param columns: Source of each column of data, \
+        as a dictionary of *{column: position}*, \
+        where *position* is a column number counting from 0, \
+        or a column name given in the last header row. \
+        Must include *time*, *x*, and *y*. \
+        Defaults to the first three columns of the file.
+        :type columns: dict
+        :param header_rows: Number of rows preceding the data, \
+        such as a row of column names.
+        :type header_rows: int
+        :raises ValueError: If a column name is not found in the header row, \
+        or there is no header row to look in.
+        """
+
+        if columns is None:
+            columns = {col: pos for pos, col in enumerate(INIT_COLUMNS)}
+
+        self.header_rows = header_rows
+
+        kwargs['typed'] = True
+        sep = kwargs.get('sep', r'\s+')
+
+        if any(isinstance(pos, str) for pos in columns.values()):
+            names = _read_column_names(file, header_rows, sep,
+                                       kwargs.get('encoding', 'utf-8'),
+                                       kwargs.get('member'))
+            columns = {col: _find_column(names, pos) for col, pos in columns.items()}
+
+        self.columns = columns
+
+        super().__init__(file, **kwargs)
+
+    def build_row_pattern(self):
+        """Build a regular expression for a row of data.
+
+        A row of data contains values separated by the separator, \
+        with a number or a missing value at each position in `columns`, \
+        optionally surrounded by spaces, as :func:`pandas.read_csv` allows.
+
+        :return: Regular expression matching a row of data.
+        :rtype: str
+        """
+
+        value = '|'.join([NUMBER] + [regex.escape(v) for v in self.na_values])
+        field = '(?:(?!{}).)*'.format(self.sep)
+
+        # A separator that matches spaces already takes up those between values,
+        # and allowing them twice over would slow matching down.
+        if regex.fullmatch(self.sep, ' '):
+            row_start, space = SPACE, ''
+        else:
+            row_start, space = '', SPACE
+
+        positions = {pos: col for col, pos in self.columns.items()}
+        fields = ['{0}(?P<{1}>{2}){0}'.format(space, positions[pos], value)
+                  if pos in positions else field
+                  for pos in range(max(positions) + 1)]
+        row_end = '($|{}{})'.format(self.sep, FILLER)
+
+        return row_start + self.sep.join(fields) + row_end
+
+    def build_row_start(self):
+        """Get the characters that a row of data can begin with.
+
+        :return: Characters that can begin a number or missing value, \
+        or `None` if the first column is not in `columns`, \
+        so could hold anything.
+        :rtype: str
+        """
+
+        if (0 not in self.columns.values()) or ('' in self.na_values):
+            return None
+
+        return (string.digits + string.whitespace + '-+.' +
+                ''.join(v[0] for v in self.na_values))
+
+    def _read_raw_blocks(self, cols, typed, start=0, stop=None, messages=(), where=None):
+
+        # A file that is still being written cannot take the fast path.
+        if self._following is not None:
+            yield from super()._read_raw_blocks(cols, typed, start, stop, messages, where)
+            return
+
+        # Only a read of the whole file can take the fast path.
+        header = self.get_header()
+        whole_file = (stop is None) and ((start == 0) or
+                                         ((start == self._header_end) and
+                                          (list(messages) == self._header_lines)))
+
+        # If the first block is not wanted, there is no point parsing it,
+        # but the file might still turn out to contain other blocks.
+        wanted = (where is None) or self._where(where, self._header_lines)
+
+        if whole_file and wanted and (len(self._header_lines) == self.header_rows):
+            try:
+                data_buffer = self._read_delimited(cols)
+            except ValueError:
+                pass
+            else:
+                yield data_buffer, header, []
+                return
+
+        yield from super()._read_raw_blocks(cols, typed, start, stop, messages, where)
+
+    def _read_delimited(self, cols):
+
+        positions = [self.columns[col] for col in cols]
+        data_buffer = self._new_data_buffer(cols, True)
+
+        with self:
+
+            chunks = pandas.read_csv(self.file, sep=self.sep, engine='c',
+                                     header=None, skiprows=self.header_rows,
+                                     usecols=positions, dtype=float,
+                                     na_values=list(self.na_values), keep_default_na=False,
+                                     quoting=csv.QUOTE_NONE, chunksize=CHUNK_ROWS)
+
+            for chunk in chunks:
+                values = chunk[positions].to_numpy()
+                # The row pattern does not match infinite values.
+                if numpy.isinf(values).any():
+                    raise ValueError('{} contains infinite values.'.format(self.filename))
+                data_buffer.extend(values)
+
+        # The tokenizer skips blank lines, which would count as messages.
+        # So make sure every line was read as a row of data.
+        if len(data_buffer) + self.header_rows != self._count_lines():
+            raise ValueError('{} contains lines other than data.'.format(self.filename))
+
+        return data_buffer
+
+    def _count_lines(self):
+
+        n_lines = 0
+        last = b'\n'
+
+        with self:
+            for chunk in iter(lambda: self.file.buffer.read(CHUNK_SIZE), b''):
+                n_lines = n_lines + chunk.count(b'\n')
+                last = chunk[-1:]
+
+        # A last line without a line ending.
+        if last != b'\n':
+            n_lines = n_lines + 1
+
+        return n_lines
+
+
+# %% Helper functions
+
+def _read_column_names(file, header_rows, sep, encoding, member):
+
+    if header_rows < 1:
+        raise ValueError('Columns can only be found by name in a header row.')
+
+    with open_text(file, encoding, member=member) as f:
+        for i in range(header_rows):
+            line = f.readline()
+
+    return regex.split(sep, line.rstrip('\r\n'), flags=FLAGS)
+
+
+def _find_column(names, pos):
+
+    if not isinstance(pos, str):
+        return pos
+
+    try:
+        return names.index(pos)
+    except ValueError:
+        raise ValueError('No column named {} in header row.'.format(pos))
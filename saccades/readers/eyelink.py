@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""Reader for SR Research EyeLink ASC files.
+"""
+
+import string
+
+import numpy
+import regex
+
+from .basereader import BaseReader
+from .boundaries import BlockBoundary
+from .regexes import FILLER
+from .regexes import FLAGS
+from .regexes import FLOAT
+from .regexes import INTEGER
+from .regexes import NUMBER
+from .regexes import POS_INTEGER
+from .schema import Column
+
+
+# %% Constants
+
+SAMPLE_COLUMNS = ['time', 'x', 'y', 'pupil']
+
+SCHEMA = [Column('time', 'int64'),
+          Column('x'),
+          Column('y'),
+          Column('pupil', 'float32')]
+"""Default column schema (see :meth:`.BaseReader.__init__`). \
+EyeLink timestamps are whole milliseconds.
+"""
+
+EVENT_COLUMNS = {'EFIX': 'fixation',
+                 'ESACC': 'saccade',
+                 'EBLINK': 'blink'}
+"""Event end records, \
+and the names of the columns marking the samples within each event.
+"""
+
+EVENT_START_TYPES = ['SFIX', 'SSACC', 'SBLINK']
+
+EVENT_DTYPE = [('type', 'U6'),
+               ('eye', 'U1'),
+               ('start', 'i8'),
+               ('end', 'i8'),
+               ('start_index', 'i8'),
+               ('end_index', 'i8')]
+"""Fields of the array of events accompanying each block. \
+*start_index* and *end_index* give the slice of samples \
+that fall within the event.
+"""
+
+
+# %% Regular expressions
+
+EVENT_PATTERN = regex.compile(r'(?P<type>{})\s+(?P<eye>[LR])\s+(?P<start>{})\s+(?P<end>{})'
+                              .format('|'.join(EVENT_COLUMNS), POS_INTEGER, POS_INTEGER),
+                              flags=FLAGS)
+
+MESSAGE_PATTERN = regex.compile(r'MSG\s+(?P<time>{})\s?(?P<text>.*)'.format(POS_INTEGER),
+                                flags=FLAGS)
+
+DISPLAY_COORDS_PATTERN = regex.compile(r'DISPLAY_COORDS\s+(?P<left>{0})\s+(?P<top>{0})'
+                                       r'\s+(?P<right>{0})\s+(?P<bottom>{0})'.format(INTEGER),
+                                       flags=FLAGS)
+
+END_PATTERN = r'^END\b'
+"""Pattern for the line ending a recording.
+"""
+
+RATE_PATTERN = regex.compile(r'RATE\s+(?P<rate>{})'.format(NUMBER), flags=FLAGS)
+
+
+# %% Main class
+
+class EyelinkReader(BaseReader):
+    """Read eye gaze data from an EyeLink ASC file.
+
+    Samples, events, and messages are read in a single pass.
+
+    Each block is one recording, \
+    up to and including its *END* line. \
+    Event and message lines within a recording do not start a new block \
+    (see :class:`.boundaries.BlockBoundary`). \
+    Instead, they are collected in the `messages` attribute \
+    of the block's :class:`.GazeData`, which is a dictionary of:
+
+    * *preceding*: Text of the message lines preceding the recording, \
+    including its *START* line.
+    * *messages*: List of *(time, text)* of messages within the recording. \
+    Any other unrecognized lines within the recording are also included here, \
+    with *time* `None`.
+    * *events*: Array of events ending within the recording \
+    (see `EVENT_DTYPE`). \
+    Event start records are skipped, \
+    since the end records repeat the start time.
+    * *rate*: Sampling rate of the recording, if given.
+
+    Samples within fixations, saccades, and blinks \
+    are also marked in boolean columns (see `EVENT_COLUMNS`), \
+    so that for example the saccades marked by the tracker \
+    can be retrieved with :meth:`.GazeData.detect_saccades`.
+
+    The screen resolution is taken from the *DISPLAY_COORDS* message \
+    in the header.
+    """
+
+    def __init__(self, file, **kwargs):
+        """Data values are always converted to numbers while reading. \
+        Blocks end at *END* lines, unless another `boundary` is given. \
+        Columns are as in `SCHEMA`, unless another `schema` is given.
+
+        See :meth:`.BaseReader.__init__`.
+        """
+
+        kwargs['typed'] = True
+        kwargs.setdefault('boundary', BlockBoundary(end=END_PATTERN))
+        kwargs.setdefault('schema', SCHEMA)
+
+        super().__init__(file, **kwargs)
+
+    def build_row_pattern(self):
+        """Build a regular expression for a row of samples.
+
+        A row of samples begins with *time*, *x*, *y*, and *pupil* columns. \
+        For binocular recordings, these are the left eye columns.
+
+        :return: Regular expression matching a row of data.
+        :rtype: str
+        """
+
+        row_groups = ['(?P<{}>{})'.format(col, POS_INTEGER if col == 'time' else FLOAT)
+                      for col in SAMPLE_COLUMNS]
+        row_end = '($|{}{})'.format(self.sep, FILLER)
+
+        return self.sep.join(row_groups) + row_end
+
+    def build_row_start(self):
+        """Get the characters that a row of samples can begin with.
+
+        :return: Digits, since a row of samples begins with the *time* column.
+        :rtype: str
+        """
+
+        return string.digits
+
+    def process_header(self, header):
+        """Get the screen resolution and sampling rate from the header.
+
+        The screen resolution follows the EyeLink convention \
+        that *DISPLAY_COORDS* gives the first and last pixel \
+        in each direction.
+
+        :param header: Raw text header.
+        :type header: str
+        :return: *screen_res* and *rate*, or `None` if not present.
+        :rtype: dict
+        """
+
+        info = {'screen_res': None, 'rate': None}
+
+        match = DISPLAY_COORDS_PATTERN.search(header)
+        if match:
+            left, top, right, bottom = [int(c) for c in match.group('left', 'top',
+                                                                    'right', 'bottom')]
+            info['screen_res'] = [right - left + 1, bottom - top + 1]
+
+        match = RATE_PATTERN.search(header)
+        if match:
+            info['rate'] = float(match.group('rate'))
+
+        return info
+
+    def process_messages(self, messages):
+        """Get the sampling rate from the messages preceding a recording.
+
+        :param messages: Raw text of the preceding messages.
+        :type messages: str
+        :return: *preceding* text and *rate* \
+        (see :class:`EyelinkReader`).
+        :rtype: dict
+        """
+
+        match = RATE_PATTERN.search(messages)
+        rate = float(match.group('rate')) if match else None
+
+        return {'preceding': messages,
+                'messages': [],
+                'events': numpy.array([], dtype=EVENT_DTYPE),
+                'rate': rate}
+
+    def process_data(self, data, messages):
+        """Set the units and screen resolution of a recording.
+
+        :param data: Block of samples.
+        :type data: :class:`pandas.DataFrame`
+        :param messages: Messages preceding the recording \
+        (see :meth:`process_messages`).
+        :type messages: dict
+        :return: Modified data.
+        :rtype: :class:`GazeData`
+        """
+
+        gd = super().process_data(data, messages)
+
+        gd.time_units = 'ms'
+        gd.space_units = 'px'
+        # Each block gets its own copy, so changing one does not change the others.
+        gd.screen_res = list(self.header['screen_res'])
+
+        return gd
+
+    def process_annotations(self, data, annotations):
+        """Collect the events and messages within a recording.
+
+        Marks samples within events. \
+        Event and message lines that cannot be parsed, \
+        such as truncated lines, \
+        are kept as messages without a time.
+
+        :param data: Block of samples.
+        :type data: :class:`GazeData`
+        :param annotations: Event and message lines within the recording.
+        :type annotations: list
+        :return: Modified data.
+        :rtype: :class:`GazeData`
+        """
+
+        events = []
+        messages = []
+
+        for row, line in annotations:
+
+            kind = line.split(None, 1)[0] if line.strip() else ''
+
+            if kind in EVENT_COLUMNS:
+                match = EVENT_PATTERN.match(line)
+                if match:
+                    events.append((match.group('type'), match.group('eye'),
+                                   int(match.group('start')), int(match.group('end')), 0, 0))
+                else:
+                    messages.append((None, line))
+
+            elif kind == 'MSG':
+                match = MESSAGE_PATTERN.match(line)
+                if match:
+                    messages.append((int(match.group('time')), match.group('text')))
+                else:
+                    messages.append((None, line))
+
+            elif kind not in EVENT_START_TYPES + ['END']:
+                messages.append((None, line))
+
+        events = numpy.array(events, dtype=EVENT_DTYPE)
+        time = data['time'].to_numpy()
+
+        events['start_index'] = numpy.searchsorted(time, events['start'], side='left')
+        events['end_index'] = numpy.searchsorted(time, events['end'], side='right')
+
+        for event_type, col in EVENT_COLUMNS.items():
+            marked = numpy.full(len(data), False)
+            for event in events[events['type'] == event_type]:
+                marked[event['start_index']:event['end_index']] = True
+            data[col] = marked
+
+        data.messages['messages'] = messages
+        data.messages['events'] = events
+
+        return super().process_annotations(data, annotations)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Indexes of the positions of blocks of data in a file.
+"""
+
+import json
+import os
+
+
+INDEX_SUFFIX = '.blockindex.json'
+"""Suffix added to a data file name to give the name of its index file.
+"""
+
+
+# %% Helper functions
+
+def file_fingerprint(filename, **kwargs):
+    """Summarize the state of a file.
+
+    If the fingerprint of a file has not changed, \
+    information derived from the file can be reused.
+
+    Additional keyword arguments are added to the fingerprint. \
+    Use these for any settings that information derived from the file \
+    depends on.
+
+    :param filename: Path to a file.
+    :type filename: str
+    :return: File size and modification time, plus keyword arguments.
+    :rtype: dict
+    """
+
+    stat = os.stat(filename)
+
+    fingerprint = {'size': stat.st_size,
+                   'mtime': stat.st_mtime_ns}
+    fingerprint.update(kwargs)
+
+    return fingerprint
+
+
+# %% Main class
+
+class BlockIndex:
+    """Positions of the blocks of data in a file.
+
+    For each block, the index stores the following fields:
+
+    * *message_start*: Byte offset of the first message line \
+    preceding the block.
+    * *data_start*: Byte offset of the first row of data.
+    * *data_end*: Byte offset just after the end of the block. \
+    This is just after the last row of data, \
+    unless the reader's block boundary allows annotations within the block \
+    (see :class:`.boundaries.BlockBoundary`).
+    * *n_messages*: Number of message lines preceding the block.
+    * *n_rows*: Number of rows of data.
+    """
+
+    FIELDS = ['message_start', 'data_start', 'data_end', 'n_messages', 'n_rows']
+
+    def __init__(self, blocks=(), fingerprint=None):
+        """Initialize an index.
+
+        :param blocks: Fields for each block, \
+        in the order given by `FIELDS`.
+        :type blocks: sequence of sequences
+        :param fingerprint: Fingerprint of the indexed file \
+        (see :func:`file_fingerprint`).
+        :type fingerprint: dict
+        """
+
+        self.blocks = [tuple(b) for b in blocks]
+        self.fingerprint = fingerprint
+
+    def __len__(self):
+
+        return len(self.blocks)
+
+    def __getitem__(self, i):
+
+        return self.blocks[i]
+
+    def append(self, *fields):
+        """Add a block to the index.
+
+        :param fields: Fields for the block, in the order given by `FIELDS`.
+        """
+
+        self.blocks.append(fields)
+
+    def save(self, filename):
+        """Save the index to a file.
+
+        :param filename: Path to the index file.
+        :type filename: str
+        """
+
+        contents = {'fingerprint': self.fingerprint,
+                    'fields': self.FIELDS,
+                    'blocks': self.blocks}
+
+        with open(filename, mode='w', encoding='utf-8') as f:
+            json.dump(contents, f)
+
+    @classmethod
+    def load(cls, filename):
+        """Load an index from a file.
+
+        :param filename: Path to the index file.
+        :type filename: str
+        :return: The saved index.
+        :rtype: :class:`BlockIndex`
+        """
+
+        with open(filename, encoding='utf-8') as f:
+            contents = json.load(f)
+
+        return cls(contents['blocks'], fingerprint=contents['fingerprint'])
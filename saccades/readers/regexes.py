@@ -26,8 +26,21 @@ then a dot, \
 then 0 or more digits.
 """
 
-NUMBER = '({}|{})'.format(INTEGER, FLOAT)
-"""INTEGER or FLOAT.
+EXPONENT = r'[eE][-+]?\d+'
+"""An e, \
+then optionally a sign, \
+then 1 or more digits.
+"""
+
+NUMBER = r'([-+]?(\d+|\d*\.\d*)({})?)'.format(EXPONENT)
+"""Optionally a sign, \
+then INTEGER or FLOAT without their minus sign, \
+then optionally EXPONENT.
+"""
+
+SPACE = r'[^\S\r\n]*'
+"""0 or more whitespace characters, \
+other than line endings.
 """
 
 FILLER = '.*'
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Declarations of the columns of data to read from a file.
+"""
+
+import numpy
+
+
+# %% Constants
+
+TYPECODES = {'int8': 'b',
+             'uint8': 'B',
+             'int16': 'h',
+             'uint16': 'H',
+             'int32': 'i',
+             'uint32': 'I',
+             'int64': 'q',
+             'uint64': 'Q',
+             'float32': 'f',
+             'float64': 'd'}
+"""Supported data types, \
+and the :mod:`array` type codes used to collect them while reading.
+"""
+
+
+# %% Main class
+
+class Column:
+    """Declaration of a column of data.
+
+    See the `schema` argument to :meth:`.BaseReader.__init__`.
+    """
+
+    def __init__(self, name, dtype='float64', source=None, keep=True, na_value=None):
+        """Declare a column.
+
+        :param name: Name of the column in the gaze data table.
+        :type name: str
+        :param dtype: Data type of the column. \
+        Must be one of `TYPECODES`.
+        :type dtype: str or :class:`numpy.dtype`
+        :param source: Where to find the column in a row of data. \
+        Either the name of a group in the reader's row pattern \
+        (see :meth:`.BaseReader.build_row_pattern`), \
+        or the position of a value in the row, counting from 0. \
+        Defaults to the group with the same name as the column.
+        :type source: str or int
+        :param keep: Include the column in the gaze data \
+        if no columns are requested explicitly \
+        (see :meth:`.BaseReader.get_blocks`).
+        :type keep: bool
+        :param na_value: Value to store in place of missing values \
+        (see the `na_values` argument to :meth:`.BaseReader.__init__`). \
+        Defaults to `numpy.nan`. \
+        Integer columns cannot hold `numpy.nan`, \
+        so reading a missing value into an integer column \
+        without an `na_value` raises a :class:`ValueError`.
+        :type na_value: float or int
+        :raises ValueError: If `dtype` is not supported, \
+        or `na_value` cannot be held in an integer column.
+        """
+
+        dtype = numpy.dtype(dtype).name
+
+        if dtype not in TYPECODES:
+            msg = 'Unsupported dtype {}. Use one of: {}.'
+            raise ValueError(msg.format(dtype, ', '.join(TYPECODES)))
+
+        if (na_value is not None) and (numpy.dtype(dtype).kind in 'iu'):
+            info = numpy.iinfo(dtype)
+            if not ((na_value == int(na_value)) and (info.min <= na_value <= info.max)):
+                msg = 'Missing value {} cannot be held in a column of dtype {}.'
+                raise ValueError(msg.format(na_value, dtype))
+
+        self.name = name
+        self.dtype = dtype
+        self.source = name if source is None else source
+        self.keep = keep
+        self.na_value = na_value
+
+    def __repr__(self):
+
+        msg = 'Column({!r}, dtype={!r}, source={!r}, keep={!r}, na_value={!r})'
+
+        return msg.format(self.name, self.dtype, self.source, self.keep, self.na_value)
+
+    @property
+    def typecode(self):
+        """:mod:`array` type code for the column.
+        """
+
+        return TYPECODES[self.dtype]
+
+    @property
+    def is_integer(self):
+        """Whether the column holds integers.
+        """
+
+        return numpy.dtype(self.dtype).kind in 'iu'
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Implicit times of regularly sampled gaze data.
+"""
+
+import numpy
+
+from .tools import check_shape
+
+
+# %% Constants
+
+TIME_UNITS_PER_SECOND = {'ms': 1000.,
+                         's': 1.}
+"""Number of each unit of time in a second, \
+for converting sampling rates to intervals.
+"""
+
+MAX_GAP_FRACTION = 0.01
+"""Default largest fraction of samples that can follow a gap \
+for times to be considered regular.
+"""
+
+
+# %% Main class
+
+class Timebase:
+    """Times of gaze samples taken at a regular interval.
+
+    Rather than a time for every sample, \
+    a timebase holds only the time of the first sample, \
+    the interval between samples, \
+    and the positions and durations of any gaps, \
+    such as pauses in recording.
+
+    Timebases are immutable.
+    """
+
+    __slots__ = ['start', 'interval', 'gap_positions', 'gap_durations']
+
+    def __init__(self, start, interval, gap_positions=(), gap_durations=()):
+        """Initialize a timebase.
+
+        :param start: Time of the first sample.
+        :type start: float
+        :param interval: Time between consecutive samples.
+        :type interval: float
+        :param gap_positions: Positions of samples following a gap, in order.
+        :type gap_positions: sequence
+        :param gap_durations: Time of each gap in addition to the interval.
+        :type gap_durations: sequence
+        :raises ValueError: If the interval is not positive, \
+        or gap positions and durations do not match.
+        """
+
+        if not interval > 0:
+            msg = 'Interval between samples must be positive, not {}.'
+            raise ValueError(msg.format(interval))
+
+        self.start = start
+        self.interval = interval
+        self.gap_positions = check_shape(numpy.asarray(gap_positions, dtype=numpy.int64),
+                                         (None,))
+        self.gap_durations = check_shape(gap_durations, (len(self.gap_positions),))
+
+    @classmethod
+    def from_times(cls, times, interval=None, max_gap_fraction=MAX_GAP_FRACTION):
+        """Find the timebase of sample times, if they are regular.
+
+        Times are regular if consecutive times \
+        are always separated by the interval \
+        except at a few gaps, \
+        and the timebase reproduces them exactly.
+
+        :param times: Vector of sample times.
+        :type times: :class:`numpy.ndarray` \
+        or sequence convertible to :class:`numpy.ndarray`
+        :param interval: Expected time between samples. \
+        Defaults to the smallest time between samples.
+        :type interval: float
+        :param max_gap_fraction: Largest fraction of samples \
+        that can follow a gap.
+        :type max_gap_fraction: float
+        :return: Timebase of `times`, \
+        or `None` if they are not regular.
+        :rtype: :class:`Timebase`
+        """
+
+        times = check_shape(times, (None,), copy=False)
+
+        if len(times) < 2:
+            return None if (interval is None) or (len(times) == 0) else cls(times[0], interval)
+
+        diffs = numpy.diff(times)
+
+        if interval is None:
+            interval = diffs.min()
+        if not interval > 0:
+            return None
+
+        positions = numpy.flatnonzero(diffs != interval)
+        durations = diffs[positions] - interval
+
+        if (len(positions) > max_gap_fraction * len(times)) or (durations < 0).any():
+            return None
+
+        timebase = cls(times[0], interval, positions + 1, durations)
+
+        if not numpy.array_equal(timebase.times(len(times)), times):
+            return None
+
+        return timebase
+
+    def __repr__(self):
+
+        msg = 'Timebase(start={!r}, interval={!r}, {} gaps)'
+
+        return msg.format(self.start, self.interval, len(self.gap_positions))
+
+    def __eq__(self, other):
+
+        return (isinstance(other, Timebase) and
+                (self.start == other.start) and
+                (self.interval == other.interval) and
+                numpy.array_equal(self.gap_positions, other.gap_positions) and
+                numpy.array_equal(self.gap_durations, other.gap_durations))
+
+    __hash__ = None
+
+    @property
+    def is_uniform(self):
+        """Whether there are no gaps.
+        """
+
+        return len(self.gap_positions) == 0
+
+    def times(self, n):
+        """Get the times of samples.
+
+        :param n: Number of samples.
+        :type n: int
+        :return: Vector of times.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        times = numpy.arange(n) * self.interval + self.start
+
+        inside = self.gap_positions < n
+        if inside.any():
+            shifts = numpy.zeros(n, dtype=self.gap_durations.dtype)
+            shifts[self.gap_positions[inside]] = self.gap_durations[inside]
+            times = times + numpy.cumsum(shifts)
+
+        return times
+
+    def starting_at(self, start):
+        """Get the same timebase with a different start time.
+
+        :param start: Time of the first sample.
+        :type start: float
+        :rtype: :class:`Timebase`
+        """
+
+        return Timebase(start, self.interval, self.gap_positions, self.gap_durations)
+
+    def subset(self, start, stop):
+        """Get the timebase of a consecutive run of samples.
+
+        :param start: Position of the first sample.
+        :type start: int
+        :param stop: Position after the last sample.
+        :type stop: int
+        :rtype: :class:`Timebase`
+        """
+
+        before = self.gap_positions <= start
+        inside = (self.gap_positions > start) & (self.gap_positions < stop)
+
+        return Timebase(self.start + start * self.interval + self.gap_durations[before].sum(),
+                        self.interval,
+                        self.gap_positions[inside] - start,
+                        self.gap_durations[inside])
+
+    def correct_at_gaps(self, rates):
+        """Correct rates of change calculated with the regular interval.
+
+        Rates of change, such as velocities, \
+        can be calculated quickly by dividing by the interval \
+        rather than by the time between each pair of samples. \
+        This corrects them, in place, at the samples following gaps.
+
+        :param rates: Vector of rates of change, \
+        one for each sample.
+        :type rates: :class:`numpy.ndarray`
+        """
+
+        inside = self.gap_positions < len(rates)
+        positions = self.gap_positions[inside]
+
+        rates[positions] *= self.interval / (self.interval + self.gap_durations[inside])
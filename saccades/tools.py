@@ -22,7 +22,7 @@ def _blockmanager_to_dataframe(blockmanager):
     return pandas.DataFrame(array, index=rownames, columns=colnames)
 
 
-def check_shape(array, shape):
+def check_shape(array, shape, copy=True):
     """Check that an array is of an expected shape.
 
     :param array: Array to check.
@@ -33,13 +33,18 @@ def check_shape(array, shape):
     So for example `(None, 3)` allows for an *(n, 3)* array \
     for any value of *n*.
     :type shape: tuple
+    :param copy: Return a copy of `array`. \
+    Otherwise an array that is already a :class:`numpy.ndarray` \
+    is returned as it is, \
+    so callers must take care not to modify it.
+    :type copy: bool
     :return: `array`, converted to :class:`numpy.ndarray`.
     :rtype: :class:`numpy.ndarray`
     :raises ValueError: If `array` is not of the expected shape.
     """
 
     # numpy.array returns a copy not a view, so this should be ok.
-    array = numpy.array(array)
+    array = numpy.array(array) if copy else numpy.asarray(array)
 
     if array.ndim != len(shape):
         msg = 'Array has {} dimensions but {} required.'
@@ -63,7 +68,7 @@ def find_contiguous_subsets(x):
     :rtype: list
     """
 
-    x = check_shape(x, (None,))
+    x = check_shape(x, (None,), copy=False)
 
     # Special case because scipy.ndimage doesn't hande empty arrays.
     if len(x) == 0:
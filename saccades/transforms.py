@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""Chains of transformations of gaze coordinates.
+"""
+
+import numpy
+
+from .tools import check_shape
+
+
+# %% Main class
+
+class Transform:
+    """Chain of transformations of *(x, y)* gaze coordinates.
+
+    A chain is made up of affine transformations, \
+    such as translations and rotations, \
+    and conversions between pixels and degrees of visual angle. \
+    Neighbouring affine transformations are combined into one \
+    as the chain is built, \
+    so a chain is applied with as few passes over the coordinates as possible.
+
+    Chains are immutable. \
+    Combine them with :meth:`then`, \
+    and undo them with :meth:`inverse`.
+    """
+
+    __slots__ = ['steps']
+
+    def __init__(self, steps=()):
+        """Build a chain from a sequence of steps.
+
+        Usually it is easier to build a chain from the class methods \
+        :meth:`translation`, :meth:`rotation`, and :meth:`px_to_dva`.
+
+        :param steps: Steps of the chain, in order. \
+        Each step is either *('affine', matrix)*, \
+        where *matrix* is a *(3, 3)* matrix for homogeneous coordinates, \
+        or a conversion *(kind, viewing_dist_px)*, \
+        where *kind* is one of *'px_to_dva'*, *'dva_to_px'*, \
+        *'px_to_dva_exact'*, or *'dva_to_px_exact'* \
+        (see :meth:`px_to_dva`), \
+        and *viewing_dist_px* is the viewing distance in pixels.
+        :type steps: sequence
+        """
+
+        fused = []
+
+        for kind, value in steps:
+            if kind == 'affine':
+                value = check_shape(value, (3, 3)).astype(float)
+                if fused and (fused[-1][0] == 'affine'):
+                    value = numpy.matmul(value, fused.pop()[1])
+            fused.append((kind, value))
+
+        self.steps = tuple(fused)
+
+    @classmethod
+    def translation(cls, offset):
+        """Translate coordinates.
+
+        :param offset: *(x, y)* offset to add to coordinates.
+        :type offset: sequence
+        :rtype: :class:`Transform`
+        """
+
+        matrix = numpy.identity(3)
+        matrix[:2, 2] = check_shape(offset, (2,))
+
+        return cls([('affine', matrix)])
+
+    @classmethod
+    def rotation(cls, theta, origin=(0., 0.)):
+        """Rotate coordinates about a point.
+
+        See :func:`.geometry.rotate`.
+
+        :param theta: Angle of counterclockwise rotation, in radians.
+        :type theta: float
+        :param origin: *(x, y)* coordinates of origin about which to rotate.
+        :type origin: sequence
+        :rtype: :class:`Transform`
+        """
+
+        c = numpy.cos(theta)
+        s = numpy.sin(theta)
+        matrix = numpy.array([[c, -s, 0.],
+                              [s, c, 0.],
+                              [0., 0., 1.]])
+
+        origin = check_shape(origin, (2,))
+        to_origin = cls.translation(-origin)
+        back = cls.translation(origin)
+
+        return to_origin.then(cls([('affine', matrix)])).then(back)
+
+    @classmethod
+    def px_to_dva(cls, viewing_dist_px, exact=False):
+        """Convert coordinates from pixels to degrees of visual angle.
+
+        By default, *x* and *y* are converted separately \
+        (see :func:`.conversions.px_to_dva`), \
+        which is accurate near the axes \
+        but understates the eccentricity of points away from them. \
+        The exact conversion instead gives each point \
+        its true angular distance from the point nearest the eye, \
+        keeping its direction.
+
+        :param viewing_dist_px: Distance of eye from screen, in pixels.
+        :type viewing_dist_px: float
+        :param exact: Keep the eccentricity of each point exact.
+        :type exact: bool
+        :rtype: :class:`Transform`
+        """
+
+        kind = 'px_to_dva_exact' if exact else 'px_to_dva'
+
+        return cls([(kind, float(viewing_dist_px))])
+
+    def __repr__(self):
+
+        return 'Transform({})'.format(', '.join(kind for kind, value in self.steps))
+
+    def __eq__(self, other):
+
+        if not isinstance(other, Transform) or (len(self.steps) != len(other.steps)):
+            return False
+
+        return all((kind == other_kind) and numpy.allclose(value, other_value)
+                   for (kind, value), (other_kind, other_value) in zip(self.steps, other.steps))
+
+    __hash__ = None
+
+    @property
+    def is_identity(self):
+        """Whether the chain leaves coordinates unchanged.
+        """
+
+        return all((kind == 'affine') and numpy.allclose(value, numpy.identity(3))
+                   for kind, value in self.steps)
+
+    def then(self, other):
+        """Follow this chain by another.
+
+        :param other: Chain to apply after this one.
+        :type other: :class:`Transform`
+        :rtype: :class:`Transform`
+        """
+
+        return Transform(self.steps + other.steps)
+
+    def inverse(self):
+        """Get the chain that undoes this one.
+
+        :rtype: :class:`Transform`
+        """
+
+        inverses = {'px_to_dva': 'dva_to_px',
+                    'dva_to_px': 'px_to_dva',
+                    'px_to_dva_exact': 'dva_to_px_exact',
+                    'dva_to_px_exact': 'px_to_dva_exact'}
+        steps = []
+
+        for kind, value in reversed(self.steps):
+            if kind == 'affine':
+                steps.append((kind, numpy.linalg.inv(value)))
+            else:
+                steps.append((inverses[kind], value))
+
+        return Transform(steps)
+
+    def apply(self, x, y):
+        """Transform coordinates.
+
+        Each step makes a single pass over the coordinates, \
+        and the inputs are not modified. \
+        Coordinates keep their floating point type, \
+        so single precision coordinates stay single precision.
+
+        :param x: *x* coordinates.
+        :type x: :class:`numpy.ndarray`
+        :param y: *y* coordinates.
+        :type y: :class:`numpy.ndarray`
+        :return: Transformed *x* and *y* coordinates.
+        :rtype: tuple of :class:`numpy.ndarray`
+        """
+
+        x = _as_float(x)
+        y = _as_float(y)
+        owned = False
+
+        for kind, value in self.steps:
+
+            if kind == 'affine':
+                x, y = _affine(value, x, y)
+            elif kind == 'px_to_dva':
+                x, y = [_px_to_dva(v, value, owned) for v in (x, y)]
+            elif kind == 'dva_to_px':
+                x, y = [_dva_to_px(v, value, owned) for v in (x, y)]
+            elif kind == 'px_to_dva_exact':
+                x, y = _convert_radially(x, y, _px_to_dva, value, numpy.degrees(1. / value))
+            else:
+                x, y = _convert_radially(x, y, _dva_to_px, value, numpy.radians(value))
+
+            owned = True
+
+        if not owned:
+            x, y = x.copy(), y.copy()
+
+        return x, y
+
+
+# %% Helper functions
+
+def _as_float(values):
+
+    values = numpy.asarray(values)
+
+    if not numpy.issubdtype(values.dtype, numpy.floating):
+        values = values.astype(float)
+
+    return values
+
+
+def _affine(matrix, x, y):
+
+    # Python floats, unlike numpy scalars, never widen the coordinates.
+    (a, b, c), (d, e, f) = matrix[:2].tolist()
+
+    new_x = x * a
+    if b:
+        new_x += y * b
+    if c:
+        new_x += c
+
+    new_y = y * e
+    if d:
+        new_y += x * d
+    if f:
+        new_y += f
+
+    return new_x, new_y
+
+
+def _px_to_dva(px, viewing_dist_px, owned):
+
+    dva = numpy.divide(px, viewing_dist_px, out=px if owned else None)
+    numpy.arctan(dva, out=dva)
+
+    return numpy.degrees(dva, out=dva)
+
+
+def _dva_to_px(dva, viewing_dist_px, owned):
+
+    px = numpy.radians(dva, out=dva if owned else None)
+    numpy.tan(px, out=px)
+    px *= viewing_dist_px
+
+    return px
+
+
+def _convert_radially(x, y, convert, viewing_dist_px, slope):
+
+    # Convert the distance of each point from the origin, keeping its direction.
+    # At the origin itself, the slope of the conversion there is used.
+    r = numpy.hypot(x, y)
+    scale = convert(r.copy(), viewing_dist_px, True)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        scale /= r
+
+    scale[r == 0] = slope
+
+    return x * scale, y * scale
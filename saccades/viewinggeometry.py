@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Geometry of the screen and the eye, for converting between units.
+"""
+
+import functools
+
+import numpy
+
+from .conversions import _dva_to_px
+from .conversions import _px_to_dva
+from .conversions import _viewing_dist_to_px
+from .transforms import Transform
+
+
+# %% Constants
+
+SCREEN_ATTRIBUTES = ['screen_res', 'screen_diag', 'viewing_dist']
+"""Attributes of gaze data that make up its viewing geometry.
+"""
+
+
+# %% Main class
+
+class ViewingGeometry:
+    """Geometry of the screen and the eye.
+
+    Holds the viewing parameters *screen_res*, *screen_diag*, \
+    and *viewing_dist*, \
+    and the viewing distance in pixels calculated from them, \
+    so that converting between pixels and degrees of visual angle \
+    needs no further calculation or checking.
+
+    Viewing geometries are immutable and hashable. \
+    :meth:`shared` gives the same object for the same viewing parameters, \
+    so the trials of a whole experiment can share one.
+    """
+
+    __slots__ = SCREEN_ATTRIBUTES + ['viewing_dist_px']
+
+    def __init__(self, screen_res, screen_diag, viewing_dist):
+        """Initialize a viewing geometry.
+
+        :param screen_res: *(x, y)* screen resolution, in pixels.
+        :type screen_res: sequence
+        :param screen_diag: Diagonal size of screen, \
+        in the same units as `viewing_dist`.
+        :type screen_diag: float
+        :param viewing_dist: Distance of eye from screen, \
+        in the same units as `screen_diag`.
+        :type viewing_dist: float
+        :raises ValueError: If `screen_res` is not two numbers, \
+        or any parameter is not positive.
+        """
+
+        screen_res = tuple(float(res) for res in screen_res)
+
+        if len(screen_res) != 2:
+            msg = 'Screen resolution has {} values but 2 required.'
+            raise ValueError(msg.format(len(screen_res)))
+
+        for value in screen_res + (screen_diag, viewing_dist):
+            if not value > 0:
+                msg = 'Viewing parameters must be positive, not {}.'
+                raise ValueError(msg.format(value))
+
+        viewing_dist_px = _viewing_dist_to_px(viewing_dist,
+                                              screen_res=screen_res,
+                                              screen_diag=screen_diag)
+
+        object.__setattr__(self, 'screen_res', screen_res)
+        object.__setattr__(self, 'screen_diag', float(screen_diag))
+        object.__setattr__(self, 'viewing_dist', float(viewing_dist))
+        object.__setattr__(self, 'viewing_dist_px', numpy.float64(viewing_dist_px))
+
+    @classmethod
+    def shared(cls, screen_res, screen_diag, viewing_dist):
+        """Get the viewing geometry for some viewing parameters.
+
+        Takes the same arguments as :meth:`__init__`, \
+        but gives the same object every time it is called \
+        with the same viewing parameters.
+
+        :rtype: :class:`ViewingGeometry`
+        """
+
+        return _shared(cls, tuple(screen_res), screen_diag, viewing_dist)
+
+    def __setattr__(self, name, value):
+
+        raise AttributeError('Viewing geometries cannot be changed.')
+
+    def __repr__(self):
+
+        msg = 'ViewingGeometry(screen_res={!r}, screen_diag={!r}, viewing_dist={!r})'
+
+        return msg.format(self.screen_res, self.screen_diag, self.viewing_dist)
+
+    def __eq__(self, other):
+
+        return isinstance(other, ViewingGeometry) and (self._key() == other._key())
+
+    def __hash__(self):
+
+        return hash(self._key())
+
+    def _key(self):
+
+        return (self.screen_res, self.screen_diag, self.viewing_dist)
+
+    def px_to_dva(self, px):
+        """Convert pixels to degrees of visual angle.
+
+        See :func:`.conversions.px_to_dva`.
+
+        :param px: Pixel value(s).
+        :type px: scalar or array-like
+        :rtype: float or :class:`numpy.ndarray`
+        """
+
+        return _px_to_dva(px, self.viewing_dist_px)
+
+    def dva_to_px(self, dva):
+        """Convert degrees of visual angle to pixels.
+
+        See :func:`.conversions.dva_to_px`.
+
+        :param dva: Degree value(s).
+        :type dva: scalar or array-like
+        :rtype: float or :class:`numpy.ndarray`
+        """
+
+        return _dva_to_px(dva, self.viewing_dist_px)
+
+    def coords_to_dva(self, x, y, exact=False):
+        """Convert gaze coordinates from pixels to degrees of visual angle.
+
+        Coordinates are taken to be relative to the point on the screen \
+        nearest the eye.
+
+        :param x: *x* coordinates.
+        :type x: :class:`numpy.ndarray`
+        :param y: *y* coordinates.
+        :type y: :class:`numpy.ndarray`
+        :param exact: Keep the eccentricity of each point exact \
+        (see :meth:`.Transform.px_to_dva`), \
+        rather than converting *x* and *y* separately.
+        :type exact: bool
+        :return: *x* and *y* coordinates in degrees.
+        :rtype: tuple of :class:`numpy.ndarray`
+        """
+
+        return Transform.px_to_dva(self.viewing_dist_px, exact=exact).apply(x, y)
+
+    def coords_to_px(self, x, y, exact=False):
+        """Convert gaze coordinates from degrees of visual angle to pixels.
+
+        The inverse of :meth:`coords_to_dva`.
+
+        :rtype: tuple of :class:`numpy.ndarray`
+        """
+
+        transform = Transform.px_to_dva(self.viewing_dist_px, exact=exact)
+
+        return transform.inverse().apply(x, y)
+
+
+# %% Helper functions
+
+@functools.lru_cache(maxsize=None)
+def _shared(cls, screen_res, screen_diag, viewing_dist):
+
+    return cls(screen_res, screen_diag, viewing_dist)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Lightweight views of saccades within a table of gaze data.
+"""
+
+import functools
+
+import numpy
+
+from . import metrics
+
+
+# %% Constants
+
+PARENT_METHODS = ['px_to_dva',
+                  'dva_to_px']
+"""Methods of the parent table that are available from a view.
+"""
+
+
+# %% Main class
+
+class SaccadeView:
+    """View of the rows of a table of gaze data containing a saccade.
+
+    Returned by :meth:`.GazeData.detect_saccades` \
+    and :meth:`.GazeArray.detect_saccades` \
+    when views are requested. \
+    A view holds only a reference to its parent table \
+    and the positions of its first and last rows, \
+    so it costs almost nothing to create.
+
+    A view offers the same saccade metrics as :class:`.Saccade`, \
+    and reads columns and attributes from its parent. \
+    So changes to the parent are visible in the view.
+
+    Setting values or attributes \
+    turns the view into a copy of its rows, \
+    which is independent of the parent from then on \
+    (see :meth:`materialize`).
+    """
+
+    __slots__ = ['parent', 'start', 'stop', 'saccade_class', '_copy']
+
+    def __init__(self, parent, start, stop, saccade_class):
+        """Initialize a view.
+
+        :param parent: Table of gaze data containing the saccade.
+        :type parent: :class:`.GazeData` or :class:`.GazeArray`
+        :param start: Position of the first row of the saccade.
+        :type start: int
+        :param stop: Position after the last row of the saccade.
+        :type stop: int
+        :param saccade_class: Class of the copy made by :meth:`materialize`.
+        :type saccade_class: :class:`.Saccade` or :class:`.SaccadeArray`
+        """
+
+        object.__setattr__(self, 'parent', parent)
+        object.__setattr__(self, 'start', start)
+        object.__setattr__(self, 'stop', stop)
+        object.__setattr__(self, 'saccade_class', saccade_class)
+        object.__setattr__(self, '_copy', None)
+
+    def __len__(self):
+
+        return self.stop - self.start
+
+    def __contains__(self, col):
+
+        return col in self._source()
+
+    def __getitem__(self, key):
+
+        if self._copy is not None:
+            return self._copy[key]
+
+        if isinstance(key, str):
+            return numpy.asarray(self.parent[key])[self.start:self.stop]
+
+        if isinstance(key, list):
+            return numpy.column_stack([self[col] for col in key])
+
+        return self.materialize()[key]
+
+    def __setitem__(self, key, value):
+
+        self.materialize()[key] = value
+
+    def __array__(self, dtype=None):
+
+        if self._copy is not None:
+            return numpy.asarray(self._copy, dtype=dtype)
+
+        array = numpy.asarray(self.parent[self.start:self.stop])
+
+        return array if dtype is None else array.astype(dtype)
+
+    def __getattr__(self, name):
+
+        # This makes all suitable functions from metrics
+        # into methods of the SaccadeView class.
+        if name in metrics.SACCADE_METRICS:
+            return functools.partial(getattr(metrics, name), self)
+
+        # Viewing parameters and conversions come from the parent.
+        if not name.startswith('_'):
+            source = self._source()
+            if (name in PARENT_METHODS) or (name in source.viewing_parameters):
+                return getattr(source, name)
+
+        msg = '{!r} object has no attribute {!r}'
+        raise AttributeError(msg.format(type(self).__name__, name))
+
+    def __setattr__(self, name, value):
+
+        if name not in self._source().viewing_parameters:
+            msg = 'Cannot set attribute {!r} of a view.'
+            raise AttributeError(msg.format(name))
+
+        setattr(self.materialize(), name, value)
+
+    def __repr__(self):
+
+        msg = '{}(rows {} to {} of {})'
+
+        return msg.format(type(self).__name__, self.start, self.stop,
+                          type(self.parent).__name__)
+
+    @property
+    def is_materialized(self):
+        """Whether the view has been turned into a copy.
+        """
+
+        return self._copy is not None
+
+    def materialize(self):
+        """Copy the rows of the saccade.
+
+        The copy is made only once. \
+        From then on, the view reads and writes the copy, \
+        rather than the parent.
+
+        :return: Copy of the saccade.
+        :rtype: :class:`.Saccade` or :class:`.SaccadeArray`
+        """
+
+        if self._copy is None:
+            saccade = self.saccade_class(self.parent[self.start:self.stop])
+            object.__setattr__(self, '_copy', saccade)
+
+        return self._copy
+
+    def _source(self):
+
+        return self.parent if self._copy is None else self._copy
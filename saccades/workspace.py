@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Scratch memory reused between calculations.
+"""
+
+import numpy
+
+
+# %% Main class
+
+class Workspace:
+    """Scratch buffers for calculations, reused from one call to the next.
+
+    Functions such as :func:`.geometry.velocity` \
+    need temporary arrays as they go. \
+    Given a workspace, they take these from it instead of allocating them. \
+    Each buffer keeps the size of the largest array asked of it so far, \
+    so a loop over many trials that passes the same workspace to every call \
+    soon stops allocating temporary memory altogether. \
+    Passing `out` arrays to the same functions \
+    avoids allocating their results too.
+
+    Arrays given by a workspace are overwritten \
+    the next time the same buffer is asked for, \
+    so a workspace must not be shared between threads.
+    """
+
+    __slots__ = ['_buffers']
+
+    def __init__(self):
+        """Initialize an empty workspace.
+        """
+
+        self._buffers = {}
+
+    def __repr__(self):
+
+        return 'Workspace({} buffers, {} bytes)'.format(len(self._buffers), self.nbytes)
+
+    @property
+    def nbytes(self):
+        """Total size of the buffers, in bytes.
+        """
+
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def get(self, name, shape, dtype=float):
+        """Get a scratch array.
+
+        The contents of the array are undefined.
+
+        :param name: Name of the buffer, \
+        distinguishing it from others in use at the same time.
+        :type name: str
+        :param shape: Shape of the array.
+        :type shape: int or tuple
+        :param dtype: Data type of the array.
+        :type dtype: :class:`numpy.dtype` or convertible to :class:`numpy.dtype`
+        :return: View of the buffer.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        shape = tuple(numpy.atleast_1d(shape))
+        size = int(numpy.prod(shape))
+        key = (name, numpy.dtype(dtype))
+
+        buffer = self._buffers.get(key)
+        if (buffer is None) or (len(buffer) < size):
+            buffer = numpy.empty(size, dtype=dtype)
+            self._buffers[key] = buffer
+
+        return buffer[:size].reshape(shape)
+
+    def clear(self):
+        """Release all buffers.
+        """
+
+        self._buffers.clear()
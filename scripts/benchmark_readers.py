@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Benchmark reading speed, with and without the line prefilter.
+
+Run this from the project root directory:
+
+    python scripts/benchmark_readers.py [FILE ...]
+
+Defaults to the bundled EyeLink example files.
+"""
+
+import argparse
+import glob
+import os
+import time
+
+from saccades.readers import BaseReader
+from saccades.readers import EyelinkReader
+from saccades.readers.basereader import BACKENDS
+
+
+DEFAULT_FILES = os.path.join('tests', 'data', 'example_eyelink*.txt')
+
+
+# %% Readers without the prefilter
+
+class UnfilteredReader(BaseReader):
+
+    def build_row_start(self):
+        return None
+
+
+class UnfilteredEyelinkReader(EyelinkReader):
+
+    def build_row_start(self):
+        return None
+
+
+READERS = [('BaseReader', BaseReader, UnfilteredReader),
+           ('EyelinkReader', EyelinkReader, UnfilteredEyelinkReader)]
+
+
+# %% Benchmark
+
+def count_lines(filename):
+
+    with open(filename, mode='rb') as f:
+        return sum(1 for line in f)
+
+
+def lines_per_second(reader_class, filename, backend, repeats):
+
+    n_lines = count_lines(filename)
+    best = float('inf')
+
+    for i in range(repeats):
+        start = time.perf_counter()
+        reader = reader_class(filename, typed=True, save_index=False, backend=backend)
+        for block in reader.get_blocks():
+            pass
+        best = min(best, time.perf_counter() - start)
+
+    return n_lines / best
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='*', default=sorted(glob.glob(DEFAULT_FILES)))
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    row = '{:<32} {:<14} {:<6} {:>14} {:>14} {:>8}'
+    print(row.format('file', 'reader', 'backend', 'before (l/s)', 'after (l/s)', 'speedup'))
+
+    for filename in args.files:
+        for name, reader_class, unfiltered_class in READERS:
+            for backend in BACKENDS:
+                before = lines_per_second(unfiltered_class, filename, backend, args.repeats)
+                after = lines_per_second(reader_class, filename, backend, args.repeats)
+                print(row.format(os.path.basename(filename), name, backend,
+                                 '{:,.0f}'.format(before), '{:,.0f}'.format(after),
+                                 '{:.2f}x'.format(after / before)))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,8 +7,10 @@ import pytest
 
 from . import constants
 
+from saccades import GazeArray
 from saccades import GazeData
 from saccades import Saccade
+from saccades import SaccadeArray
 from saccades.readers import BaseReader
 
 
@@ -62,3 +64,23 @@ def gd_all(request):
 def sacc():
 
     return Saccade(constants.SACCADE, **constants.ATTRIBUTES)
+
+
+# %% gazearray objects
+
+@pytest.fixture
+def ga():
+
+    return GazeArray(constants.ARRAY, **constants.ATTRIBUTES)
+
+
+@pytest.fixture(params=params, ids=ids)
+def ga_all(request):
+
+    return GazeArray(request.param, **constants.ATTRIBUTES)
+
+
+@pytest.fixture
+def sacc_array():
+
+    return SaccadeArray(constants.SACCADE, **constants.ATTRIBUTES)
@@ -27,6 +27,13 @@ def get_header(filename, n):
     return ''.join(header).rstrip('\n')
 
 
+# Counts the lines in a text file.
+def get_n_lines(filename):
+
+    with open(filename, encoding='utf-8') as f:
+        return sum(1 for line in f)
+
+
 # Gets the needed init arguments from a dictionary of file information,
 # like those defined in DATA_FILES below.
 def get_basereader_args(file):
@@ -59,15 +66,23 @@ def image_file_ok(filepath):
 
 # %% Expected contents of modules
 
-MODULE_CONTENTS = ['GazeData',
+MODULE_CONTENTS = ['GazeArray',
+                   'GazeData',
                    'Saccade',
+                   'SaccadeArray',
+                   'SaccadeView',
+                   'TrialBatch',
+                   'ViewingGeometry',
                    'conversions',
                    'geometry',
                    'detection',
                    'metrics',
                    '__version__']
 
-READERS_CONTENTS = ['BaseReader']
+READERS_CONTENTS = ['BaseReader',
+                    'Dataset',
+                    'DelimitedReader',
+                    'EyelinkReader']
 
 
 # %% Data files
@@ -109,6 +124,20 @@ HEADER_SUBCLASS = {'screen_res': [576, 304],
                    'viewing_dist': 0.753}
 
 
+# %% EyeLink reader
+
+DATA_FILE_EYELINK = 'example_eyelink_events.txt'
+
+HEADER_EYELINK = {'screen_res': [641, 481],
+                  'rate': 250.}
+
+EYELINK_COUNTS = {'START': 84,
+                  'samples': 29578,
+                  'EFIX': 266,
+                  'ESACC': 213,
+                  'EBLINK': 23}
+
+
 # %% Data rows
 
 VALID_ROWS = [
@@ -164,6 +193,8 @@ DATA_IN = {'time': ['0', '1'],
 DATA_OUT = [[0., 2., 3.],
             [1., numpy.nan, numpy.nan]]
 
+DATA_IN_ROW = ['1', '.', '.']
+
 
 # %% Valid init types
 
@@ -233,6 +264,7 @@ VIEWING_DIST = 5.
 TARGET = [6., 10.]
 
 ATTRIBUTES = {'messages': None,
+              'annotations': None,
               'time_units': None,
               'space_units': 'px',
               'target': TARGET}
@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+import io
+import os
+import shutil
+import threading
+import time
 import types
 
 import numpy
+import pandas
 import pytest
 
 from . import constants
 
 from saccades import GazeData
 from saccades.readers import BaseReader
+from saccades.readers.basereader import BACKENDS
+from saccades.readers.boundaries import BlockBoundary
+from saccades.readers.cache import ReaderCache
+from saccades.readers.index import INDEX_SUFFIX
+from saccades.readers.index import BlockIndex
+from saccades.readers.schema import Column
 
 
 # %% __init__()
@@ -41,6 +54,42 @@ def test_row_pattern_non_match(r, row):
     assert r.row_pattern.fullmatch(row) is None
 
 
+def test_row_pattern_compiled_once():
+
+    r1 = BaseReader(constants.DATA_FILES[0]['file'])
+    r2 = BaseReader(constants.DATA_FILES[1]['file'])
+
+    assert r1.row_pattern is r2.row_pattern
+
+
+# %% build_row_start()
+
+@pytest.mark.parametrize('row', constants.VALID_ROWS + constants.COLUMN_PATTERNS)
+def test_build_row_start(r, row):
+
+    assert row[0] in r.build_row_start()
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_blocks_unfiltered(file, backend):
+
+    class UnfilteredReader(BaseReader):
+        def build_row_start(self):
+            return None
+
+    kwargs = constants.get_basereader_args(file)
+    blocks = list(BaseReader(save_index=False, backend=backend, **kwargs).get_blocks())
+    unfiltered_blocks = list(UnfilteredReader(save_index=False, backend=backend,
+                                              **kwargs).get_blocks())
+
+    assert len(blocks) == len(unfiltered_blocks)
+
+    for b, unfiltered_b in zip(blocks, unfiltered_blocks):
+        assert b.messages == unfiltered_b.messages
+        assert numpy.allclose(b, unfiltered_b, equal_nan=True)
+
+
 # %% header
 
 @pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
@@ -53,6 +102,35 @@ def test_header(file):
     assert r.file.closed
 
 
+# With a lazy header, the header should be the same,
+# whether it is read directly or captured while getting blocks.
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_lazy_header(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(lazy_header=True, **kwargs)
+
+    assert not hasattr(r, 'file')
+
+    assert r.header == file['header']
+    assert r.file.closed
+
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_lazy_header_from_get_blocks(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(lazy_header=True, **kwargs)
+
+    blocks = list(r.get_blocks())
+
+    if blocks:
+        assert blocks[0].messages == file['header']
+
+    assert r.header == file['header']
+
+
 # %% 'Dummy' methods.
 
 def test_process_header(r):
@@ -83,6 +161,25 @@ def test_process_data(r):
     assert numpy.allclose(gd, constants.DATA_OUT, equal_nan=True)
 
 
+def test_convert_row(r):
+
+    row = r.convert_row(constants.DATA_IN_ROW)
+
+    assert numpy.allclose(row, constants.DATA_OUT[1], equal_nan=True)
+
+
+def test_process_data_typed(r):
+
+    messages = 'foo'
+    data = pandas.DataFrame(constants.DATA_OUT, columns=['time', 'x', 'y'])
+
+    gd = r.process_data(data, messages)
+
+    assert isinstance(gd, GazeData)
+    assert gd.messages == messages
+    assert numpy.allclose(gd, constants.DATA_OUT, equal_nan=True)
+
+
 # %% get_blocks()
 
 @pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
@@ -112,6 +209,679 @@ def test_get_blocks(file):
     assert r.file.closed
 
 
+# Reading with typed buffers should give the same blocks as reading strings.
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_blocks_typed(file):
+
+    kwargs = constants.get_basereader_args(file)
+
+    blocks = list(BaseReader(**kwargs).get_blocks())
+    typed_blocks = list(BaseReader(typed=True, **kwargs).get_blocks())
+
+    assert len(typed_blocks) == len(blocks)
+
+    for b, typed_b in zip(blocks, typed_blocks):
+        assert isinstance(typed_b, GazeData)
+        assert typed_b.messages == b.messages
+        assert numpy.allclose(typed_b, b, equal_nan=True)
+
+
+# The mmap backend should give the same blocks as the default backend.
+
+@pytest.mark.parametrize('typed', [False, True])
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_blocks_mmap(file, typed):
+
+    kwargs = constants.get_basereader_args(file)
+
+    blocks = list(BaseReader(**kwargs).get_blocks())
+
+    r = BaseReader(backend='mmap', typed=typed, **kwargs)
+    mmap_blocks = list(r.get_blocks())
+
+    assert r.header == file['header']
+    assert len(mmap_blocks) == len(blocks)
+
+    for b, mmap_b in zip(blocks, mmap_blocks):
+        assert mmap_b.messages == b.messages
+        assert numpy.allclose(mmap_b, b, equal_nan=True)
+
+
+def test_backend_exception():
+
+    with pytest.raises(ValueError, match='backend'):
+        BaseReader(constants.DATA_FILES[0]['file'], backend='foo')
+
+
+# Files in encodings that are not ASCII-compatible are read in text mode.
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_get_blocks_utf16(tmp_path, typed):
+
+    file = constants.DATA_FILES[1]
+    filepath = os.path.join(str(tmp_path), 'utf16.txt')
+    with open(file['file'], encoding='utf-8') as f:
+        text = f.read()
+    with open(filepath, mode='w', encoding='utf-16') as f:
+        f.write(text)
+
+    kwargs = constants.get_basereader_args(file)
+    blocks = list(BaseReader(**kwargs).get_blocks())
+
+    kwargs['file'] = filepath
+    r = BaseReader(encoding='utf-16', typed=typed, **kwargs)
+    utf16_blocks = list(r.get_blocks(workers=2))
+
+    assert r.header == file['header']
+    assert len(utf16_blocks) == len(blocks)
+
+    for b, utf16_b in zip(blocks, utf16_blocks):
+        assert utf16_b.messages == b.messages
+        assert numpy.allclose(utf16_b, b, equal_nan=True)
+
+    # Blocks cannot be found by byte offset.
+    with pytest.raises(ValueError, match='utf-16'):
+        r.build_index()
+    with pytest.raises(ValueError, match='utf-16'):
+        next(r.follow())
+    with pytest.raises(ValueError, match='ASCII'):
+        BaseReader(filepath, encoding='utf-16', backend='mmap')
+
+
+def test_get_blocks_carriage_returns(tmp_path):
+
+    file = constants.DATA_FILES[-2]
+    filepath = os.path.join(str(tmp_path), 'cr.txt')
+    with open(file['file'], encoding='utf-8') as f:
+        text = f.read()
+    with open(filepath, mode='w', encoding='utf-8', newline='\r') as f:
+        f.write(text)
+
+    kwargs = constants.get_basereader_args(file)
+    blocks = list(BaseReader(**kwargs).get_blocks())
+
+    kwargs['file'] = filepath
+    r = BaseReader(save_index=False, **kwargs)
+    cr_blocks = list(r.get_blocks())
+
+    assert r.header == file['header']
+    assert len(cr_blocks) == len(blocks) == len(r)
+
+    for b, cr_b in zip(blocks, cr_blocks):
+        assert cr_b.messages == b.messages
+        assert numpy.allclose(cr_b, b, equal_nan=True)
+
+    assert numpy.allclose(r.get_block(-1), blocks[-1], equal_nan=True)
+
+
+# Reading in parallel should give the same blocks as reading serially.
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_blocks_parallel(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(typed=True, **kwargs)
+
+    blocks = list(r.get_blocks())
+    parallel_blocks = list(r.get_blocks(workers=2))
+
+    assert len(parallel_blocks) == len(blocks)
+
+    for b, parallel_b in zip(blocks, parallel_blocks):
+        assert parallel_b.messages == b.messages
+        assert numpy.allclose(parallel_b, b, equal_nan=True)
+
+
+@pytest.mark.parametrize('n', [1, 2, 7, 100])
+def test_split_ranges(n):
+
+    r = BaseReader(constants.DATA_FILES[-2]['file'], save_index=False)
+    block_starts = [b[0] for b in r.index]
+
+    ranges = r._split_ranges(n)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == os.path.getsize(r.filename)
+
+    for (start, stop), (next_start, next_stop) in zip(ranges[:-1], ranges[1:]):
+        assert stop == next_start
+        assert next_start in block_starts
+
+
+# %% Block index
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_len(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(save_index=False, **kwargs)
+
+    assert len(r) == len(list(r.get_blocks()))
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_block(file, backend):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(save_index=False, backend=backend, **kwargs)
+
+    blocks = list(r.get_blocks())
+
+    for i in [0, len(blocks) // 2, -1][:len(blocks)]:
+        b = r.get_block(i)
+        assert b.messages == blocks[i].messages
+        assert numpy.allclose(b, blocks[i], equal_nan=True)
+
+    assert r.file.closed
+
+
+def test_get_block_exception():
+
+    r = BaseReader(constants.DATA_FILES[0]['file'], save_index=False)
+
+    with pytest.raises(IndexError):
+        r.get_block(len(r))
+
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_messages(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(save_index=False, **kwargs)
+
+    blocks = list(r.get_blocks())
+
+    for i in range(len(blocks)):
+        assert r.get_messages(i) == blocks[i].messages
+
+    assert r.file.closed
+
+
+def test_saved_index(tmp_path):
+
+    filepath = str(tmp_path / constants.DATA_FILES[-1]['filename'])
+    shutil.copy(constants.DATA_FILES[-1]['file'], filepath)
+
+    index = BaseReader(filepath).index
+    index_file = filepath + INDEX_SUFFIX
+
+    assert os.path.isfile(index_file)
+    assert BlockIndex.load(index_file).blocks == index.blocks
+
+    # A new reader should reuse the saved index rather than build a new one.
+    r = BaseReader(filepath)
+    r.build_index = None
+    assert r.index.blocks == index.blocks
+
+
+def test_saved_index_invalidated(tmp_path):
+
+    filepath = str(tmp_path / constants.DATA_FILES[-1]['filename'])
+    shutil.copy(constants.DATA_FILES[-1]['file'], filepath)
+
+    n_blocks = len(BaseReader(filepath))
+
+    with open(filepath, mode='a', encoding='utf-8') as f:
+        f.write('foo\n0 1.0 2.0\n')
+
+    assert len(BaseReader(filepath)) == n_blocks + 1
+
+
+# %% Column schema
+
+SCHEMA = [Column('time', 'int64'),
+          Column('x', 'float32'),
+          Column('y', 'float32'),
+          Column('flag', 'uint8', source=3),
+          Column('extra', source=3, keep=False)]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('typed', [False, True])
+def test_schema(typed, backend):
+
+    r = BaseReader(constants.DATA_FILES[-1]['file'], schema=SCHEMA, typed=typed,
+                   backend=backend, save_index=False)
+    unschematic_r = BaseReader(constants.DATA_FILES[-1]['file'], save_index=False)
+
+    gd = next(r.get_blocks())
+    expected = next(unschematic_r.get_blocks())
+
+    assert list(gd.columns) == ['time', 'x', 'y', 'flag']
+    assert list(gd.dtypes) == [numpy.int64, numpy.float32, numpy.float32, numpy.uint8]
+    assert numpy.allclose(gd[['time', 'x', 'y']], expected, equal_nan=True)
+    assert (gd['flag'] == 1).all()
+
+
+def test_schema_cols():
+
+    r = BaseReader(constants.DATA_FILES[-1]['file'], schema=SCHEMA, typed=True,
+                   save_index=False)
+
+    gd = r.get_block(0, cols=['time', 'x', 'y', 'extra'])
+
+    assert gd['extra'].dtype == numpy.float64
+    assert (gd['extra'] == 1.).all()
+
+
+# Columns that are not read should not change which lines are rows of data.
+def test_schema_unread_position():
+
+    schema = SCHEMA + [Column('far', source=100, keep=False)]
+    r = BaseReader(constants.DATA_FILES[-1]['file'], schema=schema, typed=True,
+                   save_index=False)
+    expected = BaseReader(constants.DATA_FILES[-1]['file'], schema=SCHEMA, typed=True,
+                          save_index=False)
+
+    assert len(list(r.get_blocks())) == len(list(expected.get_blocks()))
+    assert len(r) == len(expected)
+
+
+def test_schema_cache(tmp_path):
+
+    cache = ReaderCache(str(tmp_path / 'cache'))
+    blocks = list(BaseReader(constants.DATA_FILES[-1]['file'], schema=SCHEMA,
+                             typed=True).get_blocks())
+
+    for i in range(2):
+
+        r = BaseReader(constants.DATA_FILES[-1]['file'], schema=SCHEMA, cache=cache)
+        cached_blocks = list(r.get_blocks())
+
+        assert len(cached_blocks) == len(blocks)
+        assert list(cached_blocks[0].dtypes) == list(blocks[0].dtypes)
+        assert numpy.allclose(cached_blocks[-1], blocks[-1], equal_nan=True)
+
+
+# Integer columns need a value to fill in for missing values.
+
+MISSING_ROWS = 'foo\n1 1.0 2.0 1\n2 . . .\n3 1.0 2.0 0\n'
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('typed', [False, True])
+def test_schema_na_value(tmp_path, typed, backend):
+
+    filepath = os.path.join(str(tmp_path), 'missing.txt')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(MISSING_ROWS)
+
+    schema = [Column('flag', 'uint8', source=3, na_value=255),
+              Column('extra', source=3, na_value=-1.)]
+    r = BaseReader(filepath, schema=schema, typed=typed, backend=backend, save_index=False)
+
+    gd = next(r.get_blocks(cols=['time', 'x', 'y', 'flag', 'extra']))
+
+    assert gd['flag'].dtype == numpy.uint8
+    assert list(gd['flag']) == [1, 255, 0]
+    assert list(gd['extra']) == [1., -1., 0.]
+    assert numpy.isnan(gd['x'][1])
+
+
+# Large integers should not lose precision on the way through float.
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('typed', [False, True])
+def test_schema_int64(tmp_path, typed, backend):
+
+    big = 2 ** 53 + 1
+    filepath = os.path.join(str(tmp_path), 'big.txt')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write('foo\n1 1.0 2.0 {}\n'.format(big))
+
+    r = BaseReader(filepath, schema=[Column('big', 'int64', source=3)], typed=typed,
+                   backend=backend, save_index=False)
+
+    gd = next(r.get_blocks(cols=['time', 'x', 'y', 'big']))
+
+    assert gd['big'].iloc[0] == big
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('typed', [False, True])
+def test_schema_na_value_exception(tmp_path, typed, backend):
+
+    filepath = os.path.join(str(tmp_path), 'missing.txt')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(MISSING_ROWS)
+
+    r = BaseReader(filepath, schema=[Column('flag', 'uint8', source=3)], typed=typed,
+                   backend=backend, save_index=False)
+
+    with pytest.raises(ValueError, match='column flag .* row 1 '):
+        next(r.get_blocks(cols=['time', 'x', 'y', 'flag']))
+
+
+# %% Block boundaries
+
+EYELINK_FILE = os.path.join(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+
+
+def test_boundary_annotations():
+
+    n_default = len(list(BaseReader(EYELINK_FILE, save_index=False).get_blocks()))
+
+    r = BaseReader(EYELINK_FILE, save_index=False, boundary=BlockBoundary(end=r'^END\b'))
+    blocks = list(r.get_blocks())
+
+    assert len(blocks) == constants.EYELINK_COUNTS['START']
+    assert len(blocks) < n_default
+    assert sum(len(b) for b in blocks) == constants.EYELINK_COUNTS['samples']
+
+    for b in blocks:
+        assert b.annotations[-1][1].startswith('END')
+        assert all(0 <= row <= len(b) for row, line in b.annotations)
+
+
+def test_boundary_default_no_annotations(r):
+
+    for b in r.get_blocks():
+        assert b.annotations is None
+
+
+def test_boundary_start_string():
+
+    r = BaseReader(EYELINK_FILE, save_index=False, boundary=r'^START\b')
+    blocks = list(r.get_blocks())
+
+    assert len(blocks) == constants.EYELINK_COUNTS['START']
+    assert all(b.messages.startswith('START') for b in blocks[1:])
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_get_block_boundary(backend):
+
+    r = BaseReader(EYELINK_FILE, save_index=False, backend=backend,
+                   boundary=BlockBoundary(end=r'^END\b'))
+
+    blocks = list(r.get_blocks())
+
+    assert len(r) == len(blocks)
+
+    for i in [0, len(blocks) // 2, -1]:
+        b = r.get_block(i)
+        assert b.messages == blocks[i].messages
+        assert b.annotations == blocks[i].annotations
+        assert numpy.allclose(b, blocks[i], equal_nan=True)
+
+
+def test_get_blocks_parallel_boundary():
+
+    r = BaseReader(EYELINK_FILE, save_index=False, boundary=BlockBoundary(end=r'^END\b'))
+
+    blocks = list(r.get_blocks())
+    parallel_blocks = list(r.get_blocks(workers=2))
+
+    assert len(parallel_blocks) == len(blocks)
+    assert [b.annotations for b in parallel_blocks] == [b.annotations for b in blocks]
+
+
+# %% Selecting blocks by their messages
+
+# Module level, so that it can be sent to worker processes.
+def soa_3(messages):
+
+    return 'SOA: 3' in messages
+
+
+def test_get_blocks_where(monkeypatch):
+
+    r = BaseReader(EYELINK_FILE, save_index=False, typed=True,
+                   boundary=BlockBoundary(end=r'^END\b'))
+
+    blocks = [b for b in r.get_blocks() if soa_3(b.messages)]
+
+    n_converted = []
+    convert_row = r.convert_row
+
+    def counting_convert_row(values):
+        n_converted.append(1)
+        return convert_row(values)
+
+    monkeypatch.setattr(r, 'convert_row', counting_convert_row)
+
+    selected_blocks = list(r.get_blocks(where=soa_3))
+
+    assert len(selected_blocks) == len(blocks) > 0
+    assert len(n_converted) == sum(len(b) for b in blocks)
+
+    for b, selected_b in zip(blocks, selected_blocks):
+        assert selected_b.messages == b.messages
+        assert selected_b.annotations == b.annotations
+        assert numpy.allclose(selected_b, b, equal_nan=True)
+
+
+def test_get_blocks_where_none(r_all):
+
+    assert list(r_all.get_blocks(where=lambda messages: False)) == []
+
+
+def test_get_blocks_where_parallel():
+
+    r = BaseReader(EYELINK_FILE, save_index=False, boundary=BlockBoundary(end=r'^END\b'))
+
+    blocks = list(r.get_blocks(where=soa_3))
+    parallel_blocks = list(r.get_blocks(where=soa_3, workers=2))
+
+    assert [b.messages for b in parallel_blocks] == [b.messages for b in blocks]
+
+
+def test_get_blocks_where_cache(tmp_path):
+
+    cache = ReaderCache(str(tmp_path / 'cache'))
+    blocks = list(BaseReader(EYELINK_FILE, save_index=False).get_blocks(where=soa_3))
+
+    for i in range(2):
+        r = BaseReader(EYELINK_FILE, save_index=False, cache=cache)
+        cached_blocks = list(r.get_blocks(where=soa_3))
+        assert [b.messages for b in cached_blocks] == [b.messages for b in blocks]
+
+
+# %% follow()
+
+def assert_same_blocks(blocks, expected):
+
+    assert len(blocks) == len(expected)
+
+    for b, expected_b in zip(blocks, expected):
+        assert b.messages == expected_b.messages
+        assert b.annotations == expected_b.annotations
+        assert numpy.allclose(b, expected_b, equal_nan=True)
+
+
+def write_slowly(filepath, content, n_pieces=20):
+
+    # Pieces deliberately break lines in the middle.
+    size = len(content) // n_pieces + 1
+
+    with open(filepath, mode='ab') as f:
+        for i in range(0, len(content), size):
+            f.write(content[i:i + size])
+            f.flush()
+            time.sleep(0.01)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_follow_finished_file(file, backend):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(save_index=False, backend=backend, **kwargs)
+
+    blocks = list(r.follow(timeout=0))
+
+    assert_same_blocks(blocks, list(r.get_blocks()))
+
+
+@pytest.mark.parametrize('boundary', [None, BlockBoundary(end=r'^END\b')])
+def test_follow_growing_file(tmp_path, boundary):
+
+    filepath = str(tmp_path / 'growing.txt')
+    open(filepath, mode='w').close()
+
+    with open(EYELINK_FILE, mode='rb') as f:
+        content = f.read()
+
+    r = BaseReader(filepath, lazy_header=True, save_index=False, typed=True,
+                   boundary=boundary)
+
+    writer = threading.Thread(target=write_slowly, args=(filepath, content))
+    writer.start()
+    blocks = list(r.follow(poll_interval=0.005, timeout=0.5))
+    writer.join()
+
+    expected = list(BaseReader(EYELINK_FILE, save_index=False, typed=True,
+                               boundary=boundary).get_blocks())
+
+    assert r.header == constants.get_header(EYELINK_FILE, 16)
+    assert_same_blocks(blocks, expected)
+
+
+def test_follow_pipe():
+
+    with open(EYELINK_FILE, mode='rb') as f:
+        content = f.read()
+
+    read_end, write_end = os.pipe()
+
+    def write_pipe():
+        with open(write_end, mode='wb') as pipe:
+            for i in range(0, len(content), 4096):
+                pipe.write(content[i:i + 4096])
+
+    writer = threading.Thread(target=write_pipe)
+    writer.start()
+
+    with open(read_end, mode='r', encoding='utf-8') as pipe:
+        r = BaseReader('<pipe>', lazy_header=True, save_index=False)
+        blocks = list(r.follow(source=pipe, where=soa_3))
+
+    writer.join()
+
+    expected = list(BaseReader(EYELINK_FILE, save_index=False).get_blocks(where=soa_3))
+
+    assert_same_blocks(blocks, expected)
+
+
+def test_follow_stream_last_block():
+
+    content = b'header\n0 1.0 2.0\nmessage\n1 3.0 4.0'
+    r = BaseReader('<stream>', lazy_header=True, save_index=False)
+
+    blocks = list(r.follow(source=io.BytesIO(content)))
+
+    assert [len(b) for b in blocks] == [1, 1]
+    assert [b.messages for b in blocks] == ['header', 'message']
+
+
+# A stream that gives a few bytes at a time, as a pipe might.
+class TrickleStream(io.RawIOBase):
+
+    def __init__(self, content, size):
+
+        self.content = content
+        self.size = size
+        self.position = 0
+
+    def readable(self):
+
+        return True
+
+    def readinto(self, b):
+
+        chunk = self.content[self.position:self.position + min(len(b), self.size)]
+        b[:len(chunk)] = chunk
+        self.position = self.position + len(chunk)
+
+        return len(chunk)
+
+
+# Each row should be read once, however the stream is broken up,
+# and each block returned as soon as the line that ends it arrives.
+
+def test_follow_reads_rows_once(monkeypatch):
+
+    with open(EYELINK_FILE, mode='rb') as f:
+        content = f.read()
+
+    boundary = BlockBoundary(end=r'^END\b')
+    r = BaseReader('<stream>', lazy_header=True, save_index=False, typed=True,
+                   boundary=boundary)
+
+    n_converted = []
+    convert_row = r.convert_row
+
+    def counting_convert_row(values):
+        n_converted.append(1)
+        return convert_row(values)
+
+    monkeypatch.setattr(r, 'convert_row', counting_convert_row)
+
+    size = 100
+    stream = TrickleStream(content, size)
+    ends = [content.index(b'\n', i) + 1 for i in range(len(content))
+            if content.startswith(b'END', i) and ((i == 0) or (content[i - 1:i] == b'\n'))]
+
+    blocks = []
+    for b in r.follow(source=stream):
+        if len(blocks) < len(ends):
+            assert stream.position <= ends[len(blocks)] + size
+        blocks.append(b)
+
+    expected = list(BaseReader(EYELINK_FILE, save_index=False, typed=True,
+                               boundary=boundary).get_blocks())
+
+    assert len(n_converted) == sum(len(b) for b in blocks)
+    assert_same_blocks(blocks, expected)
+
+
+# %% Asynchronous reading
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_header_async(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(lazy_header=True, save_index=False, **kwargs)
+
+    header = asyncio.get_event_loop().run_until_complete(r.get_header_async())
+
+    assert header == file['header']
+
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_blocks_async(file):
+
+    kwargs = constants.get_basereader_args(file)
+    r = BaseReader(save_index=False, **kwargs)
+
+    async def collect():
+        return [b async for b in r.get_blocks_async()]
+
+    blocks = asyncio.get_event_loop().run_until_complete(collect())
+
+    assert_same_blocks(blocks, list(r.get_blocks()))
+
+
+def test_get_blocks_async_stop_early():
+
+    r = BaseReader(EYELINK_FILE, save_index=False)
+
+    async def first():
+        blocks = r.get_blocks_async()
+        async for block in blocks:
+            break
+        assert not r.file.closed
+        await blocks.aclose()
+        return block
+
+    block = asyncio.get_event_loop().run_until_complete(first())
+
+    assert r.file.closed
+    assert_same_blocks([block], [next(r.get_blocks())])
+
+
 # %% Context manager
 
 def test_context_manager():
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from saccades.readers.boundaries import BlockBoundary
+
+
+# %% Setup
+
+EVENT_LINE = 'EFIX L   1000\t1200\t200\t  512.0\t  384.0\t   1020\n'
+START_LINE = 'START\t1000 \tLEFT\tSAMPLES\tEVENTS\n'
+END_LINE = 'END\t2000 \tSAMPLES\tEVENTS\tRES\t  38.00\t  34.00\n'
+
+
+# %% BlockBoundary
+
+def test_default():
+
+    boundary = BlockBoundary()
+
+    assert not boundary.annotates
+    assert boundary.is_start(EVENT_LINE)
+    assert not boundary.is_end(END_LINE)
+
+
+def test_start():
+
+    boundary = BlockBoundary(start=r'^START\b')
+
+    assert boundary.annotates
+    assert boundary.is_start(START_LINE)
+    assert not boundary.is_start(EVENT_LINE)
+    assert not boundary.is_end(END_LINE)
+
+
+def test_end():
+
+    boundary = BlockBoundary(end=r'^END\b')
+
+    assert boundary.annotates
+    assert not boundary.is_start(START_LINE)
+    assert not boundary.is_start(EVENT_LINE)
+    assert boundary.is_end(END_LINE)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from . import constants
+
+from saccades.readers.index import BlockIndex
+from saccades.readers.index import file_fingerprint
+
+
+# %% Setup
+
+blocks = [(0, 10, 50, 1, 4),
+          (50, 60, 100, 1, 4)]
+
+
+# %% file_fingerprint()
+
+def test_file_fingerprint():
+
+    fingerprint = file_fingerprint(constants.DATA_FILES[1]['file'], foo='bar')
+
+    assert fingerprint['size'] > 0
+    assert 'mtime' in fingerprint
+    assert fingerprint['foo'] == 'bar'
+
+
+# %% BlockIndex
+
+def test_append():
+
+    index = BlockIndex()
+
+    for b in blocks:
+        index.append(*b)
+
+    assert len(index) == len(blocks)
+    assert index[-1] == blocks[-1]
+
+
+def test_save_and_load(tmp_path):
+
+    filepath = str(tmp_path / 'index.json')
+    fingerprint = {'size': 100, 'mtime': 9000}
+
+    BlockIndex(blocks, fingerprint=fingerprint).save(filepath)
+    index = BlockIndex.load(filepath)
+
+    assert index.blocks == blocks
+    assert index.fingerprint == fingerprint
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pytest
+
+from saccades.readers.schema import Column
+
+
+# %% __init__()
+
+def test_init():
+
+    col = Column('pupil')
+
+    assert col.dtype == 'float64'
+    assert col.source == 'pupil'
+    assert col.keep
+
+
+@pytest.mark.parametrize('dtype', ['uint8', numpy.uint8, numpy.dtype('uint8')])
+def test_init_dtype(dtype):
+
+    col = Column('flag', dtype=dtype, source=3)
+
+    assert col.dtype == 'uint8'
+    assert col.typecode == 'B'
+    assert col.is_integer
+    assert col.source == 3
+
+
+def test_init_dtype_exception():
+
+    with pytest.raises(ValueError):
+        Column('name', dtype='U5')
+
+
+@pytest.mark.parametrize('na_value', [-1, 256, 0.5])
+def test_init_na_value_exception(na_value):
+
+    with pytest.raises(ValueError, match='uint8'):
+        Column('flag', dtype='uint8', na_value=na_value)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pandas
+
+from . import constants
+
+from saccades.readers.buffers import ColumnBuffer
+
+
+# %% Setup
+
+cols = ['time', 'x', 'y']
+typecodes = ['q', 'f', 'd']
+
+
+def fill(buffer):
+
+    for row in constants.ARRAY:
+        buffer.append([int(row[0]), row[1], row[2]])
+
+
+# %% __init__()
+
+def test_init():
+
+    buffer = ColumnBuffer(cols, typecodes)
+
+    assert len(buffer) == 0
+    assert len(buffer.to_array()) == 0
+
+
+# %% append()
+
+def test_append():
+
+    buffer = ColumnBuffer(cols, typecodes)
+    fill(buffer)
+
+    arr = buffer.to_array()
+
+    assert len(buffer) == len(constants.ARRAY)
+    assert arr.dtype.names == tuple(cols)
+    assert arr['time'].dtype == numpy.int64
+    assert arr['x'].dtype == numpy.float32
+    assert numpy.allclose(arr['y'], constants.ARRAY[:, 2])
+
+
+# %% extend()
+
+def test_extend():
+
+    buffer = ColumnBuffer(cols, typecodes)
+    fill(buffer)
+
+    other = ColumnBuffer(cols, typecodes)
+    fill(other)
+
+    buffer.extend(other)
+    buffer.extend(constants.ARRAY)
+
+    expected = numpy.concatenate([constants.ARRAY] * 3)
+
+    assert len(buffer) == len(expected)
+    assert numpy.allclose(buffer.to_array()['x'], expected[:, 1])
+
+
+# %% to_columns()
+
+def test_to_columns():
+
+    buffer = ColumnBuffer(cols, typecodes)
+    fill(buffer)
+
+    columns = buffer.to_columns()
+
+    assert [values.dtype for values in columns] == [numpy.int64, numpy.float32, numpy.float64]
+    for i, values in enumerate(columns):
+        assert numpy.allclose(values, constants.ARRAY[:, i])
+
+
+# %% to_frame()
+
+def test_to_frame():
+
+    buffer = ColumnBuffer(cols, typecodes)
+    fill(buffer)
+
+    df = buffer.to_frame()
+
+    assert isinstance(df, pandas.DataFrame)
+    assert list(df.columns) == cols
+    assert list(df.dtypes) == [numpy.int64, numpy.float32, numpy.float64]
+    assert numpy.allclose(df, constants.ARRAY)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+
+import pytest
+
+from . import constants
+
+from saccades import GazeData
+from saccades.readers import BaseReader
+from saccades.readers import DelimitedReader
+from saccades.readers import EyelinkReader
+from saccades.readers.dataset import Dataset
+from saccades.readers.dataset import sniff
+from saccades.readers.index import INDEX_SUFFIX
+
+
+# %% Setup
+
+EYELINK_FILE = os.path.join(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+
+PATH_PATTERN = r'(?P<participant>p\d+)/session(?P<session>\d)'
+
+
+def soa(messages):
+
+    return {'soa': int(messages['preceding'].split('SOA: ')[1].split()[0])}
+
+
+@pytest.fixture
+def directory(tmp_path):
+
+    for participant in ['p01', 'p02']:
+        os.makedirs(str(tmp_path / participant))
+        for session in ['1', '2']:
+            filepath = str(tmp_path / participant / 'session{}.asc'.format(session))
+            shutil.copy(EYELINK_FILE, filepath)
+
+    return str(tmp_path)
+
+
+# %% sniff()
+
+@pytest.mark.parametrize('filename, reader_class, kwargs', [
+    (constants.DATA_FILE_EYELINK, EyelinkReader, {}),
+    ('example.csv', DelimitedReader, {'sep': ',', 'header_rows': 0}),
+    ('example.tsv', DelimitedReader, {'sep': '\t', 'header_rows': 0}),
+    ('s1_actioncliptest00001.txt', BaseReader, {}),
+    ('empty.txt', BaseReader, {})
+])
+def test_sniff(filename, reader_class, kwargs):
+
+    assert sniff(os.path.join(constants.DATA_PATH, filename)) == (reader_class, kwargs)
+
+
+def test_sniff_header_row(tmp_path):
+
+    filepath = str(tmp_path / 'export.tsv')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write('Timestamp\tGazeX\tGazeY\n0\t1.5\t2.5\n4\t.\t2.6\n')
+
+    assert sniff(filepath) == (DelimitedReader, {'sep': '\t', 'header_rows': 1})
+
+
+# %% Catalog
+
+def test_catalog(directory):
+
+    dataset = Dataset(directory, path_pattern=PATH_PATTERN, save_index=False)
+    n_blocks = constants.EYELINK_COUNTS['START']
+
+    assert len(dataset.paths) == 4
+    assert len(dataset) == 4 * n_blocks
+    assert list(dataset.catalog.columns) == ['path', 'block', 'n_rows',
+                                             'participant', 'session']
+    assert sorted(dataset.catalog['participant'].unique()) == ['p01', 'p02']
+    assert dataset.catalog['n_rows'].sum() == 4 * constants.EYELINK_COUNTS['samples']
+    assert all(isinstance(r, EyelinkReader) for r in dataset._readers.values())
+
+
+def test_catalog_glob(directory):
+
+    dataset = Dataset(os.path.join(directory, 'p01', '*.asc'), reader_class=EyelinkReader,
+                      save_index=False)
+
+    assert len(dataset.paths) == 2
+
+
+def test_catalog_block_fields(directory):
+
+    dataset = Dataset(directory, block_fields=soa, save_index=False)
+
+    assert set(dataset.catalog['soa']) == set(range(7))
+
+
+def test_catalog_block_fields_messages(directory):
+
+    dataset = Dataset(directory, block_fields=soa)
+    catalog = dataset.catalog
+
+    for entry in catalog.to_dict(orient='records'):
+        reader = dataset.reader(entry['path'])
+        assert entry['soa'] == soa(reader.get_messages(entry['block']))['soa']
+
+
+def test_catalog_does_not_save_index(directory):
+
+    dataset = Dataset(directory, block_fields=soa)
+    dataset.catalog
+
+    assert not [name for root, dirs, files in os.walk(directory) for name in files
+                if name.endswith(INDEX_SUFFIX)]
+
+
+# %% Selection and loading
+
+def test_select(directory):
+
+    dataset = Dataset(directory, path_pattern=PATH_PATTERN, block_fields=soa,
+                      save_index=False)
+
+    selection = dataset.select(participant='p02', soa=[1, 3])
+
+    assert 0 < len(selection) < len(dataset) / 2
+    assert set(selection.catalog['participant']) == {'p02'}
+    assert all('p02' in path for path in selection.paths)
+
+    assert len(dataset.select('soa == 3')) == len(dataset.select(soa=3))
+    assert len(dataset.select(dataset.catalog['block'] == 0)) == 4
+
+
+def test_iter_blocks(directory, monkeypatch):
+
+    dataset = Dataset(directory, path_pattern=PATH_PATTERN, block_fields=soa,
+                      save_index=False)
+    selection = dataset.select(participant='p01', session='2', soa=3)
+
+    expected = [b for b in EyelinkReader(EYELINK_FILE, save_index=False).get_blocks()
+                if 'SOA: 3' in b.messages['preceding']]
+
+    # Only the selected blocks should be read.
+    read_blocks = []
+    get_block = EyelinkReader.get_block
+
+    def counting_get_block(self, i, cols=None):
+        read_blocks.append(i)
+        return get_block(self, i, cols=cols)
+
+    monkeypatch.setattr(EyelinkReader, 'get_block', counting_get_block)
+
+    blocks = list(selection)
+
+    assert len(blocks) == len(read_blocks) == len(expected)
+
+    for b, expected_b in zip(blocks, expected):
+        assert isinstance(b, GazeData)
+        assert b.equals(expected_b)
+
+    for entry, b in selection.iter_blocks():
+        assert entry['soa'] == 3
+        assert len(b) == entry['n_rows']
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import shutil
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import GazeData
+from saccades.readers import BaseReader
+from saccades.readers import DelimitedReader
+
+
+# %% Setup
+
+DELIMITED_FILES = [f for f in constants.DATA_FILES if f.get('n_blocks') == 1]
+
+EXPORT = ('Pupil\tTimestamp\tGazeX\tGazeY\n'
+          '3.1\t0\t1.5\t2.5\n'
+          '3.2\t4\t.\t2.6\n'
+          '3.3\t8\t1.7\t2.7\n')
+
+
+@pytest.fixture
+def no_regex(monkeypatch):
+
+    # Fail if any line is matched against the row pattern.
+    def fail(*args, **kwargs):
+        raise AssertionError('Row pattern used.')
+
+    monkeypatch.setattr(BaseReader, '_read_raw_blocks', fail)
+
+
+def assert_same_blocks(blocks, expected):
+
+    assert len(blocks) == len(expected)
+
+    for b, expected_b in zip(blocks, expected):
+        assert isinstance(b, GazeData)
+        assert b.messages == expected_b.messages
+        assert numpy.allclose(b, expected_b, equal_nan=True)
+
+
+# %% get_blocks()
+
+@pytest.mark.parametrize('file', DELIMITED_FILES, ids=[f['filename'] for f in DELIMITED_FILES])
+def test_get_blocks(file, no_regex):
+
+    kwargs = constants.get_basereader_args(file)
+    r = DelimitedReader(save_index=False, **kwargs)
+
+    blocks = list(r.get_blocks())
+
+    assert r.header == file['header']
+    assert len(blocks) == file['n_blocks']
+    assert len(blocks[0]) == constants.get_n_lines(file['file'])
+
+
+@pytest.mark.parametrize('file', DELIMITED_FILES, ids=[f['filename'] for f in DELIMITED_FILES])
+def test_get_blocks_same_as_BaseReader(file):
+
+    kwargs = constants.get_basereader_args(file)
+
+    blocks = list(DelimitedReader(save_index=False, **kwargs).get_blocks())
+    expected = list(BaseReader(save_index=False, **kwargs).get_blocks())
+
+    assert_same_blocks(blocks, expected)
+
+
+@pytest.mark.parametrize('extra, n_blocks', [('MSG hello\n', 2),
+                                             ('\n', 2),
+                                             ('257900 1.0 2.0 9.0\n', 1)])
+def test_get_blocks_fallback(tmp_path, extra, n_blocks):
+
+    filepath = str(tmp_path / 'example.tsv')
+
+    with open(DELIMITED_FILES[0]['file'], encoding='utf-8') as f:
+        lines = f.readlines()
+
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.writelines(lines[:50] + [extra] + lines[50:])
+
+    blocks = list(DelimitedReader(filepath, save_index=False).get_blocks())
+    expected = list(BaseReader(filepath, save_index=False).get_blocks())
+
+    assert len(blocks) == n_blocks
+    assert_same_blocks(blocks, expected)
+
+
+@pytest.mark.parametrize('value, n_blocks', [('1.8e1', 1),
+                                             ('+1.8', 1),
+                                             (' 1.8 ', 1),
+                                             ('"1.8"', 2),
+                                             ('inf', 2)])
+def test_get_blocks_fallback_same_values(tmp_path, value, n_blocks):
+
+    filepath = str(tmp_path / 'export.tsv')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(EXPORT + '3.4\t12\t{}\t2.8\n'.format(value) + '3.5\t16\t1.9\t2.9\n')
+
+    r = DelimitedReader(filepath, sep='\t', columns={'time': 1, 'x': 2, 'y': 3},
+                        header_rows=1, save_index=False)
+
+    blocks = list(r.get_blocks())
+
+    assert len(blocks) == n_blocks
+    # Reading single blocks does not take the fast path.
+    assert_same_blocks(blocks, [r.get_block(i) for i in range(len(r))])
+
+
+@pytest.mark.parametrize('selected', [False, True])
+def test_get_blocks_where(selected):
+
+    kwargs = constants.get_basereader_args(DELIMITED_FILES[0])
+    r = DelimitedReader(save_index=False, **kwargs)
+
+    blocks = list(r.get_blocks(where=lambda messages: selected))
+
+    assert len(blocks) == int(selected)
+
+
+def test_get_blocks_compressed(tmp_path, no_regex):
+
+    filepath = str(tmp_path / 'example.tsv.gz')
+
+    with open(DELIMITED_FILES[0]['file'], mode='rb') as f_in:
+        with gzip.open(filepath, mode='wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+    blocks = list(DelimitedReader(filepath, save_index=False).get_blocks())
+
+    assert len(blocks[0]) == constants.get_n_lines(DELIMITED_FILES[0]['file'])
+
+
+# %% Column mapping
+
+def test_columns_by_name(tmp_path, no_regex):
+
+    filepath = str(tmp_path / 'export.tsv')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(EXPORT)
+
+    columns = {'time': 'Timestamp', 'x': 'GazeX', 'y': 'GazeY', 'pupil': 0}
+    r = DelimitedReader(filepath, sep='\t', columns=columns, header_rows=1,
+                        save_index=False)
+
+    assert r.columns == {'time': 1, 'x': 2, 'y': 3, 'pupil': 0}
+
+    gd = next(r.get_blocks(cols=['time', 'x', 'y', 'pupil']))
+
+    assert gd.messages == EXPORT.splitlines()[0]
+    assert list(gd['time']) == [0., 4., 8.]
+    assert numpy.isnan(gd['x'][1])
+    assert list(gd['pupil']) == [3.1, 3.2, 3.3]
+
+
+def test_columns_by_name_same_as_regex(tmp_path):
+
+    filepath = str(tmp_path / 'export.tsv')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(EXPORT)
+
+    columns = {'time': 'Timestamp', 'x': 'GazeX', 'y': 'GazeY'}
+    r = DelimitedReader(filepath, sep='\t', columns=columns, header_rows=1,
+                        save_index=False)
+
+    # Reading a single block does not take the fast path.
+    assert_same_blocks([r.get_block(0)], list(r.get_blocks()))
+
+
+@pytest.mark.parametrize('header_rows', [0, 1])
+def test_columns_by_name_exception(tmp_path, header_rows):
+
+    filepath = str(tmp_path / 'export.tsv')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(EXPORT)
+
+    with pytest.raises(ValueError):
+        DelimitedReader(filepath, sep='\t', columns={'time': 'Time', 'x': 2, 'y': 3},
+                        header_rows=header_rows)
+
+
+# %% build_row_start()
+
+def test_build_row_start(tmp_path):
+
+    filepath = str(tmp_path / 'export.tsv')
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.write(EXPORT)
+
+    r = DelimitedReader(filepath, sep='\t', header_rows=1)
+    assert all(line[0] in r.build_row_start() for line in EXPORT.splitlines()[1:])
+
+    r = DelimitedReader(filepath, sep='\t', columns={'time': 1, 'x': 2, 'y': 3}, header_rows=1)
+    assert r.build_row_start() is None
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from saccades.derived import DerivedColumn
+from saccades.derived import DerivedColumns
+
+
+# %% Setup
+
+class Table(DerivedColumns):
+
+    def __init__(self):
+
+        self._columns = {'a': 1}
+        self._derived = set()
+        self.n_calls = 0
+
+    def count(self, value):
+
+        self.n_calls = self.n_calls + 1
+
+        return value
+
+
+Table.derived_columns = {
+    'b': DerivedColumn(lambda t: t.count(t._get_column('a') + 1), columns=['a']),
+    'c': DerivedColumn(lambda t: t.count(t._get_column('b') * 2), columns=['b'],
+                       attributes=['scale'])
+}
+
+
+@pytest.fixture
+def table():
+
+    return Table()
+
+
+# %% DerivedColumn
+
+@pytest.mark.parametrize('names, expected', [({'b'}, True),
+                                             ({'scale'}, True),
+                                             ({'a'}, False),
+                                             (set(), False)])
+def test_depends_on(names, expected):
+
+    assert Table.derived_columns['c'].depends_on(names) is expected
+
+
+# %% DerivedColumns
+
+def test_derive_once(table):
+
+    assert table._get_column('c') == 4
+    assert table._get_column('c') == 4
+    assert table._get_column('b') == 2
+    assert table.n_calls == 2
+
+
+def test_invalidate_dependents(table):
+
+    table._get_column('c')
+    table._set_column('a', 2)
+
+    assert table._derived == set()
+    assert table._get_column('c') == 6
+
+
+def test_invalidate_attribute(table):
+
+    table._get_column('c')
+    table.invalidate('scale')
+
+    assert table._derived == {'b'}
+
+
+def test_invalidate_all(table):
+
+    table._get_column('c')
+    table.invalidate()
+
+    assert list(table._columns) == ['a']
+
+
+def test_set_derived_column(table):
+
+    table._get_column('c')
+    table._set_column('b', 10)
+
+    assert table._derived == set()
+    assert table._get_column('c') == 20
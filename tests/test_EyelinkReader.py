@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import GazeData
+from saccades.readers import EyelinkReader
+from saccades.readers.eyelink import EVENT_DTYPE
+
+
+# %% Setup
+
+@pytest.fixture
+def eyelink_r():
+
+    filepath = os.path.join(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+
+    return EyelinkReader(filepath, save_index=False)
+
+
+# %% Test functions
+
+def test_init(eyelink_r):
+
+    assert isinstance(eyelink_r, EyelinkReader)
+
+
+def test_row_pattern(eyelink_r):
+
+    match = eyelink_r.row_pattern.fullmatch('257720\t  325.6\t  232.6\t    0.0')
+
+    assert match.group('time', 'x', 'y', 'pupil') == ('257720', '325.6', '232.6', '0.0')
+
+    assert eyelink_r.row_pattern.fullmatch('258984\t   .\t   .\t    0.0') is not None
+    assert eyelink_r.row_pattern.fullmatch('SFIX R   257724') is None
+
+
+def test_build_row_start(eyelink_r):
+
+    assert '2' in eyelink_r.build_row_start()
+    assert 'S' not in eyelink_r.build_row_start()
+
+
+def test_process_header(eyelink_r):
+
+    assert eyelink_r.header == constants.HEADER_EYELINK
+
+
+def test_get_blocks(eyelink_r):
+
+    blocks = list(eyelink_r.get_blocks())
+
+    assert len(blocks) == constants.EYELINK_COUNTS['START']
+    assert sum(len(b) for b in blocks) == constants.EYELINK_COUNTS['samples']
+
+    assert blocks[0].messages['preceding'] == constants.get_header(eyelink_r.filename, 16)
+
+    for b in blocks:
+        assert isinstance(b, GazeData)
+        assert b.screen_res == constants.HEADER_EYELINK['screen_res']
+        assert b.messages['rate'] == constants.HEADER_EYELINK['rate']
+        assert b.messages['events'].dtype == numpy.dtype(EVENT_DTYPE)
+
+
+@pytest.mark.parametrize('event_type', ['EFIX', 'ESACC', 'EBLINK'])
+def test_events(eyelink_r, event_type):
+
+    n_events = 0
+
+    for b in eyelink_r.get_blocks():
+        events = b.messages['events']
+        n_events = n_events + numpy.sum(events['type'] == event_type)
+
+    assert n_events == constants.EYELINK_COUNTS[event_type]
+
+
+def test_messages(eyelink_r):
+
+    b = next(eyelink_r.get_blocks())
+
+    assert b.messages['messages'][0] == (257933, 'DISPLAY ON')
+
+
+def test_truncated_annotations(eyelink_r, tmp_path):
+
+    filepath = str(tmp_path / 'truncated.asc')
+
+    with open(eyelink_r.filename, encoding='utf-8') as f:
+        lines = f.readlines()
+
+    i = next(i for i, line in enumerate(lines) if line.startswith('MSG\t257933'))
+    lines[i + 1:i + 1] = ['EFIX L   257934\n', 'MSG\tDISPLAY OFF\n']
+
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+    b = next(EyelinkReader(filepath, save_index=False).get_blocks())
+    expected = next(eyelink_r.get_blocks())
+
+    untimed = [text.strip() for time, text in b.messages['messages'] if time is None]
+    assert untimed[-2:] == ['EFIX L   257934', 'MSG\tDISPLAY OFF']
+    assert numpy.array_equal(b.messages['events'], expected.messages['events'])
+
+
+def test_screen_res_copied(eyelink_r):
+
+    blocks = list(eyelink_r.get_blocks())
+    blocks[0].screen_res[0] = 0
+
+    assert blocks[1].screen_res == constants.HEADER_EYELINK['screen_res']
+    assert eyelink_r.header['screen_res'] == constants.HEADER_EYELINK['screen_res']
+
+
+# Saccades marked by the tracker can be used directly.
+def test_detect_saccades(eyelink_r):
+
+    b = next(eyelink_r.get_blocks())
+    saccades = b.detect_saccades()
+    events = b.messages['events']
+    events = events[events['type'] == 'ESACC']
+
+    assert len(saccades) == len(events)
+
+    for sacc, event in zip(saccades, events):
+        assert sacc['time'].iloc[0] >= event['start']
+        assert sacc['time'].iloc[-1] <= event['end']
+
+
+def test_get_blocks_schema(eyelink_r):
+
+    gd = next(eyelink_r.get_blocks())
+
+    assert gd['time'].dtype == numpy.int64
+    assert gd['pupil'].dtype == numpy.float32
@@ -0,0 +1,657 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy
+import pandas
+import pytest
+
+from . import constants
+
+from saccades import GazeArray
+from saccades import GazeData
+from saccades import SaccadeArray
+from saccades import ViewingGeometry
+from saccades import conversions
+from saccades import detection
+from saccades import geometry
+from saccades.readers import EyelinkReader
+from saccades.timebase import Timebase
+
+
+# GazeArray methods share their implementation with GazeData,
+# so this test file concentrates on storage, indexing and conversion.
+
+
+# %% __init__()
+
+def test_init_types(ga_all):
+
+    assert isinstance(ga_all, GazeArray)
+    assert not isinstance(ga_all, pandas.DataFrame)
+    assert all((col in ga_all) for col in ['time', 'x', 'y'])
+
+    assert numpy.array_equal(ga_all[['time', 'x', 'y']], constants.ARRAY)
+
+    for attr, val in constants.ATTRIBUTES.items():
+        assert getattr(ga_all, attr) == val
+
+
+def test_columns_contiguous(ga_all):
+
+    for col in ga_all.columns:
+        assert ga_all[col].flags.c_contiguous
+
+
+def test_no_instance_dict(ga):
+
+    with pytest.raises(AttributeError):
+        ga.foo = 'foo'
+
+
+input_types = constants.INVALID_INIT_TYPES.values()
+ids = list(constants.INVALID_INIT_TYPES.keys())
+@pytest.mark.parametrize('input_type', input_types, ids=ids)
+def test_invalid_init_types(input_type):
+
+    with pytest.raises(ValueError):
+        GazeArray(input_type)
+
+
+def test_init_ragged_columns():
+
+    with pytest.raises(ValueError, match='same length'):
+        GazeArray({'time': [0., 1.], 'x': [0.], 'y': [0.]})
+
+
+def test_empty_init():
+
+    ga = GazeArray()
+
+    assert ga.columns == ['time', 'x', 'y']
+    assert len(ga) == 0
+
+
+def test_init_copy():
+
+    columns = {col: numpy.array(constants.ARRAY[:, i]) for i, col in enumerate('txy')}
+    columns['time'] = columns.pop('t')
+
+    copied = GazeArray(columns)
+    shared = GazeArray(columns, copy=False)
+    columns['x'][0] = 9000.
+
+    assert copied['x'][0] != 9000.
+    assert shared['x'][0] == 9000.
+
+
+def test_init_no_copy_converts_when_needed():
+
+    # Lists and strided columns cannot be shared, so they are converted anyway.
+    columns = {'time': list(constants.ARRAY[:, 0]),
+               'x': constants.ARRAY[:, 1],
+               'y': constants.ARRAY[:, 2]}
+
+    ga = GazeArray(columns, copy=False)
+
+    assert all(ga[col].flags.c_contiguous for col in ga.columns)
+    assert numpy.array_equal(ga, constants.ARRAY)
+
+
+def test_init_from_instance(ga):
+
+    new_ga = GazeArray(ga, target='new_target')
+    new_ga['x'] = 0.
+
+    assert new_ga.target == 'new_target'
+    assert new_ga.messages == ga.messages
+    assert not numpy.array_equal(ga['x'], new_ga['x'])
+
+
+# %% Indexing
+
+def test_get_column(ga):
+
+    assert isinstance(ga['x'], numpy.ndarray)
+    assert numpy.array_equal(ga['x'], constants.ARRAY[:, 1])
+
+
+def test_set_column(ga):
+
+    ga['foo'] = 1.
+    ga['bar'] = [True, False, True]
+
+    assert ga.columns == ['time', 'x', 'y', 'foo', 'bar']
+    assert numpy.array_equal(ga['foo'], [1., 1., 1.])
+
+    with pytest.raises(ValueError):
+        ga['baz'] = [1., 2.]
+
+
+def test_subset_rows_slice_is_view(ga):
+
+    subset = ga[1:]
+    subset['x'][0] = 9000.
+
+    assert isinstance(subset, GazeArray)
+    assert len(subset) == 2
+    assert ga['x'][1] == 9000.
+
+    for attr, val in constants.ATTRIBUTES.items():
+        assert getattr(subset, attr) == val
+
+
+def test_subset_rows_with_boolean(ga):
+
+    subset = ga[ga['time'] > ga['time'][0]]
+
+    assert isinstance(subset, GazeArray)
+    assert numpy.array_equal(subset, constants.ARRAY[1:])
+
+
+def test_subset_single_row_exception(ga):
+
+    with pytest.raises(TypeError):
+        ga[0]
+
+
+# %% to_pandas()
+
+def test_to_pandas(ga):
+
+    ga['saccade'] = [False, True, True]
+    ga['velocity'] = 0.
+
+    gd = ga.to_pandas()
+
+    assert isinstance(gd, GazeData)
+    assert list(gd.columns) == ['time', 'x', 'y', 'velocity', 'saccade']
+    assert gd['saccade'].dtype == bool
+    assert numpy.array_equal(gd[['time', 'x', 'y']], constants.ARRAY)
+
+    for attr, val in constants.ATTRIBUTES.items():
+        assert getattr(gd, attr) == val
+
+    # The table is a view on the same memory.
+    for col in ga.columns:
+        assert numpy.shares_memory(gd[col].to_numpy(), ga[col])
+
+
+def test_to_pandas_view_of_subset(ga):
+
+    # Once consolidated, later views need no copying.
+    ga.to_pandas()
+    subset = ga[1:]
+    gd = subset.to_pandas()
+
+    gd.loc[0, 'x'] = 9000.
+
+    assert subset['x'][0] == 9000.
+    assert ga['x'][1] == 9000.
+
+
+def test_from_pandas_round_trip(ga):
+
+    gd = ga.to_pandas()
+    ga = GazeArray(gd, copy=False)
+
+    assert numpy.array_equal(ga, gd)
+    assert ga.viewing_parameters == gd.viewing_parameters
+
+    ga['x'][0] = 9000.
+
+    assert gd['x'].iloc[0] == 9000.
+
+
+# %% Methods
+
+def test_methods_match_GazeData(ga, gd):
+
+    for obj in [ga, gd]:
+        obj.reset_time()
+        obj.center(constants.ORIGIN)
+        obj.rotate(constants.ANGLE)
+        obj.get_accelerations()
+
+    ga.get_raw_coords()
+
+    assert sorted(ga.columns) == sorted(gd.columns)
+    assert numpy.allclose(ga[list(gd.columns)], gd, equal_nan=True)
+
+
+# %% Derived columns
+
+def test_derived_columns_on_demand(ga):
+
+    assert 'velocity' not in ga
+
+    assert numpy.allclose(ga['acceleration'], constants.ACCELERATION_DVA, equal_nan=True)
+    assert numpy.allclose(ga['velocity'], constants.VELOCITY_DVA, equal_nan=True)
+    assert ga.columns == ['time', 'x', 'y', 'velocity', 'acceleration']
+
+
+def test_derived_columns_cached(ga, monkeypatch):
+
+    ga.get_accelerations()
+
+    def fail(*args):
+        raise AssertionError('Recalculated.')
+
+    monkeypatch.setattr(GazeArray.derived_columns['velocity'], 'func', fail)
+
+    ga.get_velocities()
+    ga.get_accelerations()
+    ga['foo'] = 1.
+    ga.target = [0., 0.]
+    detection.criterion(ga, velocity=constants.VELOCITY_LOW)
+
+
+@pytest.mark.parametrize('change', [lambda ga: ga.center(constants.ORIGIN),
+                                    lambda ga: ga.rotate(constants.ANGLE),
+                                    lambda ga: ga.__setitem__('time', ga['time'] * 2.),
+                                    lambda ga: setattr(ga, 'space_units', 'dva'),
+                                    lambda ga: setattr(ga, 'viewing_dist', 10.)],
+                         ids=['center', 'rotate', 'time', 'space_units', 'viewing_dist'])
+def test_derived_columns_invalidated(ga, change):
+
+    ga.get_accelerations()
+    change(ga)
+
+    assert 'velocity' not in ga
+    assert 'acceleration' not in ga
+
+    expected = GazeArray(ga, copy=True)
+    expected.invalidate()
+
+    assert numpy.allclose(ga['acceleration'], expected['acceleration'], equal_nan=True)
+
+
+def test_derived_column_set_explicitly(ga):
+
+    ga.get_accelerations()
+    ga['velocity'] = 0.
+
+    assert 'acceleration' not in ga
+
+    ga.center(constants.ORIGIN)
+
+    assert numpy.array_equal(ga['velocity'], [0., 0., 0.])
+    assert numpy.array_equal(ga['acceleration'][1:], [0., 0.])
+
+    ga.get_velocities()
+
+    assert numpy.allclose(ga['velocity'], constants.VELOCITY_DVA, equal_nan=True)
+
+
+def test_derived_columns_kept_by_copy(ga):
+
+    ga.get_velocities()
+
+    assert 'velocity' in GazeArray(ga)
+    assert 'velocity' in ga[:2]
+    assert 'velocity' not in GazeArray(ga, viewing_dist=10.)
+
+
+def test_detect_saccades(ga, gd):
+
+    saccades = ga.detect_saccades(detection.criterion, velocity=constants.VELOCITY_LOW)
+    expected = gd.detect_saccades(detection.criterion, velocity=constants.VELOCITY_LOW)
+
+    assert len(saccades) == len(expected)
+
+    for sacc, expected_sacc in zip(saccades, expected):
+        assert isinstance(sacc, SaccadeArray)
+        assert numpy.allclose(sacc[['time', 'x', 'y', 'velocity']],
+                              expected_sacc[['time', 'x', 'y', 'velocity']])
+
+
+def test_detect_saccades_exception(ga):
+
+    with pytest.raises(KeyError):
+        ga.detect_saccades()
+
+
+# %% SaccadeArray
+
+@pytest.mark.parametrize('metric, expected', [('latency', constants.LATENCY),
+                                              ('duration', constants.DURATION),
+                                              ('amplitude', constants.AMPLITUDE_DVA)])
+def test_saccade_metrics(sacc_array, metric, expected):
+
+    assert getattr(sacc_array, metric)() == expected
+
+
+def test_saccade_nonexistent_method(sacc_array):
+
+    with pytest.raises(AttributeError):
+        sacc_array.nonexistent_method()
+
+
+# %% Transforms
+
+def test_transforms_lazy(ga):
+
+    x = ga['x']
+    ga.center(constants.ORIGIN)
+    ga.rotate(constants.ANGLE)
+
+    assert ga._pending == ga.transform
+    assert len(ga.transform.steps) == 1
+    assert 'x_raw' not in ga
+    assert ga._columns['x'] is x
+
+    assert ga['x'] is not x
+    assert ga._pending is None
+
+
+def test_transforms_match_geometry(ga):
+
+    expected = geometry.rotate(geometry.center(ga[['x', 'y']], constants.ORIGIN),
+                               constants.ANGLE)
+
+    ga.center(constants.ORIGIN)
+    ga.rotate(constants.ANGLE)
+
+    assert numpy.allclose(ga[['x', 'y']], expected)
+
+
+def test_raw_coords(ga):
+
+    raw = ga[['x', 'y']]
+
+    ga.center(constants.ORIGIN)
+    ga.rotate(constants.ANGLE)
+    ga.to_dva()
+
+    assert numpy.allclose(ga[['x_raw', 'y_raw']], raw)
+    assert ga.columns == ['time', 'x', 'y', 'x_raw', 'y_raw']
+
+    ga.center(constants.ORIGIN)
+
+    assert 'x_raw' not in ga
+    assert numpy.allclose(ga[['x_raw', 'y_raw']], raw)
+
+
+def test_transforms_kept_by_subsets(ga):
+
+    raw = ga[['x', 'y']]
+    ga.center(constants.ORIGIN)
+
+    for other in [ga[1:3], ga.copy()]:
+        assert other.transform == ga.transform
+        assert numpy.allclose(other[['x_raw', 'y_raw']], raw[len(raw) - len(other):])
+
+
+def test_set_coordinate_applies_transforms(ga):
+
+    ga.center(constants.ORIGIN)
+    expected = ga['y'].copy()
+
+    ga.center(constants.ORIGIN)
+    ga['x'] = numpy.zeros(len(ga))
+
+    assert numpy.allclose(ga['y'], expected - constants.ORIGIN[1])
+
+
+def test_set_coordinate_keeps_raw_coords(ga):
+
+    raw = ga[['x', 'y']]
+
+    ga.center(constants.ORIGIN)
+    ga.rotate(constants.ANGLE)
+    ga['x'] = numpy.zeros(len(ga))
+
+    assert ga.transform.is_identity
+    assert numpy.allclose(ga[['x_raw', 'y_raw']], raw)
+
+    # The raw coordinates are no longer derived, so they stay put.
+    ga.center(constants.ORIGIN)
+    ga['y'] = numpy.zeros(len(ga))
+
+    assert numpy.allclose(ga[['x_raw', 'y_raw']], raw)
+
+
+def test_to_dva(ga):
+
+    ga.center(constants.ORIGIN)
+    expected = conversions.px_to_dva(ga[['x', 'y']], ga.screen_res, ga.screen_diag,
+                                     ga.viewing_dist)
+    ga.get_velocities()
+
+    ga.to_dva()
+
+    assert ga.space_units == 'dva'
+    assert 'velocity' not in ga
+    assert numpy.allclose(ga[['x', 'y']], expected)
+
+    ga.to_dva()
+
+    assert numpy.allclose(ga[['x', 'y']], expected)
+
+
+# %% Compact storage
+
+@pytest.fixture
+def ga_lost():
+
+    # Gaze data with track loss in the middle.
+    array = numpy.array(constants.SEQUENCE)
+    array[1, 1:] = numpy.nan
+
+    return GazeArray(array, **constants.ATTRIBUTES)
+
+
+def test_to_compact(ga_lost):
+
+    compact = ga_lost.to_compact()
+
+    assert compact.is_compact
+    assert not ga_lost.is_compact
+    assert compact['time'].dtype == numpy.int64
+    assert compact['x'].dtype == compact['y'].dtype == numpy.float32
+    assert list(compact.valid) == list(ga_lost.valid) == [True, False, True]
+    assert numpy.allclose(compact, ga_lost, equal_nan=True)
+
+    nbytes = [sum(a[col].nbytes for col in a.columns) for a in [ga_lost, compact]]
+    assert nbytes[1] < 0.7 * nbytes[0]
+
+
+def test_to_compact_exception(ga):
+
+    ga['time'] = ga['time'] + 0.5
+
+    with pytest.raises(ValueError, match='whole numbers'):
+        ga.to_compact()
+
+
+def test_compact_kept(ga_lost):
+
+    compact = ga_lost.to_compact()
+    expected = {'copy': [True, False, True],
+                'slice': [False, True],
+                'mask': [True, True]}
+
+    for name, other in [('copy', compact.copy()),
+                        ('slice', compact[1:]),
+                        ('mask', compact[[True, False, True]])]:
+        assert other.is_compact
+        assert list(other.valid) == expected[name]
+
+
+def test_compact_set_values(ga_lost):
+
+    compact = ga_lost.to_compact()
+
+    compact['x'] = [1., 2., 3.]
+    compact['foo'] = 1.
+    compact.reset_time()
+
+    assert compact['x'].dtype == compact['foo'].dtype == numpy.float32
+    assert compact['time'].dtype == numpy.int64
+    assert list(compact.valid) == [True, False, True]
+
+    compact['y'] = 0.
+
+    assert compact.valid.all()
+
+
+def test_compact_methods(ga):
+
+    compact = ga.to_compact()
+
+    for obj in [ga, compact]:
+        obj.center(constants.ORIGIN)
+        obj.rotate(constants.ANGLE)
+        obj.get_accelerations()
+
+    assert compact['x'].dtype == compact['velocity'].dtype == numpy.float32
+    assert numpy.allclose(compact[ga.columns], ga, equal_nan=True)
+
+    saccades = compact.detect_saccades(detection.criterion, velocity=constants.VELOCITY_LOW)
+    expected = ga.detect_saccades(detection.criterion, velocity=constants.VELOCITY_LOW)
+
+    assert [len(sacc) for sacc in saccades] == [len(sacc) for sacc in expected]
+
+
+# %% Timebase
+
+def test_use_timebase(ga):
+
+    time = ga['time']
+    ga.use_timebase()
+
+    assert ga.timebase == Timebase(time[0], time[1] - time[0])
+    assert 'time' in ga
+    assert ga.columns == ['time', 'x', 'y']
+    assert 'time' not in ga._columns
+
+    assert numpy.array_equal(ga['time'], time)
+    assert list(ga._columns) == ['time', 'x', 'y']
+
+
+def test_use_timebase_exception(ga):
+
+    ga['time'] = [0., 1., 5.]
+
+    with pytest.raises(ValueError, match='regular'):
+        ga.use_timebase()
+
+
+def test_use_timebase_from_reader():
+
+    filepath = os.path.join(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+    block = next(EyelinkReader(filepath, save_index=False).get_blocks())
+    ga = GazeArray(block)
+
+    ga.use_timebase()
+
+    assert ga.timebase.interval == 1000. / constants.HEADER_EYELINK['rate']
+    assert numpy.array_equal(ga['time'], block['time'])
+
+
+def test_timebase_methods(ga):
+
+    expected = ga.copy()
+    expected.get_accelerations()
+    ga.use_timebase()
+
+    ga.get_accelerations()
+
+    assert 'time' not in ga._columns
+    assert numpy.allclose(ga[['velocity', 'acceleration']],
+                          expected[['velocity', 'acceleration']], equal_nan=True)
+
+
+def test_timebase_with_gaps():
+
+    array = numpy.array(constants.SACCADE)
+    array[:, 0] = [0., 2., 8., 10.]
+    expected = GazeArray(array, **constants.ATTRIBUTES)
+    expected.get_accelerations()
+
+    ga = GazeArray(array, **constants.ATTRIBUTES)
+    ga.use_timebase(Timebase(0., 2., [2], [4.]))
+    ga.get_accelerations()
+
+    assert numpy.allclose(ga[['velocity', 'acceleration']],
+                          expected[['velocity', 'acceleration']], equal_nan=True)
+
+
+def test_timebase_kept_by_subsets(ga):
+
+    time = ga['time']
+    ga.use_timebase()
+
+    assert ga[1:].timebase == Timebase(time[1], ga.timebase.interval)
+    assert ga.copy().timebase == ga.timebase
+    assert 'time' not in ga._columns
+
+    subset = ga[[True, False, True]]
+
+    assert subset.timebase is None
+    assert numpy.array_equal(subset['time'], time[[0, 2]])
+    subset.invalidate()
+    assert numpy.array_equal(subset['time'], time[[0, 2]])
+
+
+def test_timebase_replaced(ga):
+
+    ga.use_timebase()
+    ga.get_velocities()
+
+    ga.reset_time()
+
+    assert ga['time'][0] == 0.
+    assert 'velocity' not in ga
+
+    ga['time'] = [0., 1., 5.]
+
+    assert ga.timebase is None
+    assert list(ga['time']) == [0., 1., 5.]
+
+
+# %% Viewing geometry
+
+def test_viewing_geometry(ga):
+
+    geometry = ga.viewing_geometry
+
+    assert geometry == ViewingGeometry(**constants.SCREEN_ATTRIBUTES)
+    assert ga.copy().viewing_geometry is geometry
+    assert ga[1:].viewing_geometry is geometry
+
+    ga.viewing_dist = 1.
+
+    assert ga.viewing_geometry.viewing_dist == 1.
+
+
+def test_viewing_geometry_set(ga):
+
+    geometry = ViewingGeometry([100., 100.], 10., 20.)
+    ga.get_velocities()
+
+    ga.viewing_geometry = geometry
+
+    assert ga.viewing_geometry is geometry
+    assert ga.viewing_dist == 20.
+    assert 'velocity' not in ga
+
+
+def test_viewing_geometry_exception(ga):
+
+    ga.screen_diag = None
+
+    with pytest.raises(AttributeError, match='screen_diag'):
+        ga.viewing_geometry
+
+
+def test_to_dva_exact(ga):
+
+    ga.center(constants.ORIGIN)
+    expected = ga.viewing_geometry.coords_to_dva(ga['x'], ga['y'], exact=True)
+    raw = ga[['x_raw', 'y_raw']]
+
+    ga.to_dva(exact=True)
+
+    assert numpy.allclose(ga[['x', 'y']], numpy.column_stack(expected))
+    assert numpy.allclose(ga[['x_raw', 'y_raw']], raw)
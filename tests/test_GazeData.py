@@ -171,6 +171,34 @@ def test_reset_time(gd_all):
     assert gd_all['time'].iloc[-1] == t_end - t_0
 
 
+# %% Derived columns
+
+@pytest.mark.parametrize('change', methods + [GazeData.reset_time],
+                         ids=['center', 'rotate', 'reset_time'])
+def test_derived_columns_dropped(gd, change):
+
+    gd.get_accelerations()
+    change(gd)
+
+    assert 'velocity' not in gd
+    assert 'acceleration' not in gd
+
+    gd.get_accelerations()
+    expected = GazeData(gd[['time', 'x', 'y']], **constants.ATTRIBUTES)
+    expected.get_accelerations()
+
+    assert numpy.allclose(gd['acceleration'], expected['acceleration'], equal_nan=True)
+
+
+def test_derived_columns_dropped_in_turn(gd):
+
+    gd.get_accelerations()
+    del gd['velocity']
+    gd.center(constants.ORIGIN)
+
+    assert 'acceleration' not in gd
+
+
 # %% detect_saccades()
 
 # Here we test the general aspects of detect_saccades().
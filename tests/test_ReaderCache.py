@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import shutil
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import GazeData
+from saccades.readers import BaseReader
+from saccades.readers.boundaries import BlockBoundary
+from saccades.readers.cache import META_FILE
+from saccades.readers.cache import ReaderCache
+
+
+# %% Setup
+
+@pytest.fixture
+def cache(tmp_path):
+
+    return ReaderCache(str(tmp_path / 'cache'))
+
+
+# A copy of a data file that can be safely modified.
+@pytest.fixture
+def filepath(tmp_path):
+
+    file = constants.DATA_FILES[-1]
+    filepath = str(tmp_path / file['filename'])
+    shutil.copy(file['file'], filepath)
+
+    return filepath
+
+
+# %% get_blocks()
+
+@pytest.mark.parametrize('file', constants.DATA_FILES, ids=constants.DATA_FILE_IDS)
+def test_get_blocks(file, cache):
+
+    kwargs = constants.get_basereader_args(file)
+    blocks = list(BaseReader(**kwargs).get_blocks())
+
+    # Once to fill the cache, and once to read from it.
+    for i in range(2):
+
+        r = BaseReader(cache=cache, lazy_header=True, **kwargs)
+        cached_blocks = list(r.get_blocks())
+
+        assert r.header == file['header']
+        assert len(cached_blocks) == len(blocks)
+
+        for b, cached_b in zip(blocks, cached_blocks):
+            assert isinstance(cached_b, GazeData)
+            assert cached_b.messages == b.messages
+            assert numpy.allclose(cached_b, b, equal_nan=True)
+
+
+def test_get_blocks_annotations(cache):
+
+    filepath = os.path.join(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+    boundary = BlockBoundary(end=r'^END\b')
+    blocks = list(BaseReader(filepath, boundary=boundary, save_index=False).get_blocks())
+
+    for i in range(2):
+
+        r = BaseReader(filepath, boundary=boundary, save_index=False, cache=cache)
+        cached_blocks = list(r.get_blocks())
+
+        assert [b.annotations for b in cached_blocks] == [b.annotations for b in blocks]
+
+
+# Each column should be stored in a file of its own.
+def test_columns_stored_separately(cache, filepath):
+
+    cols = ['time', 'x', 'y']
+    r = BaseReader(filepath, cache=cache)
+    list(r.get_blocks(cols=cols))
+
+    entry = os.path.join(cache.directory, cache.key(r, cols))
+    with open(os.path.join(entry, META_FILE), encoding='utf-8') as f:
+        meta = json.load(f)
+
+    assert meta['cols'] == cols
+    assert sorted(os.listdir(entry)) == sorted(meta['files'] + [META_FILE])
+
+    for filename in meta['files']:
+        values = numpy.load(os.path.join(entry, filename))
+        assert values.shape == (meta['n_rows'],)
+
+
+def test_cached_blocks_are_modifiable(cache):
+
+    r = BaseReader(constants.DATA_FILES[-1]['file'], cache=cache)
+    list(r.get_blocks())
+
+    original = next(r.get_blocks()).copy()
+
+    gd = next(r.get_blocks())
+    gd.center([1., 1.])
+
+    assert not numpy.allclose(gd['x'], original['x'], equal_nan=True)
+    numpy.testing.assert_array_equal(gd['x'], original['x'] - 1.)
+
+    # The copy-on-write memory map must not write changes back to the cache.
+    fresh = next(r.get_blocks())
+    numpy.testing.assert_array_equal(fresh['x'], original['x'])
+    numpy.testing.assert_array_equal(fresh['y'], original['y'])
+
+
+def test_key(cache, filepath):
+
+    r = BaseReader(filepath)
+    key = cache.key(r, ['time', 'x', 'y'])
+
+    assert cache.key(BaseReader(filepath), ['time', 'x', 'y']) == key
+    assert cache.key(BaseReader(filepath, sep=','), ['time', 'x', 'y']) != key
+
+    with open(filepath, mode='a', encoding='utf-8') as f:
+        f.write('foo\n')
+
+    assert cache.key(BaseReader(filepath), ['time', 'x', 'y']) != key
+
+
+# %% Eviction
+
+def test_max_size(tmp_path):
+
+    cache = ReaderCache(str(tmp_path / 'cache'), max_size=1)
+
+    for file in constants.DATA_FILES[1:]:
+        kwargs = constants.get_basereader_args(file)
+        list(BaseReader(cache=cache, **kwargs).get_blocks())
+
+    # Only the most recent entry is kept.
+    assert len(os.listdir(cache.directory)) == 1
+
+
+def test_clear(cache, filepath):
+
+    list(BaseReader(filepath, cache=cache).get_blocks())
+
+    assert cache.size() > 0
+
+    cache.clear()
+
+    assert cache.size() == 0
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pandas
+
+from . import constants
+
+from saccades.readers.buffers import RowBuffer
+
+
+# %% Setup
+
+cols = ['time', 'x', 'y']
+
+
+def fill(buffer):
+
+    for row in constants.ARRAY:
+        buffer.append(row)
+
+
+# %% __init__()
+
+def test_init():
+
+    buffer = RowBuffer(cols)
+
+    assert len(buffer) == 0
+    assert buffer.to_array().shape == (0, len(cols))
+
+
+# %% append()
+
+def test_append():
+
+    buffer = RowBuffer(cols)
+    fill(buffer)
+
+    assert len(buffer) == len(constants.ARRAY)
+    assert numpy.array_equal(buffer.to_array(), constants.ARRAY)
+
+
+# %% extend()
+
+def test_extend():
+
+    buffer = RowBuffer(cols)
+    fill(buffer)
+
+    other = RowBuffer(cols)
+    fill(other)
+
+    buffer.extend(other)
+    buffer.extend(constants.ARRAY)
+
+    expected = numpy.concatenate([constants.ARRAY] * 3)
+
+    assert numpy.array_equal(buffer.to_array(), expected)
+
+
+# %% to_columns()
+
+def test_to_columns():
+
+    buffer = RowBuffer(cols)
+    fill(buffer)
+
+    columns = buffer.to_columns()
+
+    assert len(columns) == len(cols)
+    for i, values in enumerate(columns):
+        assert numpy.array_equal(values, constants.ARRAY[:, i])
+
+
+# %% to_frame()
+
+def test_to_frame():
+
+    buffer = RowBuffer(cols)
+    fill(buffer)
+
+    df = buffer.to_frame()
+
+    assert isinstance(df, pandas.DataFrame)
+    assert list(df.columns) == cols
+    assert numpy.array_equal(df, constants.ARRAY)
+
+
+# The table should be a view of the buffer, not a copy.
+def test_to_frame_is_view():
+
+    buffer = RowBuffer(cols)
+    fill(buffer)
+
+    df = buffer.to_frame()
+    buffer.to_array()[0, 0] = 9000.
+
+    assert df['time'].iloc[0] == 9000.
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import GazeArray
+from saccades import GazeData
+from saccades import Saccade
+from saccades import SaccadeArray
+from saccades import SaccadeView
+
+
+# %% Setup
+
+CLASSES = [(GazeData, Saccade), (GazeArray, SaccadeArray)]
+CLASS_IDS = ['GazeData', 'GazeArray']
+
+
+@pytest.fixture(params=CLASSES, ids=CLASS_IDS)
+def classes(request):
+
+    return request.param
+
+
+@pytest.fixture
+def parent(classes):
+
+    gaze_class, saccade_class = classes
+
+    gd = gaze_class(constants.SACCADE, **constants.ATTRIBUTES)
+
+    # Add a dummy 'saccade' column with 2 saccades.
+    saccade = numpy.array([True, True, False, True])
+    gd['saccade'] = saccade
+
+    return gd
+
+
+@pytest.fixture
+def view(parent):
+
+    return parent.detect_saccades(views=True)[0]
+
+
+# %% detect_saccades()
+
+def test_detect_saccades_views(parent, classes):
+
+    views = parent.detect_saccades(views=True)
+    copies = parent.detect_saccades()
+
+    assert len(views) == len(copies) == 2
+
+    for view, copy in zip(views, copies):
+        assert isinstance(view, SaccadeView)
+        assert view.parent is parent
+        assert view.saccade_class is classes[1]
+        assert not view.is_materialized
+        assert len(view) == len(copy)
+        assert numpy.array_equal(view, copy)
+
+
+def test_detect_saccades_views_first_n(parent):
+
+    assert len(parent.detect_saccades(n=1, views=True)) == 1
+
+
+# %% Reading
+
+def test_columns_are_views(view, parent):
+
+    assert numpy.array_equal(view['x'], [1., 5.])
+    assert numpy.shares_memory(view['x'], numpy.asarray(parent['x']))
+
+
+@pytest.mark.parametrize('attr, val', constants.ATTRIBUTES.items())
+def test_has_attributes(view, attr, val):
+
+    assert getattr(view, attr) == val
+
+
+@pytest.mark.parametrize('metric', ['latency', 'duration', 'amplitude'])
+def test_metrics(view, classes, metric):
+
+    saccade = classes[1](numpy.asarray(constants.SACCADE)[:2], **constants.ATTRIBUTES)
+
+    assert getattr(view, metric)() == getattr(saccade, metric)()
+
+
+def test_nonexistent_method(view):
+
+    with pytest.raises(AttributeError):
+        view.nonexistent_method()
+
+    with pytest.raises(AttributeError):
+        view.x
+
+
+# %% Materializing
+
+def test_materialize(view, classes):
+
+    saccade = view.materialize()
+
+    assert isinstance(saccade, classes[1])
+    assert view.is_materialized
+    assert view.materialize() is saccade
+
+
+def test_set_value_materializes(view, parent):
+
+    view['x'] = 0.
+
+    assert view.is_materialized
+    assert numpy.array_equal(view['x'], [0., 0.])
+    assert numpy.array_equal(numpy.asarray(parent['x'])[:2], [1., 5.])
+
+
+def test_set_attribute_materializes(view, parent):
+
+    view.space_units = 'dva'
+
+    assert view.is_materialized
+    assert view.amplitude() == 5.
+    assert parent.space_units == constants.ATTRIBUTES['space_units']
+
+
+def test_set_other_attribute_exception(view):
+
+    with pytest.raises(AttributeError):
+        view.start = 1
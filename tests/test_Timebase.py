@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pytest
+
+from saccades.timebase import Timebase
+
+
+# %% Setup
+
+# Times at 4 ms intervals, with gaps before the 4th and 7th samples.
+TIMES = numpy.array([10., 14., 18., 30., 34., 38., 50., 54.])
+
+GAP_POSITIONS = [3, 6]
+GAP_DURATIONS = [8., 8.]
+
+
+# %% __init__()
+
+def test_init_exception():
+
+    with pytest.raises(ValueError, match='positive'):
+        Timebase(0., 0.)
+
+    with pytest.raises(ValueError):
+        Timebase(0., 1., [1, 2], [1.])
+
+
+# %% from_times()
+
+def test_from_times():
+
+    timebase = Timebase.from_times(TIMES, max_gap_fraction=0.5)
+
+    assert timebase == Timebase(10., 4., GAP_POSITIONS, GAP_DURATIONS)
+    assert not timebase.is_uniform
+    assert numpy.array_equal(timebase.times(len(TIMES)), TIMES)
+
+
+def test_from_times_uniform():
+
+    times = numpy.arange(100, 200, 2)
+
+    timebase = Timebase.from_times(times)
+
+    assert timebase.is_uniform
+    assert timebase.interval == 2
+    assert numpy.array_equal(timebase.times(len(times)), times)
+
+
+def test_from_times_interval():
+
+    timebase = Timebase.from_times(TIMES, max_gap_fraction=0.5)
+
+    assert Timebase.from_times(TIMES, interval=4., max_gap_fraction=0.5) == timebase
+    assert Timebase.from_times(TIMES, interval=6., max_gap_fraction=0.5) is None
+    assert Timebase.from_times(TIMES[:1], interval=4.) == Timebase(10., 4.)
+
+
+def test_from_times_too_many_gaps():
+
+    assert Timebase.from_times(TIMES) is None
+
+
+@pytest.mark.parametrize('times', [[], [10.], [0., 1., 3., 4., 6., 7.], [0., 2., 1.]],
+                         ids=['empty', 'single', 'irregular', 'decreasing'])
+def test_from_times_not_regular(times):
+
+    assert Timebase.from_times(times) is None
+
+
+# %% Methods
+
+def test_subset():
+
+    timebase = Timebase.from_times(TIMES, max_gap_fraction=0.5)
+
+    for start, stop in [(0, 8), (2, 5), (3, 7), (6, 8), (4, 4)]:
+        subset = timebase.subset(start, stop)
+        assert numpy.array_equal(subset.times(stop - start), TIMES[start:stop])
+
+
+def test_starting_at():
+
+    timebase = Timebase.from_times(TIMES, max_gap_fraction=0.5).starting_at(0.)
+
+    assert numpy.array_equal(timebase.times(len(TIMES)), TIMES - TIMES[0])
+
+
+def test_correct_at_gaps():
+
+    timebase = Timebase.from_times(TIMES, max_gap_fraction=0.5)
+    rates = numpy.full(len(TIMES), 12.)
+
+    timebase.correct_at_gaps(rates)
+
+    assert numpy.array_equal(rates, 12. * 4. / numpy.diff(TIMES, prepend=6.))
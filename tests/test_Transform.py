@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import conversions
+from saccades import geometry
+from saccades.transforms import Transform
+
+
+# %% Setup
+
+COORDS = numpy.array(constants.SACCADE)[:, 1:]
+
+VIEWING_DIST_PX = 1000.
+
+
+# %% __init__()
+
+def test_init_fuses_affine_steps():
+
+    transform = Transform.translation([1., 2.]).then(Transform.rotation(constants.ANGLE))
+
+    assert len(transform.steps) == 1
+
+    transform = transform.then(Transform.px_to_dva(VIEWING_DIST_PX))
+    transform = transform.then(Transform.translation([1., 2.]))
+
+    assert [kind for kind, value in transform.steps] == ['affine', 'px_to_dva', 'affine']
+
+
+def test_init_exception():
+
+    with pytest.raises(ValueError):
+        Transform([('affine', numpy.identity(2))])
+
+
+def test_identity():
+
+    assert Transform().is_identity
+    assert Transform.translation([1., 2.]).then(Transform.translation([-1., -2.])).is_identity
+    assert not Transform.rotation(constants.ANGLE).is_identity
+
+
+# %% apply()
+
+def test_apply_matches_geometry():
+
+    transform = Transform.translation(-numpy.array(constants.ORIGIN))
+    transform = transform.then(Transform.rotation(constants.ANGLE, origin=[1., 1.]))
+
+    expected = geometry.rotate(geometry.center(COORDS, constants.ORIGIN),
+                               constants.ANGLE, origin=[1., 1.])
+
+    assert numpy.allclose(numpy.column_stack(transform.apply(*COORDS.T)), expected)
+
+
+def test_apply_px_to_dva():
+
+    transform = Transform.px_to_dva(VIEWING_DIST_PX)
+
+    x, y = transform.apply(*COORDS.T)
+
+    assert numpy.allclose(x, numpy.degrees(numpy.arctan(COORDS[:, 0] / VIEWING_DIST_PX)))
+    assert numpy.allclose(y, numpy.degrees(numpy.arctan(COORDS[:, 1] / VIEWING_DIST_PX)))
+
+
+def test_apply_matches_conversions():
+
+    kwargs = {'screen_res': constants.SCREEN_RES,
+              'screen_diag': constants.SCREEN_DIAG,
+              'viewing_dist': constants.VIEWING_DIST}
+    viewing_dist_px = conversions._viewing_dist_to_px(kwargs['viewing_dist'],
+                                                      kwargs['screen_res'],
+                                                      kwargs['screen_diag'])
+
+    x, y = Transform.px_to_dva(viewing_dist_px).apply(*COORDS.T)
+
+    assert numpy.allclose(numpy.column_stack([x, y]), conversions.px_to_dva(COORDS, **kwargs))
+
+
+@pytest.mark.parametrize('transform', [Transform(),
+                                       Transform.translation([1., 2.]),
+                                       Transform.px_to_dva(VIEWING_DIST_PX)],
+                         ids=['identity', 'affine', 'px_to_dva'])
+def test_apply_does_not_modify_inputs(transform):
+
+    x, y = COORDS.T.copy()
+
+    new_x, new_y = transform.apply(x, y)
+
+    assert numpy.array_equal(numpy.column_stack([x, y]), COORDS)
+    assert new_x is not x
+    assert new_y is not y
+
+
+def test_apply_exact_keeps_float32():
+
+    x, y = COORDS.T.astype(numpy.float32)
+
+    new_x, new_y = Transform.px_to_dva(VIEWING_DIST_PX, exact=True).apply(x, y)
+
+    assert new_x.dtype == new_y.dtype == numpy.float32
+
+
+# %% inverse()
+
+def test_inverse():
+
+    transform = Transform.translation([1., 2.])
+    transform = transform.then(Transform.px_to_dva(VIEWING_DIST_PX))
+    transform = transform.then(Transform.rotation(constants.ANGLE))
+    transform = transform.then(Transform.px_to_dva(VIEWING_DIST_PX, exact=True))
+
+    x, y = transform.then(transform.inverse()).apply(*COORDS.T)
+
+    assert numpy.allclose(numpy.column_stack([x, y]), COORDS)
+    assert transform.inverse().inverse() == transform
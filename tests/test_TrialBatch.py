@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import GazeArray
+from saccades import GazeData
+from saccades import SaccadeArray
+from saccades import SaccadeView
+from saccades import TrialBatch
+from saccades import ViewingGeometry
+from saccades import detection
+from saccades.readers import EyelinkReader
+
+
+# %% Setup
+
+# Trials of different lengths, including an empty one,
+# with a saccade at the end of one trial and the start of the next.
+TRIAL_ARRAYS = [numpy.array(constants.SACCADE),
+                numpy.array(constants.SEQUENCE) + 100.,
+                numpy.empty((0, 3)),
+                numpy.array(constants.SACCADE)[::-1] * 2.]
+
+ORIGINS = [[1., 2.], [0., 0.], [5., 5.], [-1., 3.]]
+
+
+def make_trials(cls=GazeArray):
+
+    trials = [cls(a, **constants.ATTRIBUTES) for a in TRIAL_ARRAYS]
+    trials[1].target = 'second target'
+
+    return trials
+
+
+@pytest.fixture
+def batch():
+
+    return TrialBatch(make_trials())
+
+
+def assert_matches_trials(batch, trials, cols):
+
+    for trial, expected in zip(batch.iter_trials(), trials):
+        assert numpy.allclose(trial[cols], expected[cols], equal_nan=True)
+
+
+# %% __init__()
+
+@pytest.mark.parametrize('cls', [GazeData, GazeArray])
+def test_init(cls):
+
+    trials = make_trials(cls)
+    batch = TrialBatch(trials)
+
+    assert batch.n_trials == len(trials)
+    assert len(batch) == sum(len(a) for a in TRIAL_ARRAYS)
+    assert list(batch.offsets) == [0, 4, 7, 7, 11]
+    assert list(batch.lengths) == [len(a) for a in TRIAL_ARRAYS]
+    assert batch.columns == ['time', 'x', 'y']
+    assert list(batch.trials['target']) == [constants.TARGET, 'second target',
+                                            constants.TARGET, constants.TARGET]
+
+    for col in batch.columns:
+        assert batch[col].flags.c_contiguous
+
+    assert_matches_trials(batch, trials, ['time', 'x', 'y'])
+
+
+def test_init_common_columns():
+
+    trials = make_trials()
+    trials[0]['foo'] = 1.
+    trials[1]['foo'] = 2.
+
+    assert TrialBatch(trials).columns == ['time', 'x', 'y']
+    assert TrialBatch(trials[:2]).columns == ['time', 'x', 'y', 'foo']
+
+
+def test_init_empty():
+
+    batch = TrialBatch()
+
+    assert batch.n_trials == 0
+    assert len(batch) == 0
+    assert batch.columns == ['time', 'x', 'y']
+
+
+def test_init_from_reader():
+
+    filepath = os.path.join(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+    blocks = list(EyelinkReader(filepath, save_index=False).get_blocks())
+
+    batch = TrialBatch(blocks)
+
+    assert batch.n_trials == constants.EYELINK_COUNTS['START']
+    assert len(batch) == constants.EYELINK_COUNTS['samples']
+    assert list(batch.trials['messages']) == [b.messages for b in blocks]
+
+
+# %% Trials
+
+def test_trial_is_view(batch):
+
+    trial = batch.trial(1)
+
+    assert isinstance(trial, GazeArray)
+    assert trial.target == 'second target'
+    assert trial.viewing_parameters['screen_res'] == constants.SCREEN_RES
+
+    trial['x'][0] = 9000.
+
+    assert batch['x'][batch.offsets[1]] == 9000.
+
+
+def test_trial_numbers(batch):
+
+    assert list(batch.trial_numbers) == [0] * 4 + [1] * 3 + [3] * 4
+
+
+def test_viewing_geometries(batch):
+
+    geometries = batch.viewing_geometries()
+
+    assert len(geometries) == batch.n_trials
+    assert geometries[0] == ViewingGeometry(**constants.SCREEN_ATTRIBUTES)
+    assert all(geometry is geometries[0] for geometry in geometries)
+
+
+def test_per_sample(batch):
+
+    assert batch.per_sample([1., 2., 3., 4.]).shape == (len(batch),)
+    assert batch.per_sample(1.).shape == (len(batch),)
+    assert batch.per_sample([1., 2.], ndim=1).shape == (len(batch), 2)
+
+
+# %% Methods
+
+def test_get_velocities(batch):
+
+    trials = make_trials()
+    for trial in trials:
+        trial.get_velocities()
+
+    batch.get_velocities()
+
+    assert numpy.isnan(batch['velocity'][batch.offsets[[0, 1, 3]]]).all()
+    assert_matches_trials(batch, trials, ['velocity'])
+
+
+def test_get_velocities_mixed_units():
+
+    trials = make_trials()
+    trials[1].space_units = 'dva'
+    trials[3].screen_res = None
+    trials[3].space_units = 'dva'
+    batch = TrialBatch(trials)
+
+    for trial in trials:
+        trial.get_velocities()
+    batch.get_velocities()
+
+    assert_matches_trials(batch, trials, ['velocity'])
+
+
+def test_get_velocities_exception(batch):
+
+    batch.trials.at[3, 'viewing_dist'] = None
+
+    with pytest.raises(AttributeError, match='viewing_dist'):
+        batch.get_velocities()
+
+
+def test_get_accelerations(batch):
+
+    trials = make_trials()
+    for trial in trials:
+        trial.get_accelerations()
+
+    batch.get_accelerations()
+
+    assert_matches_trials(batch, trials, ['velocity', 'acceleration'])
+    assert batch.workspace.nbytes > 0
+
+
+def test_transforms(batch):
+
+    trials = make_trials()
+    for trial, origin in zip(trials, ORIGINS):
+        trial.center(origin)
+        trial.rotate(constants.ANGLE, origin=origin)
+
+    batch.center(ORIGINS)
+    batch.rotate(constants.ANGLE, origin=ORIGINS)
+
+    assert_matches_trials(batch, trials, ['x', 'y', 'x_raw', 'y_raw'])
+
+
+def test_reset_time(batch):
+
+    batch.reset_time()
+
+    for trial in batch.iter_trials():
+        if len(trial):
+            assert trial['time'][0] == 0.
+
+
+# %% detect_saccades()
+
+@pytest.mark.parametrize('views', [False, True])
+def test_detect_saccades(batch, views):
+
+    trials = make_trials()
+    expected = [trial.detect_saccades(detection.criterion, velocity=constants.VELOCITY_LOW)
+                for trial in trials]
+
+    result = batch.detect_saccades(detection.criterion, views=views,
+                                   velocity=constants.VELOCITY_LOW)
+
+    assert len(result) == batch.n_trials
+
+    for saccades, expected_saccades in zip(result, expected):
+        assert len(saccades) == len(expected_saccades)
+        for sacc, expected_sacc in zip(saccades, expected_saccades):
+            assert isinstance(sacc, SaccadeView if views else SaccadeArray)
+            assert sacc.latency() == expected_sacc.latency()
+            assert sacc.duration() == expected_sacc.duration()
+
+
+def test_detect_saccades_across_trials(batch):
+
+    # One run of saccade samples across the boundary of trials 0 and 1.
+    saccade = numpy.zeros(len(batch), dtype=bool)
+    saccade[2:6] = True
+    batch['saccade'] = saccade
+
+    result = batch.detect_saccades()
+
+    assert [len(saccades) for saccades in result] == [1, 1, 0, 0]
+    assert len(result[0][0]) == 2
+    assert len(result[1][0]) == 2
+
+
+def test_detect_saccades_first_n(batch):
+
+    batch['saccade'] = batch['time'] % 4 == 0
+
+    result = batch.detect_saccades(n=1)
+
+    assert all(len(saccades) <= 1 for saccades in result)
+
+
+def test_detect_saccades_exception(batch):
+
+    with pytest.raises(KeyError):
+        batch.detect_saccades()
+
+
+# %% Derived columns
+
+def test_derived_columns_invalidated(batch):
+
+    batch.get_accelerations()
+    batch.center(ORIGINS)
+
+    assert 'velocity' not in batch
+    assert 'acceleration' not in batch
+
+    batch.trials['space_units'] = 'dva'
+    batch.invalidate('space_units')
+    batch.get_velocities()
+
+    trials = make_trials()
+    for trial in trials:
+        trial.space_units = 'dva'
+        trial.get_velocities()
+
+    assert_matches_trials(batch, trials, ['velocity'])
+
+
+def test_trial_keeps_derived_columns(batch):
+
+    batch.get_velocities()
+    trial = batch.trial(0)
+    trial.center([1., 1.])
+
+    assert 'velocity' not in trial
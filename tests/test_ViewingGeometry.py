@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import ViewingGeometry
+from saccades import conversions
+
+
+# %% Setup
+
+@pytest.fixture
+def vg():
+
+    return ViewingGeometry(constants.SCREEN_RES, constants.SCREEN_DIAG, constants.VIEWING_DIST)
+
+
+# %% __init__()
+
+def test_init(vg):
+
+    assert vg.screen_res == tuple(constants.SCREEN_RES)
+    assert vg.viewing_dist_px == constants.VIEWING_DIST_PX
+
+
+@pytest.mark.parametrize('args', [([4.], 10., 5.), ([4., 3.], 0., 5.), ([4., 3.], 10., -5.)],
+                         ids=['screen_res', 'screen_diag', 'viewing_dist'])
+def test_init_exception(args):
+
+    with pytest.raises(ValueError):
+        ViewingGeometry(*args)
+
+
+def test_immutable(vg):
+
+    with pytest.raises(AttributeError):
+        vg.viewing_dist = 1.
+
+
+def test_hashable(vg):
+
+    same = ViewingGeometry(tuple(constants.SCREEN_RES), constants.SCREEN_DIAG,
+                           constants.VIEWING_DIST)
+    other = ViewingGeometry(constants.SCREEN_RES, constants.SCREEN_DIAG, 1.)
+
+    assert vg == same
+    assert vg != other
+    assert len({vg, same, other}) == 2
+
+
+def test_shared(vg):
+
+    shared = ViewingGeometry.shared(constants.SCREEN_RES, constants.SCREEN_DIAG,
+                                    constants.VIEWING_DIST)
+
+    assert shared == vg
+    assert ViewingGeometry.shared(constants.SCREEN_RES, constants.SCREEN_DIAG,
+                                  constants.VIEWING_DIST) is shared
+
+
+# %% Conversions
+
+def test_px_to_dva(vg):
+
+    assert numpy.allclose(vg.px_to_dva(constants.PX), constants.DVA)
+    assert numpy.allclose(vg.dva_to_px(constants.DVA), constants.PX)
+
+
+def test_coords_to_dva(vg):
+
+    x, y = numpy.array(constants.ARRAY_XY).T
+
+    x_dva, y_dva = vg.coords_to_dva(x, y)
+
+    assert numpy.allclose(x_dva, conversions.px_to_dva(x, **constants.SCREEN_ATTRIBUTES))
+    assert numpy.allclose(y_dva, conversions.px_to_dva(y, **constants.SCREEN_ATTRIBUTES))
+
+
+def test_coords_to_dva_exact(vg):
+
+    x = numpy.array([0., 2.5, 0., 2.5, -1.])
+    y = numpy.array([0., 0., -2.5, 2.5, numpy.nan])
+
+    x_dva, y_dva = vg.coords_to_dva(x, y, exact=True)
+    eccentricity = vg.px_to_dva(numpy.hypot(x, y))
+
+    assert numpy.allclose(numpy.hypot(x_dva, y_dva), eccentricity, equal_nan=True)
+    assert numpy.allclose(numpy.arctan2(y_dva, x_dva)[:4], numpy.arctan2(y, x)[:4])
+    assert numpy.allclose([x_dva[1], y_dva[2]], vg.px_to_dva([2.5, -2.5]))
+
+    # A sample missing either coordinate has no eccentricity.
+    assert numpy.isnan(x_dva[4])
+
+    x_px, y_px = vg.coords_to_px(x_dva, y_dva, exact=True)
+
+    assert numpy.allclose(x_px[:4], x[:4])
+    assert numpy.allclose(y_px[:4], y[:4])
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import numpy
+
+from saccades.workspace import Workspace
+
+
+# %% get()
+
+def test_get():
+
+    workspace = Workspace()
+
+    array = workspace.get('a', (3, 2))
+
+    assert array.shape == (3, 2)
+    assert array.dtype == float
+    assert workspace.nbytes == array.nbytes
+
+
+def test_get_reuses_buffers():
+
+    workspace = Workspace()
+
+    large = workspace.get('a', 10)
+    small = workspace.get('a', 4)
+
+    assert numpy.shares_memory(large, small)
+    assert workspace.nbytes == large.nbytes
+
+    larger = workspace.get('a', 20)
+
+    assert not numpy.shares_memory(large, larger)
+    assert workspace.nbytes == larger.nbytes
+
+
+def test_get_separate_buffers():
+
+    workspace = Workspace()
+
+    a = workspace.get('a', 10)
+    b = workspace.get('b', 10)
+    c = workspace.get('a', 10, dtype=numpy.int64)
+
+    assert c.dtype == numpy.int64
+    assert not numpy.shares_memory(a, b)
+    assert not numpy.shares_memory(a, c)
+
+
+# %% clear()
+
+def test_clear():
+
+    workspace = Workspace()
+    workspace.get('a', 10)
+
+    workspace.clear()
+
+    assert workspace.nbytes == 0
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent import futures
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades import GazeData
+from saccades.readers import BaseReader
+from saccades.readers import EyelinkReader
+from saccades.readers.asynchronous import load_many
+
+
+# %% Setup
+
+PATHS = [f['file'] for f in constants.DATA_FILES]
+
+
+def run(coroutine):
+
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+async def collect(async_iterator):
+
+    return [x async for x in async_iterator]
+
+
+# %% load_many()
+
+@pytest.mark.parametrize('concurrency', [1, 3, 100])
+def test_load_many(concurrency):
+
+    results = run(collect(load_many(PATHS, concurrency=concurrency,
+                                    save_index=False, typed=True)))
+
+    assert sorted(path for path, blocks in results) == sorted(PATHS)
+
+    for path, blocks in results:
+        expected = list(BaseReader(path, save_index=False).get_blocks())
+        assert len(blocks) == len(expected)
+        assert all(isinstance(b, GazeData) for b in blocks)
+        for b, expected_b in zip(blocks, expected):
+            assert numpy.allclose(b, expected_b, equal_nan=True)
+
+
+def test_load_many_process_pool():
+
+    path = '{}/{}'.format(constants.DATA_PATH, constants.DATA_FILE_EYELINK)
+
+    with futures.ProcessPoolExecutor(2) as executor:
+        results = run(collect(load_many([path, path], reader_class=EyelinkReader,
+                                        executor=executor, save_index=False)))
+
+    assert len(results) == 2
+    assert all(len(blocks) == constants.EYELINK_COUNTS['START'] for path, blocks in results)
+
+
+def test_load_many_exception():
+
+    with pytest.raises(FileNotFoundError):
+        run(collect(load_many(PATHS + ['not_a_file.txt'], save_index=False)))
+
+
+def test_load_many_stop_early():
+
+    async def first():
+        async for path, blocks in load_many(PATHS, concurrency=2, save_index=False):
+            return path
+
+    assert run(first()) in PATHS
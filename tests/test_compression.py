@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import zipfile
+
+import numpy
+import pytest
+
+from . import constants
+
+from saccades.readers import BaseReader
+from saccades.readers.compression import is_compressed
+from saccades.readers.compression import open_text
+from saccades.readers.index import INDEX_SUFFIX
+
+
+# %% Setup
+
+FILE = constants.DATA_FILES[-1]
+
+COMPRESSORS = {'.gz': gzip.open,
+               '.bz2': bz2.open,
+               '.xz': lzma.open}
+
+
+def compress(tmp_path, suffix):
+
+    filepath = str(tmp_path / (FILE['filename'] + suffix))
+
+    with open(FILE['file'], mode='rb') as f_in:
+        with COMPRESSORS[suffix](filepath, mode='wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+    return filepath
+
+
+def archive(tmp_path, members):
+
+    filepath = str(tmp_path / 'archive.zip')
+
+    with zipfile.ZipFile(filepath, mode='w', compression=zipfile.ZIP_DEFLATED) as f:
+        for member in members:
+            f.write(FILE['file'], arcname=member)
+
+    return filepath
+
+
+def assert_same_blocks(r):
+
+    kwargs = constants.get_basereader_args(FILE)
+    blocks = list(BaseReader(save_index=False, **kwargs).get_blocks())
+    compressed_blocks = list(r.get_blocks())
+
+    assert r.header == FILE['header']
+    assert len(compressed_blocks) == len(blocks)
+
+    for b, compressed_b in zip(blocks, compressed_blocks):
+        assert compressed_b.messages == b.messages
+        assert numpy.allclose(compressed_b.to_numpy(dtype=float),
+                              b.to_numpy(dtype=float), equal_nan=True)
+
+
+# %% is_compressed()
+
+@pytest.mark.parametrize('filename, expected', [('data.txt', False),
+                                                ('data.txt.gz', True),
+                                                ('data.txt.BZ2', True),
+                                                ('data.txt.xz', True),
+                                                ('data.zip', True)])
+def test_is_compressed(filename, expected):
+
+    assert is_compressed(filename) == expected
+
+
+# %% open_text()
+
+@pytest.mark.parametrize('suffix', COMPRESSORS)
+def test_open_text(tmp_path, suffix):
+
+    filepath = compress(tmp_path, suffix)
+
+    with open(FILE['file'], encoding='utf-8') as f:
+        expected = f.read()
+
+    with open_text(filepath, 'utf-8') as f:
+        assert f.read() == expected
+        assert f.buffer.seekable()
+
+
+def test_open_text_member_exception(tmp_path):
+
+    with pytest.raises(ValueError):
+        open_text(archive(tmp_path, ['a.txt', 'b.txt']), 'utf-8')
+
+    with pytest.raises(ValueError):
+        open_text(FILE['file'], 'utf-8', member='a.txt')
+
+
+# %% Reading with BaseReader
+
+@pytest.mark.parametrize('suffix', COMPRESSORS)
+def test_get_blocks_compressed(tmp_path, suffix):
+
+    r = BaseReader(compress(tmp_path, suffix), save_index=False, typed=True)
+
+    assert_same_blocks(r)
+    assert r.file.closed
+
+
+@pytest.mark.parametrize('member', [None, 'b.txt'])
+def test_get_blocks_zip(tmp_path, member):
+
+    members = ['a.txt'] if member is None else ['a.txt', member]
+
+    r = BaseReader(archive(tmp_path, members), member=member, save_index=False, typed=True)
+
+    assert_same_blocks(r)
+
+
+def test_get_block_compressed(tmp_path):
+
+    filepath = archive(tmp_path, ['a.txt', 'b.txt'])
+
+    r = BaseReader(filepath, member='b.txt')
+    blocks = list(r.get_blocks())
+
+    assert len(r) == len(blocks)
+    assert os.path.isfile(filepath + '.b.txt' + INDEX_SUFFIX)
+    assert numpy.allclose(r.get_block(-1).to_numpy(dtype=float),
+                          blocks[-1].to_numpy(dtype=float), equal_nan=True)
+
+
+def test_get_blocks_parallel_compressed(tmp_path):
+
+    r = BaseReader(compress(tmp_path, '.gz'), save_index=False, typed=True)
+
+    assert len(list(r.get_blocks(workers=2))) == len(list(r.get_blocks()))
+
+
+def test_mmap_compressed_exception(tmp_path):
+
+    with pytest.raises(ValueError):
+        BaseReader(compress(tmp_path, '.gz'), backend='mmap')
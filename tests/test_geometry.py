@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import numpy
+import pytest
 
 from . import constants
 
 from saccades import geometry
+from saccades.workspace import Workspace
 
 
 # Use numpy.allclose() in place of numpy.array_equal()
@@ -77,6 +79,25 @@ def test_velocity():
     assert numpy.allclose(velocity, constants.VELOCITY, equal_nan=True)
 
 
+def test_column_velocity():
+
+    time, x, y = numpy.array(constants.ARRAY).T
+    velocity = geometry.column_velocity(time.astype(int), x.astype(numpy.float32), y)
+
+    assert numpy.allclose(velocity, constants.VELOCITY, equal_nan=True)
+    assert numpy.isnan(geometry.column_velocity([], [], [])).all()
+
+
+def test_column_velocity_interval():
+
+    time, x, y = numpy.array(constants.ARRAY).T
+
+    # The times are regular, with an interval of 2.
+    velocity = geometry.column_velocity(2., x, y)
+
+    assert numpy.allclose(velocity, constants.VELOCITY, equal_nan=True)
+
+
 def test_velocity_as_GazeData_method(gd):
 
     gd.get_velocities()
@@ -106,6 +127,13 @@ def test_acceleration():
     assert numpy.allclose(acceleration, constants.ACCELERATION, equal_nan=True)
 
 
+def test_acceleration_interval():
+
+    acceleration = geometry.acceleration(2., constants.VELOCITY)
+
+    assert numpy.allclose(acceleration, constants.ACCELERATION, equal_nan=True)
+
+
 def test_acceleration_as_GazeData_method(gd):
 
     gd.get_accelerations()
@@ -140,3 +168,76 @@ def test_acceleration_as_GazeData_method_with_existing_velocities(gd):
     expected = numpy.append([numpy.nan], velocities[1:])
 
     assert numpy.allclose(gd['acceleration'], expected, equal_nan=True)
+
+
+# %% out and workspace
+
+def test_center_out():
+
+    coords = numpy.array(constants.ARRAY_XY)
+
+    centered = geometry.center(coords, constants.ORIGIN, out=coords)
+
+    assert centered is coords
+    assert numpy.array_equal(coords, constants.CENTERED)
+
+
+def test_rotate_out():
+
+    out = numpy.empty_like(constants.ARRAY_XY)
+    workspace = Workspace()
+
+    rotated = geometry.rotate(constants.ARRAY_XY, constants.ANGLE, origin=constants.ORIGIN,
+                              out=out, workspace=workspace)
+
+    assert rotated is out
+    assert numpy.allclose(out, constants.CENTER_ROTATED)
+    assert workspace.nbytes > 0
+
+
+def test_velocity_out():
+
+    out = numpy.empty(len(constants.ARRAY))
+
+    velocity = geometry.velocity(constants.ARRAY, out=out, workspace=Workspace())
+
+    assert velocity is out
+    assert numpy.allclose(out, constants.VELOCITY, equal_nan=True)
+
+
+def test_acceleration_out():
+
+    out = numpy.empty(len(constants.VELOCITY))
+
+    acceleration = geometry.acceleration(constants.ARRAY[:, 0], constants.VELOCITY,
+                                         out=out, workspace=Workspace())
+
+    assert acceleration is out
+    assert numpy.allclose(out, constants.ACCELERATION, equal_nan=True)
+
+
+def test_out_exception():
+
+    with pytest.raises(ValueError):
+        geometry.velocity(constants.ARRAY, out=numpy.empty(len(constants.ARRAY) + 1))
+
+
+def test_workspace_reused():
+
+    workspace = Workspace()
+    trials = [constants.ARRAY, constants.ARRAY[:2], constants.ARRAY[1:]]
+    expected = [geometry.velocity(trial) for trial in trials]
+
+    geometry.velocity(constants.ARRAY, workspace=workspace)
+    nbytes = workspace.nbytes
+
+    # Later, smaller trials need no more scratch memory.
+    for trial, expected_velocity in zip(trials, expected):
+        out = workspace.get('velocity', len(trial))
+        geometry.acceleration(trial[:, 0],
+                              geometry.velocity(trial, out=out, workspace=workspace),
+                              workspace=workspace)
+        assert numpy.allclose(out, expected_velocity, equal_nan=True)
+
+    # The only new buffer is the one for the velocities, sized for the first trial.
+    assert workspace.nbytes == nbytes + constants.ARRAY[:, 0].nbytes
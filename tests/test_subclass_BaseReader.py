@@ -94,6 +94,14 @@ def test_row_pattern(new_r):
     assert new_r.row_pattern.fullmatch('1.0 2 3') is None
 
 
+# A custom row pattern turns off the check of the first character,
+# which only suits the default pattern.
+
+def test_build_row_start(new_r):
+
+    assert new_r.build_row_start() is None
+
+
 def test_process_header(new_r):
 
     assert new_r.header == constants.HEADER_SUBCLASS
@@ -121,3 +129,11 @@ def test_get_blocks(new_r):
     assert blocks[0].screen_res == constants.HEADER_SUBCLASS['screen_res']
     assert blocks[0].screen_diag == constants.HEADER_SUBCLASS['screen_diag']
     assert blocks[0].viewing_dist == constants.HEADER_SUBCLASS['viewing_dist']
+
+
+def test_get_blocks_parallel(new_r):
+
+    blocks = list(new_r.get_blocks(workers=2))
+
+    assert len(blocks) == 1
+    assert blocks[0].screen_res == constants.HEADER_SUBCLASS['screen_res']
@@ -27,6 +27,17 @@ def test_check_shape(input_type):
     assert numpy.array_equal(checked, constants.ARRAY)
 
 
+@pytest.mark.parametrize('copy', [True, False])
+def test_check_shape_copy(copy):
+
+    checked = tools.check_shape(constants.ARRAY, constants.SHAPE, copy=copy)
+
+    assert (checked is constants.ARRAY) is not copy
+
+    with pytest.raises(ValueError):
+        tools.check_shape(constants.ARRAY, constants.WRONG_SHAPES[0], copy=copy)
+
+
 @pytest.mark.parametrize('shape', constants.WILDCARD_SHAPES)
 def test_check_shape_with_wildcard(shape):
 